@@ -177,11 +177,11 @@ def print_language_list(file=None):
         # -- PYTHON2: Overcome implicit encode problems (encoding=ASCII).
         file = codecs.getwriter("UTF-8")(file or sys.stdout)
 
+    # -- NOTE: Uses only language names (keywords are not decoded).
     iso_codes = languages.keys()
     print("AVAILABLE LANGUAGES:")
     for iso_code in sorted(iso_codes):
-        native = languages[iso_code]["native"]
-        name = languages[iso_code]["name"]
+        name, native = languages.names[iso_code]
         print_(u"  %s: %s / %s" % (iso_code, native, name))
 
 
@@ -62,6 +62,9 @@ if _TOML_AVAILABLE:  # pragma: no cover
 # CONSTANTS:
 # -----------------------------------------------------------------------------
 DEFAULT_RUNNER_CLASS_NAME = "behave.runner:Runner"
+PARALLEL_RUNNER_CLASS_NAME = "behave.runner_parallel:ParallelRunner"
+SCENARIO_PARALLEL_RUNNER_CLASS_NAME = \
+    "behave.runner_parallel:ScenarioParallelRunner"
 
 
 # -----------------------------------------------------------------------------
@@ -111,6 +114,19 @@ def positive_number(text):
     return value
 
 
+def shard_spec(text):
+    """Converts a shard specification "I/N" into a tuple (index, count).
+    The shard index is 1-based (1 <= I <= N).
+    """
+    try:
+        index, count = [int(part) for part in text.split("/")]
+    except ValueError:
+        raise ValueError("SHARD: I/N (like: 1/4), but was: %s" % text)
+    if not 1 <= index <= count:
+        raise ValueError("SHARD: 1 <= I <= N, but was: %s" % text)
+    return (index, count)
+
+
 # -----------------------------------------------------------------------------
 # CONFIGURATION SCHEMA:
 # -----------------------------------------------------------------------------
@@ -213,9 +229,102 @@ OPTIONS = [
             type=positive_number,
             help="""Number of concurrent jobs to use (default: %(default)s).
                   Only supported by test runners that support parallel execution.
+                  Many feature files are also parsed in parallel.
                   """,
         ),
     ),
+    (
+        ("--shard",),
+        dict(
+            metavar="I/N",
+            dest="shard",
+            type=shard_spec,
+            help="""Run only the I-th part of N parts (shards) of the scenarios
+                  (as: 1 <= I <= N). Each scenario is assigned to a shard
+                  by a stable hash of its location (or by duration, if a
+                  timing file exists). Useful to split a test run across
+                  several CI nodes.""",
+        ),
+    ),
+    (
+        ("--timing-file",),
+        dict(
+            metavar="FILENAME",
+            dest="timing_file",
+            help="""Use the scenario durations of a previous test run
+                  (output of the "json" formatter), if the file exists.
+                  Used by --shard to balance the shards by duration and
+                  by parallel runners to schedule the longest work first.""",
+        ),
+    ),
+    (
+        ("--timing-default",),
+        dict(
+            metavar="SECONDS",
+            dest="timing_default",
+            type=float,
+            help="""Estimated duration of a scenario that is unknown in the
+                  timing file (default: mean duration of known scenarios).""",
+        ),
+    ),
+    (
+        ("--parse-cache",),
+        dict(
+            action="store_true",
+            help="""Cache parsed feature files (see: --parse-cache-dir).
+                  Only changed feature files are parsed again.""",
+        ),
+    ),
+    (
+        ("--parse-cache-dir",),
+        dict(
+            metavar="DIRECTORY",
+            dest="parse_cache_dir",
+            default=".behave_cache",
+            help="""Directory of the parse cache (default: %(default)s).""",
+        ),
+    ),
+    (
+        ("--low-memory",),
+        dict(
+            action="store_true",
+            help="""Release the captured output, exceptions, tracebacks and
+                  multi-line step data of each feature after it was reported.
+                  Only the status and timing data are kept (for the summary).
+                  Useful to reduce the memory usage of long test runs.""",
+        ),
+    ),
+    (
+        ("--columnar-tables",),
+        dict(
+            action="store_true",
+            help="""Store large step tables (with at least 1000 rows) in
+                  columns. Rows are created on demand, when they are used.
+                  Reduces the memory usage of large (reference data) tables
+                  and speeds up table.column() and table.assert_equals().""",
+        ),
+    ),
+    (
+        ("--stream-features",),
+        dict(
+            action="store_true",
+            help="""Run each feature as soon as it is parsed, while the next
+                  feature files are parsed in the background. A parse error
+                  ends the test run when its feature is reached (after the
+                  previous features have run). Not used with --shard or
+                  parallel runs.""",
+        ),
+    ),
+    (
+        ("--scan-tags",),
+        dict(
+            action="store_true",
+            help="""Scan the tags of feature files before they are parsed.
+                  Feature files without any feature or scenario that is
+                  selected by --tags are not parsed (and are not reported
+                  as skipped).""",
+        ),
+    ),
     (
         (),  # -- CONFIGFILE only
         dict(
@@ -1061,7 +1170,11 @@ class Configuration(object):
         self.userdata_defines = None
         self.more_formatters = None
         self.more_runners = None
-        self.runner_aliases = {"default": DEFAULT_RUNNER_CLASS_NAME}
+        self.runner_aliases = {
+            "default": DEFAULT_RUNNER_CLASS_NAME,
+            "parallel": PARALLEL_RUNNER_CLASS_NAME,
+            "parallel.scenario": SCENARIO_PARALLEL_RUNNER_CLASS_NAME,
+        }
 
     @classmethod
     def make_defaults(cls, **kwargs):
@@ -0,0 +1,380 @@
+# -*- coding: UTF-8 -*-
+# pylint: disable=useless-object-inheritance
+"""
+Resume ledger for the ``--check_previous`` mode.
+
+The ledger records which scenarios passed (file: ``scenario_pass``) or
+failed (file: ``scenario_fail``) in previous test runs.
+A scenario that passed before is not run again if ``--check_previous``
+is used.
+
+Both files contain one scenario entry per line
+(schema: "{fingerprint}\t{scenario}").
+Each file is read only once (into an in-memory index) and
+new entries are written in batches (append-only).
+Several behave processes may use the same ledger files concurrently
+(each process appends to its own segment file).
+
+The fingerprint of a scenario covers its rendered steps (with text and table)
+and the source code of the matched step functions.
+Therefore, a scenario is run again if the scenario or
+the implementation of one of its steps was changed.
+"""
+
+from __future__ import absolute_import
+from collections import OrderedDict
+import contextlib
+import hashlib
+import inspect
+import io
+import os
+import six
+try:
+    import fcntl
+except ImportError:     # pragma: no cover
+    # -- PLATFORM: Windows
+    fcntl = None
+from behave.model_core import FileLocation, unwrap_function
+from behave.textutil import text as _text
+
+
+# -----------------------------------------------------------------------------
+# CONSTANTS:
+# -----------------------------------------------------------------------------
+PASSED_FILENAME = "scenario_pass"
+FAILED_FILENAME = "scenario_fail"
+
+
+# -----------------------------------------------------------------------------
+# FINGERPRINT FUNCTIONS:
+# -----------------------------------------------------------------------------
+_function_digests = {}
+
+
+def make_function_digest(func):
+    """Computes the digest of the source code of a step function.
+    If the source code is not available, the function location is used.
+
+    :param func:  Step function (of a step match).
+    :return: Digest as hex string.
+    """
+    digest = _function_digests.get(func)
+    if digest is None:
+        # pylint: disable=broad-except
+        # -- NOTE: Digest is cached for the (decorated) step function.
+        inner_func = func
+        try:
+            inner_func = unwrap_function(func)
+            source = inspect.getsource(inner_func)
+        except Exception:
+            try:
+                source = six.text_type(FileLocation.for_function(inner_func))
+            except Exception:
+                source = repr(inner_func)
+        digest = hashlib.sha1(_text(source).encode("UTF-8")).hexdigest()
+        _function_digests[func] = digest
+    return digest
+
+
+def make_scenario_fingerprint(scenario, step_registry):
+    """Computes the fingerprint of a scenario from its (rendered) steps,
+    their text/table and the source code of the matched step functions.
+    The match of a step that was run is used (without matching it again).
+
+    :param scenario:  Scenario to use.
+    :param step_registry:  Step registry to match the steps (that were not run).
+    :return: Fingerprint as hex string.
+    """
+    parts = [_text(scenario.filename), _text(scenario)]
+    parts.extend(sorted(_text(tag) for tag in scenario.effective_tags))
+    for step in scenario.all_steps:
+        parts.append(u"%s %s" % (step.step_type, step.name))
+        if step.text is not None:
+            parts.append(u"TEXT:%s" % step.text)
+        if step.table is not None:
+            parts.append(u"TABLE:%s" % u"|".join(step.table.headings))
+            parts.extend(u"|".join(row.cells) for row in step.table.rows)
+        match = getattr(step, "match", None)
+        if match is None:
+            match = step_registry.find_match(step)
+        if match is None or getattr(match, "func", None) is None:
+            parts.append(u"UNDEFINED")
+        else:
+            parts.append(make_function_digest(match.func))
+    data = u"\n".join(parts).encode("UTF-8")
+    return hashlib.sha1(data).hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# FILE UTILITIES:
+# -----------------------------------------------------------------------------
+replace_file = getattr(os, "replace", os.rename)   # -- PY2: os.rename
+
+
+def is_same_file(opened_file, path):
+    """Checks if an opened file is (still) the file at this path."""
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return False
+    file_stat = os.fstat(opened_file.fileno())
+    return (path_stat.st_ino, path_stat.st_dev) == (file_stat.st_ino,
+                                                    file_stat.st_dev)
+
+
+@contextlib.contextmanager
+def file_lock(lock_path, exclusive=False, blocking=True):
+    """Acquires an advisory lock on a lock file (by using :mod:`fcntl`).
+    Provides if the lock was acquired (for non-blocking mode).
+    The lock file may be removed by the holder of an exclusive lock.
+
+    .. note:: Without :mod:`fcntl` support, the lock is always acquired.
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+    if not blocking:
+        operation |= fcntl.LOCK_NB
+    while True:
+        lock_file = open(lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), operation)
+        except (IOError, OSError):
+            lock_file.close()
+            yield False
+            return
+        if is_same_file(lock_file, lock_path):
+            break
+        # -- CASE: Lock file was removed while waiting for the lock: Retry.
+        lock_file.close()
+
+    with lock_file:
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+# -----------------------------------------------------------------------------
+# CLASS: LedgerFile
+# -----------------------------------------------------------------------------
+class LedgerFile(object):
+    """Append-only text file with one entry per line.
+    Each entry starts with its key (optionally followed by a TAB and a label).
+
+    The entries of the file are loaded once into an (ordered) index.
+    Added entries are kept in memory until :meth:`flush()` is called.
+
+    To support several processes that use the same ledger file,
+    each process appends its entries to its own segment file
+    (schema: "{filename}.{pid}.segment").
+    The main file and all segments are merged when the ledger is loaded.
+    If an entry occurs more than once, the last occurrence wins.
+    Segments are compacted into the main file when the ledger is closed
+    (and no other process writes to it at this time).
+    """
+    segment_schema = "{path}.{pid}.segment"
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.path = None
+        self.entries = None
+        self.pending = []
+
+    @property
+    def loaded(self):
+        return self.entries is not None
+
+    @property
+    def lock_path(self):
+        return self.path + ".lock"
+
+    @property
+    def segment_path(self):
+        # -- NOTE: Process id is evaluated late (for forked worker processes).
+        return self.segment_schema.format(path=self.path, pid=os.getpid())
+
+    def iter_segment_paths(self):
+        """Provides the segment paths in write order (oldest first)."""
+        directory, basename = os.path.split(self.path)
+        prefix, suffix = self.segment_schema.format(path=basename,
+                                                    pid="|").split("|")
+        try:
+            names = os.listdir(directory or ".")
+        except OSError:
+            return
+        segments = []
+        for name in names:
+            if not (name.startswith(prefix) and name.endswith(suffix)):
+                continue
+            pid = name[len(prefix):-len(suffix)]
+            if not pid.isdigit():
+                continue    # -- SKIP: Temporary file of compaction.
+            segment_path = os.path.join(directory, name)
+            try:
+                segments.append((os.path.getmtime(segment_path), segment_path))
+            except OSError:
+                pass    # -- CASE: Removed in the meantime (by compaction).
+        for _, segment_path in sorted(segments):
+            yield segment_path
+
+    @staticmethod
+    def read_entries(path, entries):
+        try:
+            with io.open(path, "r", encoding="UTF-8") as f:
+                for line in f:
+                    entry = line.rstrip("\r\n")
+                    if entry:
+                        key = entry.split(u"\t", 1)[0]
+                        entries.pop(key, None)
+                        entries[key] = entry
+        except (IOError, OSError):
+            pass    # -- CASE: Missing file.
+
+    def load(self):
+        """Load the entries of the file into the index (if not done yet)."""
+        if self.loaded:
+            return
+        # -- NOTE: Current working directory may change during the test run.
+        self.path = os.path.abspath(self.filename)
+        self.entries = OrderedDict()
+        with file_lock(self.lock_path):
+            self.read_entries(self.path, self.entries)
+            for segment_path in self.iter_segment_paths():
+                self.read_entries(segment_path, self.entries)
+
+    def __contains__(self, key):
+        self.load()
+        return _text(key) in self.entries
+
+    def __len__(self):
+        self.load()
+        return len(self.entries)
+
+    def add(self, key, label=None, move_to_end=False):
+        """Add an entry to the ledger file (if it is not contained yet).
+
+        :param key:     Key of the entry (as string).
+        :param label:   Optional label of the entry (as string).
+        :param move_to_end: If true, an existing entry is moved to the end.
+        :return: True, if the entry was added (or moved).
+        """
+        self.load()
+        key = _text(key)
+        if key in self.entries:
+            if not move_to_end:
+                return False
+            del self.entries[key]
+        entry = key
+        if label is not None:
+            entry = u"%s\t%s" % (key, _text(label))
+        self.entries[key] = entry
+        self.pending.append(entry)
+        return True
+
+    def flush(self):
+        """Append the pending entries to the segment file of this process."""
+        if not self.pending:
+            return
+        with file_lock(self.lock_path):
+            with io.open(self.segment_path, "a", encoding="UTF-8") as f:
+                f.writelines(u"%s\n" % entry for entry in self.pending)
+        self.pending = []
+
+    def compact(self):
+        """Merge all segments into the main file.
+        Compaction is skipped if another process uses the ledger file.
+
+        :return: True, if compaction was performed.
+        """
+        with file_lock(self.lock_path, exclusive=True, blocking=False) as locked:
+            if not locked:
+                return False
+            segment_paths = list(self.iter_segment_paths())
+            if segment_paths:
+                entries = OrderedDict()
+                self.read_entries(self.path, entries)
+                for segment_path in segment_paths:
+                    self.read_entries(segment_path, entries)
+                temp_path = self.segment_schema.format(
+                    path=self.path, pid="%d.compact" % os.getpid())
+                with io.open(temp_path, "w", encoding="UTF-8") as f:
+                    f.writelines(u"%s\n" % entry for entry in entries.values())
+                replace_file(temp_path, self.path)
+                for segment_path in segment_paths:
+                    os.remove(segment_path)
+            # -- CLEANUP: Waiting processes notice it and use a new lock file.
+            try:
+                os.remove(self.lock_path)
+            except OSError:
+                pass
+        return True
+
+    def close(self):
+        """Write the pending entries and discard the index.
+        The file is loaded again, when it is used the next time.
+        """
+        if self.loaded:
+            self.flush()
+            self.compact()
+        self.entries = None
+
+
+# -----------------------------------------------------------------------------
+# CLASS: ScenarioLedger
+# -----------------------------------------------------------------------------
+class ScenarioLedger(object):
+    """Records the passed and failed scenarios of a test run.
+
+    .. code-block:: python
+
+        ledger = ScenarioLedger()
+        key = make_scenario_fingerprint(scenario, step_registry)
+        if not ledger.has_passed(key):
+            ...     # -- RUN SCENARIO.
+            ledger.record_passed(key, label=str(scenario))
+        ledger.close()  # -- AT END OF TEST RUN.
+    """
+    batch_size = 100
+
+    def __init__(self, passed_filename=PASSED_FILENAME,
+                 failed_filename=FAILED_FILENAME, batch_size=None):
+        if batch_size is None:
+            batch_size = self.batch_size
+        self.passed = LedgerFile(passed_filename)
+        self.failed = LedgerFile(failed_filename)
+        self.batch_size = batch_size
+
+    def has_passed(self, key):
+        """Indicates if the scenario passed in a previous test run."""
+        return key in self.passed
+
+    def record_passed(self, key, label=None):
+        self.passed.add(key, label)
+        self.flush_if_needed()
+
+    def record_failed(self, key, label=None):
+        self.failed.add(key, label, move_to_end=True)
+        self.flush_if_needed()
+
+    def flush_if_needed(self):
+        pending_size = len(self.passed.pending) + len(self.failed.pending)
+        if pending_size >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        self.passed.flush()
+        self.failed.flush()
+
+    def close(self):
+        """Flush the ledger at the end of a test run."""
+        self.passed.close()
+        self.failed.close()
+
+
+# -----------------------------------------------------------------------------
+# LEDGER SINGLETON:
+# -----------------------------------------------------------------------------
+the_ledger = ScenarioLedger()
@@ -160,6 +160,12 @@ class Matcher(object):
        The step function the pattern is being attached to.
     """
     schema = u"@%s('%s')"   # Schema used to describe step definition (matcher)
+    # -- NOTE: Changed when types are (un)registered (invalidates match caches).
+    types_version = 0
+
+    @classmethod
+    def notify_types_changed(cls):
+        Matcher.types_version += 1
 
     @classmethod
     def register_type(cls, **kwargs):
@@ -190,6 +196,13 @@ class Matcher(object):
             self._location = Match.make_location(self.func)
         return self._location
 
+    @property
+    def literal_prefix(self):
+        """Return the constant text that each matching step name starts with.
+        This text is used to index step definitions (empty, if unknown).
+        """
+        return u""
+
     @property
     def regex_pattern(self):
         """Return the used textual regex pattern."""
@@ -277,16 +290,23 @@ class ParseMatcher(Matcher):
                 assert isinstance(amount, int)
         """
         cls.custom_types.update(**kwargs)
+        cls.notify_types_changed()
 
     @classmethod
     def clear_registered_types(cls):
         cls.custom_types.clear()
+        cls.notify_types_changed()
 
 
     def __init__(self, func, pattern, step_type=None):
         super(ParseMatcher, self).__init__(func, pattern, step_type)
         self.parser = self.parser_class(pattern, self.custom_types)
 
+    @property
+    def literal_prefix(self):
+        # -- NOTE: Escaped braces ("{{", "}}") end the literal prefix, too.
+        return self.pattern.split(u"{", 1)[0].split(u"}", 1)[0]
+
     @property
     def regex_pattern(self):
         # -- OVERWRITTEN: Pattern as regex text.
@@ -334,10 +354,28 @@ class RegexMatcher(Matcher):
     def clear_registered_types(cls):
         pass  # -- HINT: GRACEFULLY ignored.
 
+    special_chars = u".^$*+?{}[]()|\\"
+
     def __init__(self, func, pattern, step_type=None):
         super(RegexMatcher, self).__init__(func, pattern, step_type)
         self.regex = re.compile(self.pattern)
 
+    @property
+    def literal_prefix(self):
+        pattern = self.regex.pattern
+        if u"|" in pattern:
+            # -- ALTERNATIVES: Step name may start with another text.
+            return u""
+        if pattern.startswith(u"^"):
+            pattern = pattern[1:]
+        prefix = []
+        for index, char in enumerate(pattern):
+            next_char = pattern[index+1:index+2]
+            if char in self.special_chars or (next_char and next_char in u"*+?{"):
+                break
+            prefix.append(char)
+        return u"".join(prefix)
+
 
     def check_match(self, step):
         m = self.regex.match(step)
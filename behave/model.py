@@ -11,13 +11,16 @@ This module provides the model element class that represent a behave model:
 """
 
 from __future__ import absolute_import, with_statement, print_function
+from array import array
 import copy
 import difflib
 import logging
 import itertools
+import re
 import time
 import six
 from six.moves import zip  # pylint: disable=redefined-builtin
+from behave.compat.collections import OrderedDict
 from behave.model_core import (
     Status,
     BasicStatement,
@@ -25,6 +28,7 @@ from behave.model_core import (
     TagStatement,
     Replayable,
 )
+from behave.ledger import make_scenario_fingerprint, the_ledger
 from behave.matchers import NoMatch
 from behave.textutil import text as _text
 
@@ -35,6 +39,12 @@ else:
     import traceback
 
 
+# ---------------------------------------------------------------------------
+# CONSTANTS:
+# ---------------------------------------------------------------------------
+COLUMNAR_TABLE_MIN_ROWS = 1000
+
+
 # ---------------------------------------------------------------------------
 # MODEL UTILITIES:
 # ---------------------------------------------------------------------------
@@ -62,6 +72,38 @@ def copy_and_reset_steps(steps):
     return reset_steps(copy_steps(steps))
 
 
+def make_heading_index(headings):
+    """Map each table heading to its (first) column index.
+
+    :param headings:    List of table headings.
+    :return: Dictionary that maps a heading to its column index.
+    """
+    heading_index = {}
+    for index, heading in enumerate(headings):
+        heading_index.setdefault(heading, index)
+    return heading_index
+
+
+def lookup_heading_index(headings, heading_index, name):
+    """Lookup the column index of a heading by using the heading index.
+    Falls back to a search in the headings if the heading index is outdated
+    (for example: if the headings list was modified directly).
+
+    :param headings:        List of table headings.
+    :param heading_index:   Heading index (see: :func:`make_heading_index()`).
+    :param name:            Heading name to lookup.
+    :return: Column index of this heading.
+    :raises ValueError: If the heading is unknown.
+    """
+    try:
+        index = heading_index.get(name)
+    except TypeError:
+        index = None    # -- CASE: Unhashable name (slice, ...)
+    if index is not None and index < len(headings) and headings[index] == name:
+        return index
+    return headings.index(name)
+
+
 # ---------------------------------------------------------------------------
 # MODEL CLASSES:
 # ---------------------------------------------------------------------------
@@ -197,6 +239,14 @@ class ScenarioContainer(TagAndStatusStatement, Replayable):
         for run_item in self.run_items:
             run_item.reset()
 
+    def release_payload(self):
+        """Release the run payload of this feature/rule and its run items."""
+        super(ScenarioContainer, self).release_payload()
+        if self.background:
+            self.background.release_payload()
+        for run_item in self.run_items:
+            run_item.release_payload()
+
     def _setup_context_for_run(self, context):
         """Setup/Init runner context for run."""
         # -- OVERRIDDEN: By derived classes.
@@ -860,6 +910,11 @@ class Background(BasicStatement, Replayable):
         self._use_inheritance = bool(value)
         self._inherited_steps = None
 
+    def release_payload(self):
+        super(Background, self).release_payload()
+        for step in self.steps:
+            step.release_payload()
+
     @property
     def inherited_steps(self):
         # versionadded:: 1.2.7
@@ -1019,6 +1074,14 @@ class Scenario(TagAndStatusStatement, Replayable):
         for step in self.all_steps:
             step.reset()
 
+    def release_payload(self):
+        """Release the run payload of this scenario and its steps.
+        The background steps are only released if they were used.
+        """
+        super(Scenario, self).release_payload()
+        for step in itertools.chain(self._background_steps or [], self.steps):
+            step.release_payload()
+
     @property
     def use_background(self):
         """Indicates if the background is/would be used (if any exists).
@@ -1180,12 +1243,13 @@ class Scenario(TagAndStatusStatement, Replayable):
         scenario_str = str(self)
         # print("====>scenario start", scenario_str)
 
-        if getattr(
-            runner.config, "check_previous", False
-        ) and check_and_remove_string_in_file(file_path,scenario_str):
-            print("=====>scenario passed previously", scenario_str)
-            self.set_status(Status.passed)
-            return False  # not failed
+        ledger_key = None
+        if getattr(runner.config, "check_previous", False):
+            ledger_key = make_scenario_fingerprint(self, runner.step_registry)
+            if the_ledger.has_passed(ledger_key):
+                print("=====>scenario passed previously", scenario_str)
+                self.set_status(Status.passed)
+                return False  # not failed
 
         # pylint: disable=too-many-branches, too-many-statements
         self.clear_status()
@@ -1301,13 +1365,169 @@ class Scenario(TagAndStatusStatement, Replayable):
 
         runner.teardown_capture()
 
+        if ledger_key is None:
+            ledger_key = make_scenario_fingerprint(self, runner.step_registry)
         if not failed and self.status == Status.passed:
-            append_to_file(scenario_str)
+            the_ledger.record_passed(ledger_key, label=scenario_str)
         else:
-            append_to_failed_file(scenario_str)
+            the_ledger.record_failed(ledger_key, label=scenario_str)
         return failed
 
 
+class PlaceholderTemplate(object):
+    """Text template with placeholders, ala "Hello <name>", that is compiled
+    for the columns of an examples table (and additional placeholder params).
+    The text is split into literal and slot segments once.
+    Rendering a row only joins the literals with the row values.
+
+    .. code-block:: python
+
+        template = PlaceholderTemplate(u"Hello <name>", [u"name", u"age"])
+        text = template.render([u"Alice", u"42"])   # => u"Hello Alice"
+
+    Unknown placeholders are kept as literal text.
+
+    .. note:: Placeholders are substituted one after another (in column order,
+        then params). Therefore, a value may refer to a later placeholder.
+        This (rare) case is detected and rendered by substituting each
+        placeholder in order.
+    """
+    pattern = re.compile(r"<([^<>]+)>")
+
+    def __init__(self, text, headings=None, param_names=None):
+        self.text = text
+        self.segments = []  # -- ITEM: (literal, column_index, param_name)
+        self.names = None   # -- NEEDED-FOR: Placeholder substitution in order.
+        if "<" in text and ">" in text:
+            headings = headings or []
+            param_names = list(param_names or ())
+            self.segments = self.compile(text, headings, param_names)
+            if self.segments:
+                self.names = (headings, param_names)
+
+    @property
+    def has_placeholders(self):
+        return bool(self.segments)
+
+    @classmethod
+    def compile(cls, text, headings, param_names):
+        """Split text into segments: a literal text followed by a slot.
+
+        :param text:        Text with placeholders.
+        :param headings:    Column names (of the examples table).
+        :param param_names: Names of additional placeholder params.
+        :return: List of segments (or empty list, if no slots are used).
+        """
+        columns = {}
+        for index, heading in enumerate(headings):
+            columns.setdefault(heading, index)
+
+        segments = []
+        literal_start = 0
+        for match in cls.pattern.finditer(text):
+            name = match.group(1)
+            column_index = columns.get(name)
+            if column_index is None and name not in param_names:
+                continue    # -- UNKNOWN PLACEHOLDER: Keep as literal text.
+            segments.append((text[literal_start:match.start()],
+                             column_index, name))
+            literal_start = match.end()
+        if segments:
+            segments.append((text[literal_start:], None, None))
+        return segments
+
+    def render(self, cells, params=None):
+        """Render the text for the cells of a row (and params).
+
+        :param cells:   Cell values of a row (in column order).
+        :param params:  Values of additional placeholder params (as dict).
+        :return: Rendered text (or original text, if no slots are used).
+        """
+        if not self.segments:
+            return self.text
+
+        parts = []
+        for literal, column_index, name in self.segments:
+            if "<" in literal or ">" in literal:
+                return self.render_in_order(cells, params)
+            parts.append(literal)
+            if column_index is not None:
+                value = cells[column_index]
+            elif name is not None:
+                value = params[name]
+            else:
+                continue
+            if "<" in value or ">" in value:
+                # -- SPECIAL CASE: Value may refer to a later placeholder.
+                return self.render_in_order(cells, params)
+            parts.append(value)
+        return u"".join(parts)
+
+    def render_in_order(self, cells, params=None):
+        """Render the text by substituting one placeholder after another."""
+        headings, param_names = self.names
+        text = self.text
+        for name, value in zip(headings, cells):
+            text = text.replace(u"<%s>" % name, value)
+        for name in param_names:
+            text = text.replace(u"<%s>" % name, params[name])
+        return text
+
+
+class OutlineStepTemplate(object):
+    """Outline step that is compiled for the columns of an examples table.
+    Makes the step for each row of the examples table.
+    """
+
+    def __init__(self, outline_step, headings, param_names=None):
+        self.step = outline_step
+        self.name = PlaceholderTemplate(outline_step.name, headings, param_names)
+        self.text = None
+        self.table_headings = None
+        self.table_rows = None
+        if outline_step.text:
+            self.text = PlaceholderTemplate(outline_step.text, headings)
+        if outline_step.table:
+            table = outline_step.table
+            self.table_headings = [PlaceholderTemplate(cell, headings)
+                                   for cell in table.headings]
+            self.table_rows = [
+                (table_row, [PlaceholderTemplate(cell, headings)
+                             for cell in table_row.cells])
+                for table_row in table.rows
+            ]
+
+    def make_table(self, cells):
+        outline_table = self.step.table
+        headings = [template.render(cells) for template in self.table_headings]
+        new_table = Table(headings, line=outline_table.line)
+        for table_row, templates in self.table_rows:
+            row_cells = [template.render(cells) for template in templates]
+            new_table.rows.append(Row(headings, row_cells, table_row.line,
+                                      table_row.comments,
+                                      new_table.heading_index))
+        return new_table
+
+    def make_step(self, cells, params=None):
+        """Make the step for a row of the examples table.
+
+        :param cells:   Cell values of the row.
+        :param params:  Additional placeholder params (for the step name).
+        :return: New step (shares unchanged data with the outline step).
+        """
+        # -- NOTE: Shallow copy shares location, keyword, ... with outline step.
+        new_step = copy.copy(self.step)
+        new_step.reset()
+        new_step.name = self.name.render(cells, params)
+        if self.text and self.text.has_placeholders:
+            text = self.step.text
+            new_step.text = Text(self.text.render(cells),
+                                 text.content_type, text.line)
+        if self.table_rows is not None:
+            new_step.table = self.make_table(cells)
+        return new_step
+
+
 class ScenarioOutlineBuilder(object):
     """Helper class to use a ScenarioOutline as a template and
     build its scenarios (as template instances).
@@ -1331,16 +1551,15 @@ class ScenarioOutlineBuilder(object):
         if not ("<" in text and ">" in text):
             return text
 
-        safe_values = False
+        names = []
+        values = []
         for placeholders in (row, params):
             if not placeholders:
                 continue
             for name, value in placeholders.items():
-                if safe_values and ("<" in value and ">" in value):
-                    continue  # -- OOPS, value looks like placeholder.
-                placeholder = "<%s>" % name
-                text = text.replace(placeholder, value)
-        return text
+                names.append(name)
+                values.append(value)
+        return PlaceholderTemplate(text, names).render(values)
 
     def make_scenario_name(self, outline_name, example, row, params=None):
         """Build a scenario name for an example row of this scenario outline.
@@ -1361,10 +1580,27 @@ class ScenarioOutlineBuilder(object):
         params.setdefault("row.index", row.index)
         params.setdefault("row.id", row.id)
 
+        name_template = PlaceholderTemplate(outline_name, row.headings, params)
+        examples_name_template = PlaceholderTemplate(example.name or "",
+                                                     row.headings, params)
+        return self.render_scenario_name(name_template, examples_name_template,
+                                         example, row, params)
+
+    def render_scenario_name(self, name_template, examples_name_template,
+                             example, row, params):
+        """Render the scenario name for an example row (with templates).
+
+        :param name_template:   Compiled ScenarioOutline name.
+        :param examples_name_template:  Compiled Examples name.
+        :param example:         Examples object.
+        :param row:             Row of this example.
+        :param params:          Additional placeholders for example/row.
+        :return: Computed name for the scenario representing example/row.
+        """
         # -- STEP: Replace placeholders in scenario/example name (if any).
-        examples_name = self.render_template(example.name, row, params)
+        examples_name = examples_name_template.render(row.cells, params)
         params["examples.name"] = examples_name
-        scenario_name = self.render_template(outline_name, row, params)
+        scenario_name = name_template.render(row.cells, params)
 
         class Data(object):
             def __init__(self, name, index):
@@ -1386,34 +1622,48 @@ class ScenarioOutlineBuilder(object):
     def make_row_tags(cls, outline_tags, row, params=None):
         if not outline_tags:
             return []
+        tag_templates = cls.compile_row_tags(outline_tags, row.headings, params)
+        return cls.render_row_tags(tag_templates, row.cells, params)
 
-        tags = []
+    @classmethod
+    def compile_row_tags(cls, outline_tags, headings, param_names=None):
+        """Compile the parametrized tags of a ScenarioOutline.
+        Other tags are converted into their tag name (once).
+
+        :return: List of tag names or tag templates.
+        """
+        tag_templates = []
         for tag in outline_tags:
             if cls.is_parametrized_tag(tag):
-                tag = cls.render_template(tag, row, params)
-            if cls.is_parametrized_tag(tag):
-                # -- OOPS: Unknown placeholder, drop tag.
-                continue
-            new_tag = Tag.make_name(tag, unescape=True)
-            tags.append(new_tag)
+                tag_templates.append(PlaceholderTemplate(tag, headings,
+                                                         param_names))
+            else:
+                tag_templates.append(Tag.make_name(tag, unescape=True))
+        return tag_templates
+
+    @classmethod
+    def render_row_tags(cls, tag_templates, cells, params=None):
+        tags = []
+        for tag in tag_templates:
+            if isinstance(tag, PlaceholderTemplate):
+                tag = tag.render(cells, params)
+                if cls.is_parametrized_tag(tag):
+                    # -- OOPS: Unknown placeholder, drop tag.
+                    continue
+                tag = Tag.make_name(tag, unescape=True)
+            tags.append(tag)
         return tags
 
     @classmethod
     def make_step_for_row(cls, outline_step, row, params=None):
         # -- BASED-ON: new_step = outline_step.set_values(row)
-        new_step = copy.deepcopy(outline_step)
-        new_step.name = cls.render_template(new_step.name, row, params)
-        if new_step.text:
-            new_step.text = cls.render_template(new_step.text, row)
-        if new_step.table:
-            for name, value in row.items():
-                placeholder = "<%s>" % name
-                for i, cell in enumerate(new_step.table.headings):
-                    new_step.table.headings[i] = cell.replace(placeholder, value)
-                for step_row in new_step.table:
-                    for i, cell in enumerate(step_row.cells):
-                        step_row.cells[i] = cell.replace(placeholder, value)
-        return new_step
+        step_template = OutlineStepTemplate(outline_step, row.headings, params)
+        return step_template.make_step(row.cells, params)
+
+    @staticmethod
+    def make_steps_for_row(step_templates, row, params=None):
+        return [step_template.make_step(row.cells, params)
+                for step_template in step_templates]
 
     def build_scenarios(self, scenario_outline):
         """Build scenarios for a ScenarioOutline from its examples."""
@@ -1438,32 +1688,42 @@ class ScenarioOutlineBuilder(object):
                 )
                 continue
 
+            # -- COMPILE TEMPLATES (once): For the columns of this examples table.
+            headings = example.table.headings
+            name_template = PlaceholderTemplate(scenario_outline.name,
+                                                headings, params)
+            examples_name_template = PlaceholderTemplate(example.name or "",
+                                                         headings, params)
+            tag_templates = self.compile_row_tags(scenario_outline.tags,
+                                                  headings, params)
+            step_templates = [
+                OutlineStepTemplate(outline_step, headings, params)
+                for outline_step in scenario_outline.steps
+            ]
             for row_index, row in enumerate(example.table):
                 row.index = row_index + 1
                 row.id = "%d.%d" % (example.index, row.index)
                 params["row.id"] = row.id
                 params["row.index"] = _text(row.index)
-                scenario_name = self.make_scenario_name(
-                    scenario_outline.name, example, row, params
+                params["examples.name"] = example.name or ""
+                scenario_name = self.render_scenario_name(
+                    name_template, examples_name_template, example, row, params
                 )
-                row_tags = self.make_row_tags(scenario_outline.tags, row, params)
+                row_tags = self.render_row_tags(tag_templates, row.cells, params)
                 row_tags.extend(example.tags)
-                new_steps = []
-                for outline_step in scenario_outline.steps:
-                    new_step = self.make_step_for_row(outline_step, row, params)
-                    new_steps.append(new_step)
 
                 # -- STEP: Make Scenario name for this row.
                 # scenario_line = example.line + 2 + row_index
+                # NOTE: Its steps are built when they are used first (lazy).
                 scenario_line = row.line
-                scenario = Scenario(
+                scenario = OutlineScenario(
                     scenario_outline.filename,
                     scenario_line,
                     scenario_outline.keyword,
                     scenario_name,
                     row_tags,
-                    new_steps,
                 )
+                scenario.use_step_templates(step_templates, row, dict(params))
                 scenario.feature = scenario_outline.feature
                 scenario.parent = scenario_outline
                 scenario.background = scenario_outline.background
@@ -1473,6 +1733,45 @@ class ScenarioOutlineBuilder(object):
         return scenarios
 
 
+class OutlineScenario(Scenario):
+    """A scenario of a :class:`ScenarioOutline` for one row of its examples.
+    Its steps are built from the outline steps when they are used first
+    (normally: when the scenario runs). Therefore, the scenarios of large
+    examples tables are cheap until they are used.
+    """
+
+    def __init__(self, filename, line, keyword, name, tags=None, steps=None,
+                 description=None, parent=None):
+        self._step_templates = None
+        super(OutlineScenario, self).__init__(filename, line, keyword, name,
+                                              tags, steps, description, parent)
+
+    def use_step_templates(self, step_templates, row, params=None):
+        """Build the steps (later) from the outline step templates for this row.
+
+        :param step_templates:  List of :class:`OutlineStepTemplate` objects.
+        :param row:     Examples row of this scenario.
+        :param params:  Additional placeholder params (for step names).
+        """
+        self._steps = None
+        self._step_templates = (step_templates, row, params)
+
+    @property
+    def steps(self):
+        if self._steps is None:
+            # -- LAZY-INIT: Build steps for this example row.
+            step_templates, row, params = self._step_templates
+            self._steps = ScenarioOutlineBuilder.make_steps_for_row(
+                step_templates, row, params)
+            self._step_templates = None
+        return self._steps
+
+    @steps.setter
+    def steps(self, value):
+        self._steps = value
+        self._step_templates = None
+
+
 class ScenarioOutline(Scenario):
     """A `scenario outline`_ parsed from a *feature file*.
 
@@ -1575,6 +1874,11 @@ class ScenarioOutline(Scenario):
         for scenario in self._scenarios:  # -- AVOID: BUILD-SCENARIOS
             scenario.reset()
 
+    def release_payload(self):
+        super(ScenarioOutline, self).release_payload()
+        for scenario in self._scenarios:  # -- AVOID: BUILD-SCENARIOS
+            scenario.release_payload()
+
     @property
     def scenarios(self):
         """Return the scenarios with the steps altered to take the values from
@@ -1836,6 +2140,9 @@ class Step(BasicStatement, Replayable):
     """
 
     type = "step"
+    # -- NOTE: Other (user-defined) attributes are stored in __dict__.
+    __slots__ = ("step_type", "text", "table", "status", "hook_failed",
+                 "duration", "match", "__dict__")
 
     def __init__(self, filename, line, keyword, step_type, name, text=None, table=None):
         super(Step, self).__init__(filename, line, keyword, name)
@@ -1846,6 +2153,7 @@ class Step(BasicStatement, Replayable):
         self.status = Status.untested
         self.hook_failed = False
         self.duration = 0
+        self.match = None
 
     def reset(self):
         """Reset temporary runtime data to reach clean state again."""
@@ -1853,8 +2161,23 @@ class Step(BasicStatement, Replayable):
         self.status = Status.untested
         self.hook_failed = False
         self.duration = 0
+        self.match = None
         # -- POSTCONDITION: assert self.status == Status.untested
 
+    def release_payload(self):
+        """Release the run payload and the multi-line text/table of this step.
+        The error message is summarized (without the captured output report).
+        """
+        if self.error_message and self.captured:
+            report = self.captured.make_report()
+            if report and self.error_message.endswith(report):
+                error_message = self.error_message[:-len(report)]
+                self.error_message = error_message.rstrip()
+        super(Step, self).release_payload()
+        self.text = None
+        self.table = None
+        self.match = None
+
     def __repr__(self):
         return '<%s "%s">' % (self.step_type, self.name)
 
@@ -1892,6 +2215,7 @@ class Step(BasicStatement, Replayable):
         self.reset()
 
         match = runner.step_registry.find_match(self)
+        self.match = match
         if match is None:
             runner.undefined_steps.append(self)
             if not quiet:
@@ -2019,12 +2343,21 @@ class Table(Replayable):
         self.headings = headings
         self.line = line
         self.rows = []
+        self._heading_index = None
         if rows:
             for row in rows:
                 self.add_row(row, line)
 
+    @property
+    def heading_index(self):
+        """Maps each heading to its column index (shared by all rows)."""
+        if self._heading_index is None:
+            self._heading_index = make_heading_index(self.headings)
+        return self._heading_index
+
     def add_row(self, row, line=None):
-        self.rows.append(Row(self.headings, row, line))
+        self.rows.append(Row(self.headings, row, line,
+                             heading_index=self.heading_index))
 
     def add_column(self, column_name, values=None, default_value=""):
         """Adds a new column to this table.
@@ -2050,6 +2383,7 @@ class Table(Replayable):
 
         new_column_index = len(self.headings)
         self.headings.append(column_name)
+        self.heading_index[column_name] = new_column_index
         for row, value in zip(self.rows, values):
             assert len(row.cells) == new_column_index
             row.cells.append(value)
@@ -2065,6 +2399,10 @@ class Table(Replayable):
         assert isinstance(column_index, int)
         assert column_index < len(self.headings)
         del self.headings[column_index]
+        # -- NOTE: Rows share the heading index, update it in place.
+        heading_index = self.heading_index
+        heading_index.clear()
+        heading_index.update(make_heading_index(self.headings))
         for row in self.rows:
             assert column_index < len(row.cells)
             del row.cells[column_index]
@@ -2074,10 +2412,59 @@ class Table(Replayable):
             self.remove_column(column_name)
 
     def has_column(self, column_name):
-        return column_name in self.headings
+        try:
+            self.get_column_index(column_name)
+            return True
+        except ValueError:
+            return False
 
     def get_column_index(self, column_name):
-        return self.headings.index(column_name)
+        return lookup_heading_index(self.headings, self.heading_index,
+                                    column_name)
+
+    def column(self, column_name):
+        """Provides the cell values of a column.
+
+        :param column_name: Name of the column (as string).
+        :return: List of cell values (as strings).
+        :raises KeyError: If the column is unknown.
+        """
+        try:
+            column_index = self.get_column_index(column_name)
+        except ValueError:
+            raise KeyError("column=%s is unknown" % column_name)
+        return [row.cells[column_index] for row in self.rows]
+
+    def column_as_array(self, column_name, typecode="d"):
+        """Converts the cell values of a column into an :class:`array.array`.
+
+        .. code-block:: python
+
+            amounts = context.table.column_as_array("amount")
+            assert sum(amounts) == 42.0
+
+        :param column_name: Name of the column (as string).
+        :param typecode:    Array typecode ("d", "f": float, otherwise: int).
+        :return: Array with the converted cell values.
+        """
+        convert = float if typecode in ("d", "f") else int
+        return array(typecode, map(convert, self.column(column_name)))
+
+    def column_as_numpy(self, column_name, dtype=float):
+        """Converts the cell values of a column into a numpy array.
+
+        :param column_name: Name of the column (as string).
+        :param dtype:       Data type of the array elements.
+        :return: Numpy array with the converted cell values.
+        :raises ImportError: If numpy is not installed.
+        """
+        import numpy    # pylint: disable=import-outside-toplevel
+        return numpy.array(self.column(column_name), dtype=dtype)
+
+    def iter_cells(self):
+        """Provides the cells of each row (as list of strings)."""
+        for row in self.rows:
+            yield row.cells
 
     def require_column(self, column_name):
         """Require that a column exists in the table.
@@ -2147,8 +2534,182 @@ class Table(Replayable):
 
         If the cells do not match then a useful AssertionError will be raised.
         """
-        assert self == data
-        raise NotImplementedError
+        if isinstance(data, Table):
+            if self.headings != data.headings:
+                raise AssertionError("Table headings differ: %r != %r" % (
+                    self.headings, data.headings))
+            expected = list(data.iter_cells())
+        else:
+            expected = [list(getattr(row, "cells", row)) for row in data]
+
+        actual = list(self.iter_cells())
+        if actual == expected:
+            return
+
+        # -- DIAGNOSTICS: Find the first difference.
+        for index, (cells, expected_cells) in enumerate(zip(actual, expected)):
+            if cells != expected_cells:
+                raise AssertionError("Table row %d differs: %r != %r" % (
+                    index, cells, expected_cells))
+        raise AssertionError("Table has %d rows (expected: %d rows)" % (
+            len(actual), len(expected)))
+
+
+class ColumnarTable(Table):
+    """A table that stores its cells in columns (for large tables).
+    Each column is a list of cell values (as strings).
+    The :class:`~behave.model.Row` objects are created on demand as views.
+
+    .. note::
+
+        The ``rows`` attribute provides the list of row views.
+        It is created when it is first used (and again after the table
+        was modified). Iterating over the table creates the row views
+        one by one (if the ``rows`` list was not created yet).
+        Use :meth:`add_row()` and :meth:`add_column()` to modify the table.
+        Changes of a row view do not modify the table.
+
+    .. attribute:: columns
+
+       List of columns. Each column is a list of cell values.
+
+    .. attribute:: row_lines
+
+       Line number of each row (in the *feature file*).
+    """
+
+    def __init__(self, headings, line=None, rows=None):
+        # pylint: disable=super-init-not-called
+        Replayable.__init__(self)
+        self.headings = headings
+        self.line = line
+        self.columns = [[] for _ in headings]
+        self.row_lines = []
+        self._heading_index = None
+        self._rows = None
+        if rows:
+            for row in rows:
+                self.add_row(row, line)
+
+    @classmethod
+    def from_table(cls, table):
+        """Creates a columnar table with the data of another table."""
+        columnar_table = cls(list(table.headings), line=table.line)
+        if table.rows:
+            columnar_table.columns = [list(column)
+                                      for column in zip(*table.iter_cells())]
+            columnar_table.row_lines = [row.line for row in table.rows]
+        return columnar_table
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            # -- LAZY-INIT: Row views are created once (until modified).
+            self._rows = [self.make_row(index)
+                          for index in range(len(self.row_lines))]
+        return self._rows
+
+    def make_row(self, index):
+        """Creates the row view for a row index."""
+        cells = [column[index] for column in self.columns]
+        return Row(self.headings, cells, self.row_lines[index],
+                   heading_index=self.heading_index)
+
+    def add_row(self, row, line=None):
+        assert len(row) == len(self.columns)
+        for column, cell in zip(self.columns, row):
+            column.append(cell)
+        self.row_lines.append(line)
+        self._rows = None
+
+    def add_column(self, column_name, values=None, default_value=""):
+        assert not self.has_column(column_name)
+        rows_count = len(self.row_lines)
+        if values is None:
+            values = [default_value] * rows_count
+        else:
+            values = list(values)[:rows_count]
+            values.extend([default_value] * (rows_count - len(values)))
+
+        new_column_index = len(self.headings)
+        self.headings.append(column_name)
+        self.heading_index[column_name] = new_column_index
+        self.columns.append(values)
+        self._rows = None
+        return new_column_index
+
+    def remove_column(self, column_name):
+        try:
+            column_index = self.get_column_index(column_name)
+        except ValueError:
+            raise KeyError("column=%s is unknown" % column_name)
+
+        del self.headings[column_index]
+        del self.columns[column_index]
+        heading_index = self.heading_index
+        heading_index.clear()
+        heading_index.update(make_heading_index(self.headings))
+        self._rows = None
+
+    def column(self, column_name):
+        try:
+            column_index = self.get_column_index(column_name)
+        except ValueError:
+            raise KeyError("column=%s is unknown" % column_name)
+        return list(self.columns[column_index])
+
+    def iter_cells(self):
+        if not self.columns:
+            return iter([[] for _ in self.row_lines])
+        return (list(cells) for cells in zip(*self.columns))
+
+    def assert_equals(self, data):
+        # -- FAST PATH: Compare column by column.
+        if isinstance(data, Table):
+            expected = list(data.iter_cells())
+            same_headings = self.headings == data.headings
+        else:
+            expected = [getattr(row, "cells", row) for row in data]
+            same_headings = True
+        columns_count = len(self.columns)
+        if (same_headings and expected and
+                len(expected) == len(self.row_lines) and
+                all(len(cells) == columns_count for cells in expected)):
+            expected_columns = zip(*expected)
+            if all(tuple(column) == expected_column
+                   for column, expected_column in zip(self.columns,
+                                                      expected_columns)):
+                return
+        Table.assert_equals(self, data)
+
+    def __repr__(self):
+        return "<ColumnarTable: %dx%d>" % (len(self.headings),
+                                           len(self.row_lines))
+
+    def __len__(self):
+        return len(self.row_lines)
+
+    def __bool__(self):
+        # -- SAME AS: Table (an empty table is true, too).
+        return True
+    __nonzero__ = __bool__      # -- PYTHON2
+
+    def __iter__(self):
+        if self._rows is not None:
+            return iter(self._rows)
+        return (self.make_row(index) for index in range(len(self.row_lines)))
+
+    def __getitem__(self, index):
+        if self._rows is not None:
+            return self._rows[index]
+        if isinstance(index, slice):
+            return [self.make_row(i)
+                    for i in range(*index.indices(len(self.row_lines)))]
+        if index < 0:
+            index += len(self.row_lines)
+        if not 0 <= index < len(self.row_lines):
+            raise IndexError("table row index out of range")
+        return self.make_row(index)
 
 
 class Row(object):
@@ -2183,17 +2744,27 @@ class Row(object):
     .. _`table`: gherkin.html#table
     """
 
-    def __init__(self, headings, cells, line=None, comments=None):
+    # -- NOTE: Other (user-defined) attributes are stored in __dict__.
+    __slots__ = ("headings", "comments", "cells", "line", "index", "id",
+                 "_heading_index", "__dict__")
+
+    def __init__(self, headings, cells, line=None, comments=None,
+                 heading_index=None):
         self.headings = headings
         self.comments = comments
         for c in cells:
             assert isinstance(c, six.text_type)
         self.cells = cells
         self.line = line
+        # -- NOTE: Rows of a table share its heading index (see: Table).
+        self._heading_index = heading_index
 
     def __getitem__(self, name):
+        if self._heading_index is None:
+            self._heading_index = make_heading_index(self.headings)
         try:
-            index = self.headings.index(name)
+            index = lookup_heading_index(self.headings, self._heading_index,
+                                         name)
         except ValueError:
             if isinstance(name, int):
                 index = name
@@ -2229,9 +2800,7 @@ class Row(object):
         """Converts the row and its cell data into a dictionary.
         :return: Row data as dictionary (without comments, line info).
         """
-        from behave.compat.collections import OrderedDict
-
-        return OrderedDict(self.items())
+        return OrderedDict(zip(self.headings, self.cells))
 
 
 class Tag(six.text_type):
@@ -2252,6 +2821,10 @@ class Tag(six.text_type):
         o.line = line
         return o
 
+    def __getnewargs__(self):
+        # -- SUPPORT: pickle (used by parse cache).
+        return (six.text_type(self), self.line)
+
     @classmethod
     def make_name(cls, text, unescape=False, allowed_chars=None):
         """Translate text into a "valid tag" without whitespace, etc.
@@ -2363,48 +2936,28 @@ def reset_model(model_elements):
         model_element.reset()
 
 
-file_path = "scenario_pass"
-failed_file_path = "scenario_fail"
+def make_columnar_tables(features, min_rows=COLUMNAR_TABLE_MIN_ROWS):
+    """Use a :class:`ColumnarTable` for each large step table of the features.
+    Tables of scenario outline steps are not changed.
 
-
-def append_to_file(string_to_append):
-    if check_and_remove_string_in_file(file_path, string_to_append):
-        return
-    with open(file_path, "a+") as file:
-        file.write(string_to_append + "\n")
-
-
-def append_to_failed_file(string_to_append):
-    check_and_remove_string_in_file(failed_file_path, string_to_append, is_remove=True)
-    with open(failed_file_path, "a+") as file:
-        file.write(string_to_append + "\n")
-
-
-def check_and_remove_string_in_file(file_path, target_string, is_remove=False):
-    """Check if target_string exists in file and optionally remove it.
-
-    :param file_path: Path to the file to check/modify
-    :param target_string: String to search for in the file
-    :param is_remove: If True, remove lines containing target_string
-    :return: True if target_string was found, False otherwise
+    :param features:    List of features.
+    :param min_rows:    Minimal number of rows of a large table.
     """
-    try:
-        with open(file_path, "r") as file:
-            lines = file.readlines()
-
-        found = False
-        for line in lines:
-            if target_string in line:
-                found = True
-                break
-
-        if found and is_remove:
-            # Remove lines containing the target_string
-            filtered_lines = [line for line in lines if target_string not in line]
-            with open(file_path, "w") as file:
-                file.writelines(filtered_lines)
-
-        return found
-    except Exception as e:
-        pass
-    return False
+    for feature in features:
+        containers = [feature]
+        containers.extend(run_item for run_item in feature.run_items
+                          if isinstance(run_item, Rule))
+        for container in containers:
+            steps = []
+            if container.background:
+                steps.extend(container.background.steps)
+            for run_item in container.run_items:
+                if (isinstance(run_item, Scenario) and
+                        not isinstance(run_item, ScenarioOutline)):
+                    steps.extend(run_item.steps)
+            for step in steps:
+                table = step.table
+                if (table is not None and not isinstance(table, ColumnarTable)
+                        and len(table.rows) >= min_rows):
+                    step.table = ColumnarTable.from_table(table)
+
@@ -17,6 +17,20 @@ def posixpath_normalize(path):
     return path.replace("\\", "/")
 
 
+_relpaths = {}
+
+
+def cached_relpath(path, start):
+    """Same as :func:`os.path.relpath()`, but the result is cached.
+    The parser uses the same filename for all model elements of a feature.
+    """
+    key = (path, start)
+    relpath = _relpaths.get(key)
+    if relpath is None:
+        relpath = _relpaths[key] = os.path.relpath(path, start)
+    return relpath
+
+
 # -----------------------------------------------------------------------------
 # GENERIC MODEL CLASSES:
 # -----------------------------------------------------------------------------
@@ -137,6 +151,7 @@ class FileLocation(object):
       * "{filename}" (if line number is not present)
     """
     __pychecker__ = "missingattrs=line"     # -- Ignore warnings for 'line'.
+    __slots__ = ("filename", "line")
 
     def __init__(self, filename, line=None):
         if PLATFORM_WIN:
@@ -266,21 +281,37 @@ class FileLocation(object):
 # ABSTRACT MODEL CLASSES (and concepts):
 # -----------------------------------------------------------------------------
 class BasicStatement(object):
+    # -- NOTE: Slots keep many small statements (steps) compact.
+    #    Derived classes without __slots__ use an instance __dict__, too.
+    __slots__ = ("location", "keyword", "name", "_captured",
+                 "exception", "exc_traceback", "error_message")
+
     def __init__(self, filename, line, keyword, name):
         filename = filename or '<string>'
-        filename = os.path.relpath(filename, os.getcwd())   # -- NEEDS: abspath?
+        filename = cached_relpath(filename, os.getcwd())   # -- NEEDS: abspath?
         self.location = FileLocation(filename, line)
         assert isinstance(keyword, six.text_type)
         assert isinstance(name, six.text_type)
         self.keyword = keyword
         self.name = name
         # -- SINCE: 1.2.6
-        self.captured = Captured()
+        self._captured = None
         # -- ERROR CONTEXT INFO:
         self.exception = None
         self.exc_traceback = None
         self.error_message = None
 
+    @property
+    def captured(self):
+        """Captured output of this statement (created when it is used first)."""
+        if self._captured is None:
+            self._captured = Captured()
+        return self._captured
+
+    @captured.setter
+    def captured(self, value):
+        self._captured = value
+
     @property
     def filename(self):
         # return os.path.abspath(self.location.filename)
@@ -292,7 +323,7 @@ class BasicStatement(object):
 
     def reset(self):
         # -- RESET: Captured output data
-        self.captured.reset()
+        self._captured = None
         # -- RESET: ERROR CONTEXT INFO
         self.exception = None
         self.exc_traceback = None
@@ -302,6 +333,15 @@ class BasicStatement(object):
         self.exception = exception
         self.exc_traceback = sys.exc_info()[2]
 
+    def release_payload(self):
+        """Release the run payload (captured output, exception, traceback)
+        after this statement was reported (used in low-memory mode).
+        The status and the timing data are kept.
+        """
+        self._captured = None
+        self.exception = None
+        self.exc_traceback = None
+
     def __hash__(self):
         # -- NEEDED-FOR: PYTHON3
         # return id((self.keyword, self.name))
@@ -422,6 +462,7 @@ class TagAndStatusStatement(BasicStatement):
 
 
 class Replayable(object):
+    __slots__ = ()
     type = None
 
     def replay(self, formatter):
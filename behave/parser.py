@@ -41,7 +41,9 @@ Keyword aliases:
 # pylint: enable=line-too-long
 
 from __future__ import absolute_import, with_statement
+from collections import namedtuple
 import logging
+import os
 import re
 import sys
 import six
@@ -52,11 +54,36 @@ from behave.textutil import text as _text
 DEFAULT_LANGUAGE = "en"
 
 
-def parse_file(filename, language=None):
+def parse_file(filename, language=None, curdir=None):
+    """Parse a feature file.
+
+    :param filename:  Feature filename to parse.
+    :param language:  Default language to use.
+    :param curdir:    Directory the model filenames are relative to
+                      (default: current working directory while parsing).
+    :return: Feature object (or None, for a file without feature).
+    """
     with open(filename, "rb") as f:
         # file encoding is assumed to be utf8. Oh, yes.
-        data = f.read().decode("utf8")
-    return parse_feature(data, language, filename)
+        # -- NOTE: Lines are parsed while the file is read.
+        lines = (line.decode("utf8") for line in f)
+        return parse_feature_lines(lines, language,
+                                   make_model_filename(filename, curdir))
+
+
+def make_model_filename(filename, curdir=None):
+    """Provides the filename for the model objects of a parsed file.
+    With ``curdir``, the filename is made relative to this directory.
+    Then it does no longer depend on the current working directory
+    while the file is parsed (which a hook may change).
+
+    :param filename:  Filename of the parsed file.
+    :param curdir:    Directory to use (or None: current working directory).
+    :return: Filename for the model objects.
+    """
+    if curdir is None:
+        return filename
+    return os.path.relpath(os.path.join(curdir, filename), curdir)
 
 
 def parse_feature(data, language=None, filename=None):
@@ -72,6 +99,22 @@ def parse_feature(data, language=None, filename=None):
     return result
 
 
+def parse_feature_lines(lines, language=None, filename=None):
+    """Parse a feature from lines (with line endings), like an opened file.
+
+    :param lines: Iterable of lines (as unicode).
+    :param language:  i18n language identifier (optional).
+    :param filename:  Filename (optional).
+    :return: Parsed feature (if successful).
+    """
+    try:
+        result = Parser(language).parse_lines(split_lines(lines), filename)
+    except ParserError as e:
+        e.filename = filename
+        raise
+    return result
+
+
 def parse_rule(text, language=None, filename=None):
     """Parse a rule with its background and scenario(s).
 
@@ -133,6 +176,78 @@ def parse_tags(text):
     return Parser(variant="tags").parse_tags(text)
 
 
+def parse_feature_tags(text, language=None):
+    """Scan the tags of a feature (without parsing it completely).
+
+    :param text: Multi-line text with the feature (as unicode).
+    :param language:  Default i18n language identifier (optional).
+    :return: List of effective tag sets (one per feature, rule, scenario, ...)
+             or None, if the tags cannot be determined without parsing.
+    """
+    assert isinstance(text, six.text_type)
+    return TagScanner(language).scan(text)
+
+
+def split_lines(lines):
+    """Provides the lines of an iterable with line endings (like a file)
+    in the same way as ``text.split("\\n")`` does.
+    """
+    line = u"\n"   # -- CASE: No lines provide one empty line.
+    for line in lines:
+        if line.endswith(u"\n"):
+            yield line[:-1]
+        else:
+            yield line
+    if line.endswith(u"\n"):
+        yield u""
+
+
+# -----------------------------------------------------------------------------
+# TOKENIZER: Classifies each line once (by its first non-whitespace chars).
+# -----------------------------------------------------------------------------
+ParserLine = namedtuple("ParserLine", ("text", "stripped", "indent", "kind"))
+_make_parser_line = tuple.__new__  # -- FASTER THAN: ParserLine(...)
+
+
+class LineKind(object):
+    """Kinds of a :class:`ParserLine` (in the context of most parser states)."""
+    EMPTY = "empty"
+    COMMENT = "comment"
+    TAGS = "tags"
+    TABLE_ROW = "table_row"
+    MULTILINE_QUOTES = "multiline_quotes"
+    TEXT = "text"
+
+
+_line_kinds = {
+    u"": LineKind.EMPTY,
+    u"#": LineKind.COMMENT,
+    u"@": LineKind.TAGS,
+    u"|": LineKind.TABLE_ROW,
+}
+
+
+def tokenize_line(text):
+    """Tokenize a line into a :class:`ParserLine` record.
+
+    :param text: Line text without line ending (as unicode).
+    :return: ParserLine record.
+    """
+    stripped = text.strip()
+    first_char = stripped[:1]
+    kind = _line_kinds.get(first_char, LineKind.TEXT)
+    if kind is LineKind.TEXT and first_char in u"\"'":
+        if stripped.startswith(u'"""') or stripped.startswith(u"'''"):
+            kind = LineKind.MULTILINE_QUOTES
+    indent = len(text)
+    if stripped:
+        indent = text.index(first_char)
+    return _make_parser_line(ParserLine, (text, stripped, indent, kind))
+
+
+EMPTY_LINE = tokenize_line(u"")
+
+
 class ParserError(Exception):
     @staticmethod
     def make_annotated(message, line_number, line_text=None, reason=None):
@@ -162,6 +277,11 @@ class ParserError(Exception):
         self.line_text = line_text
         self.filename = filename
 
+    def __reduce__(self):
+        # -- SUPPORT: pickle (used by parse workers); message is annotated.
+        return (self.__class__, (self.args[0], self.line, self.filename,
+                                 self.line_text, None, False))
+
     def __str__(self):
         arg0 = _text(self.args[0])
         if self.filename:
@@ -175,10 +295,95 @@ class ParserError(Exception):
         __str__ = lambda self: self.__unicode__().encode("utf-8")
 
 
+class KeywordMatcher(object):
+    """Matches the keywords of one language (as provided by :mod:`behave.i18n`)
+    at the start of a (stripped) line.
+
+    * Statement keywords (like: "Feature:", "Scenario:", ...) are looked up
+      in a dictionary by using the text before the first colon.
+    * Step keywords are matched by one anchored regular expression that
+      contains all step keyword aliases (in the order of the step types).
+
+    Use :meth:`for_language()` to reuse the matcher of a language.
+    """
+    step_types = ("given", "when", "then", "and", "but")
+    _matchers = {}
+
+    def __init__(self, keywords):
+        self.keywords = keywords
+        self.statement_keywords = {}
+        for keyword, aliases in keywords.items():
+            if keyword in self.step_types or not isinstance(aliases, list):
+                continue
+            for alias in aliases:
+                self.statement_keywords.setdefault(alias, set()).add(keyword)
+
+        self.step_keywords = [(step_type, alias)
+                              for step_type in self.step_types
+                              for alias in keywords[step_type]]
+        self.step_pattern = self.make_step_pattern(
+            alias for _, alias in self.step_keywords)
+        self.lower_step_pattern = self.make_step_pattern(
+            alias.lower() for _, alias in self.step_keywords)
+
+    @classmethod
+    def for_language(cls, language, keywords=None):
+        """Provides the keyword matcher of a language (created once)."""
+        if keywords is None:
+            keywords = i18n.languages[language]
+        matcher = cls._matchers.get(language)
+        if matcher is None or matcher.keywords is not keywords:
+            matcher = cls(keywords)
+            cls._matchers[language] = matcher
+        return matcher
+
+    @staticmethod
+    def make_step_pattern(aliases):
+        # -- NOTE: One group per alias; first matching alias wins.
+        pattern = u"|".join(u"(%s)" % re.escape(alias) for alias in aliases)
+        return re.compile(pattern, re.UNICODE)
+
+    def match_keyword(self, keyword, line):
+        """Matches a statement keyword followed by a colon.
+
+        :param keyword: Keyword type, like: "feature", "scenario", ...
+        :param line:    Stripped line to check.
+        :return: Matched keyword alias (as string) or None.
+        """
+        pos = line.find(u":")
+        if pos < 0:
+            return None
+        alias = line[:pos]
+        if keyword in self.statement_keywords.get(alias, ()):
+            return alias
+        return None
+
+    def match_step(self, line):
+        """Matches the step keyword of a step line (with case-insensitive
+        match as fallback). Aliases of earlier step types have precedence.
+
+        :param line:  Stripped line to check.
+        :return: Tuple (step_type, keyword) or None, if no step keyword is used.
+        """
+        index = None
+        match = self.step_pattern.match(line)
+        if match:
+            index = match.lastindex
+        match = self.lower_step_pattern.match(line.lower())
+        if match and (index is None or match.lastindex < index):
+            index = match.lastindex
+        if index is None:
+            return None
+        return self.step_keywords[index - 1]
+
+
 class Parser(object):
     """Feature file parser for behave."""
 
     # pylint: disable=too-many-instance-attributes
+    table_row_pattern = re.compile(r"^(|.+)\|$")
+    # -- SUPPORT: Escaped-pipe(s) in Gherkin cell values.
+    table_cell_separator = re.compile(r"(?<!\\)\|")
 
     def __init__(self, language=None, variant=None):
         if not variant:
@@ -203,6 +408,7 @@ class Parser(object):
         self.table = None
         self.examples = None
         self.keywords = None
+        self._keyword_matcher = None
         if self.language:
             self.keywords = i18n.languages[self.language]
         # NOT-NEEDED: self.reset()
@@ -233,18 +439,18 @@ class Parser(object):
         self.examples = None
 
     def parse(self, text, filename=None):
-        self.reset()
-        self.filename = filename
+        return self.parse_lines(text.split("\n"), filename)
 
-        for line in text.split("\n"):
-            self.line += 1
-            if not line.strip() and self.state != "multiline_text":
-                # -- SKIP EMPTY LINES, except in multiline string args.
-                continue
-            self.action(line)
+    def parse_lines(self, lines, filename=None):
+        """Parse a feature from lines (without line endings).
 
-        if self.table:
-            self.action_table("")
+        :param lines: Iterable of lines (as unicode), like an opened file.
+        :param filename: Filename (optional).
+        :return: Parsed feature (if any).
+        """
+        self.reset()
+        self.filename = filename
+        self.process_lines(lines)
 
         feature = self.feature
         if feature:
@@ -391,35 +597,50 @@ class Parser(object):
         # -- FINALLY: No glue what went wrong.
         return None
 
+    def process_lines(self, lines):
+        """Tokenize each line once and dispatch it to the action
+        of the current parser state.
+        """
+        for text in lines:
+            self.line += 1
+            line = tokenize_line(text)
+            if line.kind is LineKind.EMPTY and self.state != "multiline_text":
+                # -- SKIP EMPTY LINES, except in multiline string args.
+                continue
+            self.action(line)
+
+        if self.table:
+            self.action_table(EMPTY_LINE)
+
     def action(self, line):
-        if line.strip().startswith("#") and self.state != "multiline_text":
+        """Process a tokenized line (as :class:`ParserLine`)."""
+        if line.kind is LineKind.COMMENT and self.state != "multiline_text":
             if self.state != "init" or self.tags or self.variant != "feature":
                 return
 
             # -- DETECT: language comment (at begin of feature file; state=init)
-            line = line.strip()[1:].strip()
-            if line.lstrip().lower().startswith("language:"):
-                language = line[9:].strip()
+            text = line.stripped[1:].strip()
+            if text.lower().startswith("language:"):
+                language = text[9:].strip()
                 self.language = language
                 self.keywords = i18n.languages[language]
             return
 
-        func = getattr(self, "action_" + self.state, None)
+        func = self.state_actions.get(self.state)
         if func is None:
-            line = line.strip()
             msg = "Parser in unknown state %s;" % self.state
-            raise ParserError(msg, self.line, self.filename, line)
+            raise ParserError(msg, self.line, self.filename, line.stripped)
 
-        if not func(line):
-            line = line.strip()
+        if not func(self, line):
             msg = "\nParser failure in state=%s" % self.state
-            reason = self.ask_parse_failure_oracle(line)
+            reason = self.ask_parse_failure_oracle(line.stripped)
             raise ParserError(
-                msg, self.line, self.filename, line_text=line, reason=reason
+                msg, self.line, self.filename, line_text=line.stripped,
+                reason=reason
             )
 
     def action_init(self, line):
-        line = line.strip()
+        line = line.stripped
         if line.startswith("@"):
             self.tags.extend(self.parse_tags(line))
             return True
@@ -478,7 +699,7 @@ class Parser(object):
     # pylint: enable=invalid-name
 
     def action_feature(self, line):
-        line = line.strip()
+        line = line.stripped
         # OLD: if self.subaction_detect_next_scenario(line):
         if self.subaction_detect_taggable_statement(line):
             # -- DETECTED: Next Rule, Scenario, ScenarioOutline (or tags)
@@ -502,8 +723,7 @@ class Parser(object):
           * ScenarioOutline
           * Examples (within ScenarioOutline)
         """
-        line = line.strip()
-        if self.subaction_detect_taggable_statement(line):
+        if self.subaction_detect_taggable_statement(line.stripped):
             # -- DETECTED: Next Scenario, ScenarioOutline or Examples (or tags)
             return True
 
@@ -534,7 +754,7 @@ class Parser(object):
         * Scenario/ScenarioOutline statements (many)
         """
         # -- SIMILAR TO: action_feature()
-        line = line.strip()
+        line = line.stripped
         if self.subaction_detect_taggable_statement(line):
             # -- DETECTED: Next Rule, Scenario, ScenarioOutline (or tags)
             return True
@@ -559,7 +779,7 @@ class Parser(object):
         * next Scenario/ScenarioOutline
         """
         self.last_step_type = None
-        line = line.strip()
+        line = line.stripped
         step = self.parse_step(line)
         if step:
             # -- FIRST STEP DETECTED: End collection of description-part.
@@ -595,18 +815,7 @@ class Parser(object):
         """
         # pylint: disable=R0911
         #   R0911   Too many return statements (8/6)
-        stripped = line.lstrip()
-        # if self.statement.steps:
-        #     # -- ENSURE: Multi-line text follows a step.
-        #     if stripped.startswith('"""') or stripped.startswith("'''"):
-        #         # -- CASE: Multi-line text (docstring) after a step detected.
-        #         self.state = "multiline_text"
-        #         self.multiline_start = self.line
-        #         self.multiline_terminator = stripped[:3]
-        #         self.multiline_leading = line.index(stripped[0])
-        #         return True
-
-        if stripped.startswith('"""') or stripped.startswith("'''"):
+        if line.kind is LineKind.MULTILINE_QUOTES:
             # -- CASE: Multi-line text (docstring) after a step detected.
             # REQUIRE: Multi-line text follows a step.
             if not self.statement.steps:
@@ -616,21 +825,20 @@ class Parser(object):
 
             self.state = "multiline_text"
             self.multiline_start = self.line
-            self.multiline_terminator = stripped[:3]
-            self.multiline_leading = line.index(stripped[0])
+            self.multiline_terminator = line.stripped[:3]
+            self.multiline_leading = line.indent
             return True
 
-        line = line.strip()
-        step = self.parse_step(line)
+        step = self.parse_step(line.stripped)
         if step:
             self.statement.steps.append(step)
             return True
 
-        if self.subaction_detect_taggable_statement(line):
+        if self.subaction_detect_taggable_statement(line.stripped):
             # -- DETECTED: Next Scenario, ScenarioOutline or Examples (or tags)
             return True
 
-        if line.startswith("|"):
+        if line.kind is LineKind.TABLE_ROW:
             # -- CASE: TABLE-START detected for data-table of a step
             # OLD: assert self.statement.steps, "TABLE-START without step detected"
             if not self.statement.steps:
@@ -651,9 +859,9 @@ class Parser(object):
 
         Leading and trailing triple-quotes must be the same.
 
-        :param line:  Parsed line, as part of a multi-line text (as string).
+        :param line:  Parsed line, as part of a multi-line text (as ParserLine).
         """
-        if line.strip().startswith(self.multiline_terminator):
+        if line.stripped.startswith(self.multiline_terminator):
             # -- CASE: Handle the end of a multi-line text part.
             # Store the multi-line text in the step object (and continue).
             this_step = self.statement.steps[-1]
@@ -670,15 +878,16 @@ class Parser(object):
 
         # -- SPECIAL CASE: Strip trailing whitespace (whitespace normalization).
         # HINT: Required for Windows line-endings, like "\r\n", etc.
-        text_line = line[self.multiline_leading :].rstrip()
+        text = line.text
+        text_line = text[self.multiline_leading :].rstrip()
         self.lines.append(text_line)
 
         # -- BETTER DIAGNOSTICS: May remove non-whitespace in execute_steps()
-        removed_line_prefix = line[: self.multiline_leading]
-        if removed_line_prefix.strip():
+        if line.indent < self.multiline_leading and line.stripped:
+            removed_line_prefix = text[: self.multiline_leading]
             message = "BAD-INDENT in multiline text: "
             message += "Line '%s' would strip leading '%s'" % (
-                line,
+                text,
                 removed_line_prefix,
             )
             raise ParserError(message, self.line, self.filename)
@@ -690,8 +899,7 @@ class Parser(object):
         * Data table of a step (after the step line)
         * Examples table of a ScenarioOutline
         """
-        line = line.strip()
-        if not line.startswith("|"):
+        if line.kind is not LineKind.TABLE_ROW:
             # -- CASE: End-of-table detected
             if self.examples:
                 # -- CASE: Examples table of a ScenarioOutline
@@ -707,9 +915,12 @@ class Parser(object):
             # -- RESET: Parameters for parsing the next step(s).
             self.table = None
             self.state = "steps"
-            return self.action_steps(line)
+            # -- NOTE: Uses the stripped line (without indent), like before.
+            # A multi-line text after a table keeps its leading whitespace.
+            return self.action_steps(tokenize_line(line.stripped))
 
-        if not re.match(r"^(|.+)\|$", line):
+        line = line.stripped
+        if not self.table_row_pattern.match(line):
             logger = logging.getLogger("behave")
             logger.warning(
                 "Malformed table row at %s: line %i", self.feature.filename, self.line
@@ -719,7 +930,7 @@ class Parser(object):
         #    Search for pipe(s) that are not preceeded with an escape char.
         cells = [
             cell.replace("\\|", "|").strip()
-            for cell in re.split(r"(?<!\\)\|", line[1:-1])
+            for cell in self.table_cell_separator.split(line[1:-1])
         ]
         if self.table is None:
             # -- CASE: First row of the table
@@ -731,14 +942,32 @@ class Parser(object):
             self.table.add_row(cells, self.line)
         return True
 
+    # -- STATE TABLE: Action for each parser state (see: action()).
+    state_actions = {
+        "init": action_init,
+        "feature": action_feature,
+        "taggable_statement": action_taggable_statement,
+        "background": action_background,
+        "rule": action_rule,
+        "scenario": action_scenario,
+        "steps": action_steps,
+        "multiline_text": action_multiline_text,
+        "table": action_table,
+    }
+
+    @property
+    def keyword_matcher(self):
+        matcher = self._keyword_matcher
+        if matcher is None or matcher.keywords is not self.keywords:
+            matcher = KeywordMatcher.for_language(self.language, self.keywords)
+            self._keyword_matcher = matcher
+        return matcher
+
     def match_keyword(self, keyword, line):
         if not self.keywords:
             self.language = DEFAULT_LANGUAGE
             self.keywords = i18n.languages[DEFAULT_LANGUAGE]
-        for alias in self.keywords[keyword]:
-            if line.startswith(alias + ":"):
-                return alias
-        return False
+        return self.keyword_matcher.match_keyword(keyword, line) or False
 
     def parse_rule(self, text, filename=None):
         """Parse rule with optional background and scenario(s).
@@ -755,16 +984,8 @@ class Parser(object):
         self.statement = self.rule
         self.state = "rule"
 
-        for line in text.split("\n"):
-            self.line += 1
-            if not line.strip() and self.state != "multiline_text":
-                # -- SKIP EMPTY LINES, except in multiline string args.
-                continue
-            self.action(line)
-
+        self.process_lines(text.split("\n"))
         # -- FINALLY:
-        if self.table:
-            self.action_table("")
         steps = self.statement.steps
         return steps
 
@@ -793,39 +1014,38 @@ class Parser(object):
         return tags
 
     def parse_step(self, line):
-        for step_type in ("given", "when", "then", "and", "but"):
-            for kw in self.keywords[step_type]:
-                # try to match the keyword; also attempt a purely lowercase
-                # match if that'll work
-                if not (line.startswith(kw) or line.lower().startswith(kw.lower())):
-                    # -- CASE: Line does not start w/ a step-keyword.
-                    continue
-                # -- HINT: Trailing SPACE is used for most keywords.
-                # BUT: Keywords in some languages (like Chinese, Japanese, ...)
-                #      do not need a whitespace as word separator.
-                step_text_after_keyword = line[len(kw) :].strip()
-                if kw.startswith("*") and self.last_step_type:
-                    # -- CASE: Generic steps and Given/When/Then steps are mixed.
-                    # HINT: Inherit step type from last step.
-                    step_type = self.last_step_type
-                elif step_type in ("and", "but"):
-                    if not self.last_step_type:
-                        self.last_step_type = "when"
-                        # raise ParserError("No previous step", self.line, self.filename)
-                    step_type = self.last_step_type
-                else:
-                    self.last_step_type = step_type
-
-                keyword = kw.rstrip()  # HINT: Strip optional trailing SPACE.
-                step = model.Step(
-                    self.filename,
-                    self.line,
-                    keyword,
-                    step_type,
-                    step_text_after_keyword,
-                )
-                return step
-        return None
+        # -- NOTE: Matches keyword or its lowercase variant (in one pass).
+        matched = self.keyword_matcher.match_step(line)
+        if matched is None:
+            # -- CASE: Line does not start w/ a step-keyword.
+            return None
+
+        step_type, kw = matched
+        # -- HINT: Trailing SPACE is used for most keywords.
+        # BUT: Keywords in some languages (like Chinese, Japanese, ...)
+        #      do not need a whitespace as word separator.
+        step_text_after_keyword = line[len(kw) :].strip()
+        if kw.startswith("*") and self.last_step_type:
+            # -- CASE: Generic steps and Given/When/Then steps are mixed.
+            # HINT: Inherit step type from last step.
+            step_type = self.last_step_type
+        elif step_type in ("and", "but"):
+            if not self.last_step_type:
+                self.last_step_type = "when"
+                # raise ParserError("No previous step", self.line, self.filename)
+            step_type = self.last_step_type
+        else:
+            self.last_step_type = step_type
+
+        keyword = kw.rstrip()  # HINT: Strip optional trailing SPACE.
+        step = model.Step(
+            self.filename,
+            self.line,
+            keyword,
+            step_type,
+            step_text_after_keyword,
+        )
+        return step
 
     def parse_steps(self, text, filename=None):
         """Parse support for execute_steps() functionality that
@@ -845,15 +1065,120 @@ class Parser(object):
         self.statement = model.Scenario(filename, 0, "scenario", "")
         self.state = "steps"
 
-        for line in text.split("\n"):
-            self.line += 1
-            if not line.strip() and self.state != "multiline_text":
-                # -- SKIP EMPTY LINES, except in multiline string args.
-                continue
-            self.action(line)
-
+        self.process_lines(text.split("\n"))
         # -- FINALLY:
-        if self.table:
-            self.action_table("")
         steps = self.statement.steps
         return steps
+
+
+class TagScanner(object):
+    """Scans only the tag lines and the headers of a feature file
+    (Feature, Rule, Scenario, ScenarioOutline, Examples).
+
+    Provides the effective tags of each entity that is checked
+    by the tag expression (with tag inheritance from Feature and Rule).
+    The tags of the scenarios of a ScenarioOutline are provided per Examples.
+    Steps, tables and multi-line texts are skipped.
+
+    .. note:: The scanner does not validate the feature file.
+        If the tags cannot be determined without parsing the feature
+        (parametrized tags, bad tags, ...), None is returned.
+    """
+    header_keywords = ("rule", "scenario", "scenario_outline", "examples",
+                       "background")
+    statement_keywords = ("background", "scenario", "scenario_outline")
+
+    def __init__(self, language=None):
+        self.language = language or DEFAULT_LANGUAGE
+        self.keyword_matcher = None
+
+    def match_header(self, line, with_feature=False):
+        names = self.header_keywords
+        if with_feature:
+            names = ("feature",) + names
+        for name in names:
+            if self.keyword_matcher.match_keyword(name, line):
+                return name
+        return None
+
+    def is_step(self, line):
+        return self.keyword_matcher.match_step(line) is not None
+
+    def scan(self, text):
+        # pylint: disable=too-many-branches, too-many-return-statements
+        self.keyword_matcher = KeywordMatcher.for_language(self.language)
+        tag_sets = []
+        tags = []
+        feature_tags = None
+        container_tags = None
+        outline_tags = None
+        description = None
+        multiline_terminator = None
+        for line in text.split("\n"):
+            line = line.strip()
+            if multiline_terminator:
+                if line.startswith(multiline_terminator):
+                    multiline_terminator = None
+                continue
+            elif not line:
+                continue
+            elif line.startswith("#"):
+                # -- DETECT: language comment (at begin of feature file)
+                comment = line[1:].strip()
+                if (feature_tags is None and not tags and
+                        comment.lower().startswith("language:")):
+                    language = comment[9:].strip()
+                    if language not in i18n.languages:
+                        return None
+                    self.keyword_matcher = KeywordMatcher.for_language(language)
+                continue
+            elif line.startswith("@"):
+                for word in line.split():
+                    if word.startswith("@"):
+                        tags.append(word[1:])
+                    elif word.startswith("#"):
+                        break   # -- COMMENT: Skip rest of line.
+                    else:
+                        return None     # -- BAD-TAG: Reported by parser.
+                continue
+
+            header = self.match_header(line, with_feature=feature_tags is None)
+            if header:
+                if feature_tags is None and header != "feature":
+                    return None
+                if header == "feature":
+                    feature_tags = container_tags = set(tags)
+                    tag_sets.append(feature_tags)
+                elif header == "rule":
+                    container_tags = feature_tags.union(tags)
+                    tag_sets.append(container_tags)
+                elif header == "scenario":
+                    tag_sets.append(container_tags.union(tags))
+                elif header == "scenario_outline":
+                    if any(model.ScenarioOutlineBuilder.is_parametrized_tag(tag)
+                           for tag in tags):
+                        return None
+                    # -- NOTE: Scenarios of the outline use normalized tags.
+                    outline_tags = container_tags.union(tags)
+                    outline_tags.update(model.Tag.make_name(tag, unescape=True)
+                                        for tag in tags)
+                    tag_sets.append(container_tags.union(tags))
+                elif header == "examples":
+                    if outline_tags is None:
+                        return None
+                    tag_sets.append(outline_tags.union(tags))
+                elif tags:
+                    return None     # -- BACKGROUND: Supports no tags.
+                if header not in ("scenario_outline", "examples"):
+                    outline_tags = None
+                # -- NOTE: Description lines may start with triple-quotes.
+                description = None
+                if header != "examples":
+                    description = header
+                tags = []
+            elif description is None and line.startswith(('"""', "'''")):
+                multiline_terminator = line[:3]
+            elif description in self.statement_keywords and self.is_step(line):
+                # -- FIRST STEP: Ends description of Scenario, Background, ...
+                description = None
+        return tag_sets
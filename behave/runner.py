@@ -17,12 +17,21 @@ from behave._types import ExceptionUtil
 from behave.capture import CaptureController
 from behave.exception import ConfigError
 from behave.formatter._registry import make_formatters
+from behave.ledger import the_ledger
+from behave.model import make_columnar_tables
+from behave.parser import ParserError
 from behave.runner_util import (
     collect_feature_locations,
+    FeatureParseCache,
     parse_features,
+    iter_features,
+    iter_in_background,
     exec_file,
     load_step_modules,
     PathManager,
+    ScenarioTimings,
+    select_feature_locations_by_tags,
+    select_shard_features,
 )
 from behave.step_registry import registry as the_step_registry
 from enum import Enum
@@ -62,6 +71,23 @@ class ContextMode(Enum):
     USER = 2
 
 
+def _get_caller_location(depth=2):
+    """Provides the code location of a caller (cheap: without stack extraction).
+    The location is formatted later (if it is needed for a warning).
+
+    :param depth:   Number of frames to skip (1: caller of this function).
+    :return: Tuple (code, line) of the calling frame.
+    """
+    # pylint: disable=protected-access
+    frame = sys._getframe(depth)
+    return (frame.f_code, frame.f_lineno)
+
+
+def _make_location_params(location):
+    code, line = location
+    return {"filename": code.co_filename, "line": line, "function": code.co_name}
+
+
 class Context(object):
     """Hold contextual information during the running of tests.
 
@@ -171,6 +197,8 @@ class Context(object):
             "@layer": "testrun",
         }
         self._stack = [root_data]
+        # -- LOOKUP CACHE: attr => stack frames with this attr (top first).
+        self._lookup = {}
         self._record = {}
         self._origin = {}
         self._mode = ContextMode.BEHAVE
@@ -301,6 +329,7 @@ class Context(object):
         if layer:
             initial_data["@layer"] = layer
         self._stack.insert(0, initial_data)
+        self._lookup.clear()
 
     def _pop(self):
         """Pop the current layer from the context stack.
@@ -311,6 +340,7 @@ class Context(object):
         finally:
             # -- ENSURE: Layer is removed even if cleanup-errors occur.
             self._stack.pop(0)
+            self._lookup.clear()
 
     def _use_with_behave_mode(self):
         """Provides a context manager for using the context in BEHAVE mode."""
@@ -328,24 +358,33 @@ class Context(object):
         )
         return self.use_with_user_mode()
 
+    def _lookup_frames(self, attr):
+        """Provides the stack frames that contain an attribute (top first).
+        The result is cached until the attribute or the stack is modified.
+        """
+        frames = self._lookup.get(attr)
+        if frames is None:
+            frames = [frame for frame in self._stack if attr in frame]
+            self._lookup[attr] = frames
+        return frames
+
     def _set_root_attribute(self, attr, value):
-        for frame in self.__dict__["_stack"]:
-            if frame is self.__dict__["_root"]:
+        root_data = self.__dict__["_root"]
+        for frame in self._lookup_frames(attr):
+            if frame is root_data:
                 continue
-            if attr in frame:
-                record = self.__dict__["_record"][attr]
-                params = {
-                    "attr": attr,
-                    "filename": record[0],
-                    "line": record[1],
-                    "function": record[3],
-                }
-                self._emit_warning(attr, params)
-
-        self.__dict__["_root"][attr] = value
+            self._emit_warning(attr, self._make_warning_params(attr))
+
+        root_data[attr] = value
+        self._lookup.pop(attr, None)
         if attr not in self._origin:
             self._origin[attr] = self._mode
 
+    def _make_warning_params(self, attr):
+        params = _make_location_params(self._record[attr])
+        params["attr"] = attr
+        return params
+
     def _emit_warning(self, attr, params):
         msg = ""
         if (
@@ -388,9 +427,11 @@ class Context(object):
             except KeyError:
                 raise AttributeError(attr)
 
-        for frame in self._stack:
-            if attr in frame:
-                return frame[attr]
+        frames = self._lookup.get(attr)
+        if frames is None:
+            frames = self._lookup_frames(attr)
+        if frames:
+            return frames[0][attr]
         msg = "'{0}' object has no attribute '{1}'"
         msg = msg.format(self.__class__.__name__, attr)
         raise AttributeError(msg)
@@ -400,24 +441,19 @@ class Context(object):
             self.__dict__[attr] = value
             return
 
-        for frame in self._stack[1:]:
-            if attr in frame:
-                record = self._record[attr]
-                params = {
-                    "attr": attr,
-                    "filename": record[0],
-                    "line": record[1],
-                    "function": record[3],
-                }
-                self._emit_warning(attr, params)
-
-        stack_limit = 2
-        if six.PY2:
-            stack_limit += 1  # Due to traceback2 usage.
-        stack_frame = traceback.extract_stack(limit=stack_limit)[0]
-        self._record[attr] = stack_frame
-        frame = self._stack[0]
-        frame[attr] = value
+        top_frame = self._stack[0]
+        frames = self._lookup.get(attr)
+        if frames is None:
+            frames = self._lookup_frames(attr)
+        for frame in frames:
+            if frame is not top_frame:
+                self._emit_warning(attr, self._make_warning_params(attr))
+
+        # -- NOTE: Location of the caller is formatted only for warnings.
+        self._record[attr] = _get_caller_location()
+        top_frame[attr] = value
+        if not frames or frames[0] is not top_frame:
+            self._lookup[attr] = [top_frame] + frames
         if attr not in self._origin:
             self._origin[attr] = self._mode
 
@@ -426,6 +462,7 @@ class Context(object):
         if attr in frame:
             del frame[attr]
             del self._record[attr]
+            self._lookup.pop(attr, None)
         else:
             msg = "'{0}' object has no attribute '{1}' at the current level"
             msg = msg.format(self.__class__.__name__, attr)
@@ -434,10 +471,7 @@ class Context(object):
     def __contains__(self, attr):
         if attr[0] == "_":
             return attr in self.__dict__
-        for frame in self._stack:
-            if attr in frame:
-                return True
-        return False
+        return bool(self._lookup_frames(attr))
 
     def execute_steps(self, steps_text):
         """The steps identified in the "steps" text string will be parsed and
@@ -791,6 +825,9 @@ class ModelRunner(object):
             # REQUIRED-FOR: Summary to keep track of untested features.
             for reporter in self.config.reporters:
                 reporter.feature(feature)
+            if self.config.low_memory:
+                # -- LOW-MEMORY: Keep only status and timing data of feature.
+                feature.release_payload()
 
         # -- AFTER-ALL:
         # pylint: disable=protected-access, broad-except
@@ -807,6 +844,7 @@ class ModelRunner(object):
             formatter.close()
         for reporter in self.config.reporters:
             reporter.end()
+        the_ledger.close()
 
         failed = (
             (failed_count > 0)
@@ -839,6 +877,7 @@ class Runner(ModelRunner):
         super(Runner, self).__init__(config)
         self.path_manager = PathManager()
         self.base_dir = None
+        self.stream_error = None
 
     def setup_paths(self):
         # pylint: disable=too-many-branches, too-many-statements
@@ -963,6 +1002,72 @@ class Runner(ModelRunner):
     def feature_locations(self):
         return collect_feature_locations(self.config.paths)
 
+    def make_parse_cache(self):
+        """Provides the parse cache for feature files (if enabled)."""
+        if self.config.parse_cache:
+            return FeatureParseCache(self.config.parse_cache_dir)
+        return None
+
+    def can_select_features_by_tags(self):
+        """Indicates if feature files can be pre-selected by scanning their tags.
+        Feature files excluded by the tag expression are not parsed then.
+
+        .. note:: Excluded features are not reported as skipped.
+            Therefore, this is only used if enabled (with --scan-tags).
+        """
+        if not self.config.tags or not self.config.scan_tags:
+            return False
+        elif self.config.junit and self.config.userdata.getbool(
+                "behave.reporter.junit.show_skipped_always"):
+            return False
+        return True
+
+    def load_scenario_timings(self):
+        """Load the scenario durations of a previous test run (if any)."""
+        timing_file = self.config.timing_file
+        if timing_file and os.path.exists(timing_file):
+            return ScenarioTimings.from_json_file(
+                timing_file, default_duration=self.config.timing_default)
+        return None
+
+    def can_stream_features(self):
+        """Indicates if features are run while they are parsed (streaming).
+        Sharding needs all features in advance.
+        """
+        return bool(self.config.stream_features and not self.config.shard)
+
+    def stream_features(self, feature_locations):
+        """Parse features in the background and provide them one by one.
+        Each feature is added to ``self.features`` when it is provided.
+
+        .. note:: A parse error ends the stream (and is stored).
+            It is raised after the test run was ended (see: run_with_paths).
+        """
+        # -- NOTE: Features are parsed after the before_all hook, which may
+        #    change the current working directory. Use the directory from now
+        #    (as parse_features() does) for the filenames in the model.
+        features = iter_features(feature_locations, language=self.config.lang,
+                                 parse_cache=self.make_parse_cache(),
+                                 curdir=os.getcwd())
+        return self.iter_streamed_features(features)
+
+    def iter_streamed_features(self, features):
+        try:
+            for feature in iter_in_background(features):
+                if self.config.columnar_tables:
+                    make_columnar_tables([feature])
+                self.features.append(feature)
+                yield feature
+        except ParserError as e:
+            self.stream_error = e
+
+    def select_shard_features(self, features):
+        """Select the scenarios of this shard (see: --shard I/N)."""
+        shard_index, shard_count = self.config.shard
+        timings = self.load_scenario_timings()
+        return select_shard_features(features, shard_index, shard_count,
+                                     timings=timings)
+
     def run(self):
         with self.path_manager:
             self.setup_paths()
@@ -983,14 +1088,34 @@ class Runner(ModelRunner):
             for filename in self.feature_locations()
             if not self.config.exclude(filename)
         ]
-        features = parse_features(feature_locations, language=self.config.lang)
-        self.features.extend(features)
+        if self.can_select_features_by_tags():
+            feature_locations = select_feature_locations_by_tags(
+                feature_locations, self.config.tag_expression,
+                language=self.config.lang)
+        if self.can_stream_features():
+            # -- STREAMING: Run each feature as soon as it is parsed.
+            features = self.stream_features(feature_locations)
+        else:
+            features = parse_features(feature_locations,
+                                      language=self.config.lang,
+                                      parse_cache=self.make_parse_cache(),
+                                      jobs=self.config.jobs)
+            if self.config.columnar_tables:
+                make_columnar_tables(features)
+            if self.config.shard:
+                features = self.select_shard_features(features)
+            self.features.extend(features)
+            features = None
 
         # -- STEP: Run all features.
         stream_openers = self.config.outputs
         self.formatters = make_formatters(self.config, stream_openers)
         
-        return self.run_model()
+        failed = self.run_model(features)
+        if self.stream_error:
+            # -- STREAMING: Report parse error after after_all, reporters, ...
+            raise self.stream_error
+        return failed
 
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,992 @@
+# -*- coding: UTF-8 -*-
+"""
+Provides a test runner that runs features in parallel by using processes.
+
+Each worker process is forked from the runner process after the hooks and
+step definitions are loaded and the feature files are parsed.
+Therefore, a worker uses the same (parsed) model as the runner process.
+The worker runs a feature and sends back a compact result record:
+
+* the state of each model element (status, duration, error, captured, ...)
+* the recorded formatter events (as indices into the model elements)
+
+The runner process applies each result onto its own model and replays the
+formatter events in the original feature order.
+Therefore, formatters and reporters see one coherent event stream,
+like in a sequential test run.
+
+.. code-block:: sh
+
+    # -- USE: Runner alias "parallel" with 4 worker processes.
+    behave --runner=parallel --jobs=4 features/
+
+    # -- USE: Distribute single scenarios (instead of features).
+    behave --runner=parallel.scenario --jobs=4 features/
+
+.. note::
+
+    The :class:`ParallelRunner` executes the hooks ``before_all()`` and
+    ``after_all()`` once in each worker process (and not in the runner process).
+    The :class:`ScenarioParallelRunner` executes them in the runner process.
+    Platforms without :func:`os.fork()` fall back to a sequential test run.
+"""
+
+from __future__ import absolute_import, print_function
+import pickle
+import sys
+import traceback
+from six import text_type
+from six.moves import queue
+from behave.exception import InvalidFileLocationError
+from behave.ledger import the_ledger
+from behave.matchers import NoMatch
+from behave.model import Rule, Scenario, ScenarioOutline, Step
+from behave.model_core import Status
+# -- NOTE: Use the same step registry as the runner module (see: reset_runtime).
+from behave.runner import Context, ModelRunner, Runner, the_step_registry
+from behave.runner_util import (
+    FeatureLineDatabase, FileLocationParser,
+    estimate_feature_duration, schedule_longest_first
+)
+from behave.textutil import text as _text
+
+try:
+    import multiprocessing
+    _FORK_CONTEXT = multiprocessing.get_context("fork")
+except (AttributeError, ValueError):
+    # -- PYTHON2 OR NO FORK-SUPPORT (Windows):
+    _FORK_CONTEXT = None
+
+
+# -----------------------------------------------------------------------------
+# CONSTANTS:
+# -----------------------------------------------------------------------------
+#: Attributes that describe the test-run state of a model element.
+#: NOTE: exc_traceback is not transferred (traceback objects are not picklable).
+STATE_ATTRIBUTES = (
+    "_cached_status", "status", "should_skip", "skip_reason", "hook_failed",
+    "was_dry_run", "duration", "error_message", "exception", "_captured",
+    "run_starttime", "run_endtime",
+)
+
+
+# -----------------------------------------------------------------------------
+# UTILITY FUNCTIONS:
+# -----------------------------------------------------------------------------
+def can_run_in_parallel():
+    """Indicates if worker processes can be forked on this platform."""
+    return _FORK_CONTEXT is not None
+
+
+def iter_model_nodes(feature):
+    """Walks the model elements of a feature in a deterministic order.
+    This order is the same in the runner process and in a worker process.
+
+    .. note:: Lazy generator
+
+        The scenario state (use_background) must be known before its steps
+        are walked. Background steps are copied (lazily) for each scenario.
+    """
+    yield feature
+    if feature.background:
+        yield feature.background
+    for run_item in feature.walk_scenarios(with_outlines=True, with_rules=True):
+        yield run_item
+        if isinstance(run_item, Rule):
+            if run_item.background:
+                yield run_item.background
+        elif not isinstance(run_item, ScenarioOutline):
+            for step in run_item.all_steps:
+                yield step
+
+
+def iter_scenario_nodes(scenario):
+    """Walks a scenario and its steps (including background steps)."""
+    yield scenario
+    for step in scenario.all_steps:
+        yield step
+
+
+def select_rule_for(scenario):
+    """Selects the rule of a scenario (or ScenarioOutline row), if any."""
+    parent = scenario.parent
+    if isinstance(parent, ScenarioOutline):
+        parent = parent.parent
+    if isinstance(parent, Rule):
+        return parent
+    return None
+
+
+def make_picklable_exception(exception):
+    """Ensures that an exception can be sent to another process.
+    If the exception cannot be pickled (and unpickled), it is replaced by
+    an instance of its nearest builtin exception class with the same text.
+    """
+    if exception is None:
+        return None
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:   # pylint: disable=broad-except
+        pass
+
+    exception_class = Exception
+    for base_class in type(exception).__mro__:
+        if base_class.__module__ in ("builtins", "exceptions"):
+            exception_class = base_class
+            break
+    try:
+        return exception_class(_text(exception))
+    except Exception:   # pylint: disable=broad-except
+        return Exception(_text(exception))
+
+
+def get_node_data(node):
+    """Provides the instance attributes of a model element as dictionary.
+    Includes attributes that are stored in ``__slots__`` (like for steps).
+    """
+    node_data = dict(getattr(node, "__dict__", {}))
+    for cls in type(node).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in node_data and not name.startswith("__") \
+                    and hasattr(node, name):
+                node_data[name] = getattr(node, name)
+    return node_data
+
+
+def make_node_state(node):
+    state = {}
+    node_data = get_node_data(node)
+    for name in STATE_ATTRIBUTES:
+        if name in node_data:
+            value = node_data[name]
+            if name == "exception":
+                value = make_picklable_exception(value)
+            state[name] = value
+    if isinstance(node, Scenario):
+        state["use_background"] = node.use_background
+    return state
+
+
+def apply_node_state(node, state):
+    for name, value in state.items():
+        if name == "use_background":
+            if node.use_background != value:
+                node.use_background = value
+            continue
+        setattr(node, name, value)
+
+
+# -----------------------------------------------------------------------------
+# CLASSES:
+# -----------------------------------------------------------------------------
+class RecordingFormatter(object):
+    """Records the formatter events of a test run in a worker process.
+    The events are replayed later by the runner process.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def reset(self):
+        self.events = []
+
+    def record(self, name, *args):
+        self.events.append((name, args))
+
+    # -- FORMATTER API:
+    def uri(self, uri):
+        self.record("uri", uri)
+
+    def feature(self, feature):
+        self.record("feature", feature)
+
+    def rule(self, rule):
+        self.record("rule", rule)
+
+    def rule_finished(self):
+        self.record("rule_finished")
+
+    def background(self, background):
+        self.record("background", background)
+
+    def scenario(self, scenario):
+        self.record("scenario", scenario)
+
+    def step(self, step):
+        self.record("step", step)
+
+    def match(self, match):
+        self.record("match", match)
+
+    def result(self, step):
+        self.record("result", step)
+
+    def eof(self):
+        self.record("eof")
+
+    def close(self):
+        pass
+
+    def make_replay_events(self, nodes):
+        """Converts the recorded events into picklable replay events.
+        Model elements are referenced by their index in the nodes list.
+        A match event refers to the step of the next result event,
+        because the match is resolved again by the runner process.
+
+        :param nodes:   List of model elements (see: :func:`iter_model_nodes()`)
+        :return: List of replay events: ``(name, index_or_data)``
+        """
+        node_index = dict((id(node), index) for index, node in enumerate(nodes))
+        replay_events = []
+        for position, (name, args) in enumerate(self.events):
+            if not args:
+                replay_events.append((name, None))
+            elif name == "uri":
+                replay_events.append((name, args[0]))
+            elif name == "match":
+                step_index = None
+                for next_name, next_args in self.events[position + 1:]:
+                    if next_name == "result":
+                        step_index = node_index.get(id(next_args[0]))
+                        break
+                if step_index is not None:
+                    replay_events.append((name, step_index))
+            else:
+                index = node_index.get(id(args[0]))
+                if index is not None:
+                    replay_events.append((name, index))
+        return replay_events
+
+
+class FeatureResult(object):
+    """Result of a feature that was processed by a worker process."""
+
+    def __init__(self, index, was_run=False, failed=False):
+        self.index = index
+        self.was_run = was_run
+        self.failed = failed
+        self.states = []
+        self.events = []
+        self.undefined_steps = []
+
+
+class ScenarioResult(object):
+    """Result of a scenario (addressed by its file location)
+    that was processed by a worker process.
+    """
+
+    def __init__(self, location, worker_id, was_run=False, failed=False):
+        self.location = location
+        self.filename = FileLocationParser.parse(location).filename
+        self.worker_id = worker_id
+        self.was_run = was_run
+        self.failed = failed
+        self.states = []
+        self.events = []
+        self.undefined_steps = []
+
+
+class FeatureLeft(object):
+    """Sent by a worker process after it has left a feature
+    (and has called its after_feature hook).
+    Provides the hook failures of the feature and its rules.
+    """
+
+    def __init__(self, worker_id, filename, states=None):
+        self.worker_id = worker_id
+        self.filename = filename
+        self.states = states or {}
+
+
+class WorkerFinished(object):
+    """Last message of a worker process (sent after the after_all hook)."""
+
+    def __init__(self, worker_id, hook_failures=0, aborted=False,
+                 cleanups_failed=False, error=None):
+        self.worker_id = worker_id
+        self.hook_failures = hook_failures
+        self.aborted = aborted
+        self.cleanups_failed = cleanups_failed
+        self.error = error
+
+
+class ParallelRunner(Runner):
+    """Test runner that runs features in parallel in worker processes.
+    The number of worker processes is provided by ``config.jobs``.
+
+    If only one job is used (or processes cannot be forked),
+    the features are run sequentially (like :class:`behave.runner.Runner`).
+    """
+    poll_timeout = 0.5
+
+    def __init__(self, config):
+        super(ParallelRunner, self).__init__(config)
+        self.jobs = getattr(config, "jobs", 1) or 1
+        self.worker_problems = 0
+
+    def can_stream_features(self):
+        """Features are distributed to worker processes (needs all features)."""
+        return False
+
+    def run_model(self, features=None):
+        if features is None:
+            features = self.features
+        if self.jobs <= 1 or len(features) <= 1 or not can_run_in_parallel():
+            return super(ParallelRunner, self).run_model(features)
+        return self.run_model_in_parallel(features)
+
+    def run_model_in_parallel(self, features):
+        if not self.context:
+            self.context = Context(self)
+        if self.step_registry is None:
+            self.step_registry = the_step_registry
+
+        self.hook_failures = 0
+        self.worker_problems = 0
+        failed_count = 0
+        undefined_steps_initial_size = len(self.undefined_steps)
+        tasks = self.schedule_features(features)
+        workers, result_queue, stop_event = \
+            self.start_workers(self.run_worker, features, tasks)
+
+        # -- STEP: Collect results and report them in the original order.
+        pending_results = {}
+        next_index = 0
+        try:
+            for result in self.receive_results(workers, result_queue):
+                pending_results[result.index] = result
+                while next_index in pending_results:
+                    result = pending_results.pop(next_index)
+                    if self.report_feature(features[next_index], result):
+                        failed_count += 1
+                    next_index += 1
+        except KeyboardInterrupt:
+            self.stop_workers(workers, stop_event)
+            failed_count += 1
+
+        # -- STEP: Report remaining features (not run or lost).
+        for index in range(next_index, len(features)):
+            result = pending_results.pop(index, None)
+            if self.report_feature(features[index], result):
+                failed_count += 1
+        return self.finish_run(failed_count, undefined_steps_initial_size)
+
+    def schedule_features(self, features):
+        """Provides the processing order of the features (as indices).
+        If scenario timings of a previous test run exist, the features
+        are processed longest-processing-time-first.
+        Otherwise, the original order is used.
+        """
+        indices = list(range(len(features)))
+        timings = self.load_scenario_timings()
+        if timings is None:
+            return indices
+        return schedule_longest_first(
+            indices,
+            lambda index: estimate_feature_duration(features[index], timings))
+
+    def start_workers(self, target, features, tasks):
+        """Starts the worker processes (by using fork).
+
+        :param target:  Main function of a worker process.
+        :param features: Features to use (model of this process).
+        :param tasks:   Tasks for the workers (in processing order).
+        :return: Tuple (workers, result_queue, stop_event)
+        """
+        # -- ENSURE: Pending ledger entries are not inherited by the workers.
+        the_ledger.flush()
+        task_queue = _FORK_CONTEXT.Queue()
+        result_queue = _FORK_CONTEXT.Queue()
+        stop_event = _FORK_CONTEXT.Event()
+        for task in tasks:
+            task_queue.put(task)
+
+        workers = {}
+        for worker_id in range(min(self.jobs, len(tasks))):
+            task_queue.put(None)    # -- SENTINEL: One for each worker.
+            worker = _FORK_CONTEXT.Process(
+                target=target,
+                args=(worker_id, features, task_queue, result_queue, stop_event))
+            worker.daemon = True
+            worker.start()
+            workers[worker_id] = worker
+        return workers, result_queue, stop_event
+
+    def stop_workers(self, workers, stop_event):
+        stop_event.set()
+        self.abort(reason="KeyboardInterrupt")
+        for worker in workers.values():
+            worker.terminate()
+
+    def receive_results(self, workers, result_queue):
+        """Receives the results from the worker processes until all of them
+        are finished. The last message of each worker is processed here.
+
+        :return: Generator of results (as received).
+        """
+        finished_workers = set()
+        while len(finished_workers) < len(workers):
+            try:
+                message = result_queue.get(timeout=self.poll_timeout)
+            except queue.Empty:
+                for worker_id, worker in workers.items():
+                    if worker_id in finished_workers:
+                        continue
+                    if worker.exitcode not in (None, 0):
+                        # -- CRASHED: Worker died without a last message.
+                        sys.stderr.write(
+                            "PARALLEL-ERROR: worker-%d died (exitcode=%s)\n"
+                            % (worker_id, worker.exitcode))
+                        finished_workers.add(worker_id)
+                        self.worker_problems += 1
+                continue
+
+            if isinstance(message, WorkerFinished):
+                finished_workers.add(message.worker_id)
+                self.hook_failures += message.hook_failures
+                if message.error:
+                    sys.stderr.write(u"%s\n" % message.error)
+                    self.worker_problems += 1
+                if message.cleanups_failed:
+                    self.worker_problems += 1
+                if message.aborted:
+                    self.aborted = True
+                continue
+            yield message
+
+        for worker in workers.values():
+            worker.join()
+
+    def finish_run(self, failed_count, undefined_steps_initial_size):
+        if self.aborted:
+            sys.stderr.write("\nABORTED: By user.\n")
+        for formatter in self.formatters:
+            formatter.close()
+        for reporter in self.config.reporters:
+            reporter.end()
+        the_ledger.close()
+
+        failed = (
+            (failed_count > 0)
+            or self.aborted
+            or (self.hook_failures > 0)
+            or (len(self.undefined_steps) > undefined_steps_initial_size)
+            or (self.worker_problems > 0)
+        )
+        return failed
+
+    def report_feature(self, feature, result):
+        """Applies the result of a worker process onto the feature,
+        replays its formatter events and reports it.
+
+        :param feature: Feature to report (model element of this process).
+        :param result:  FeatureResult of this feature (or None, if lost).
+        :return: True, if feature failed. False, otherwise.
+        """
+        failed = False
+        if result is not None and result.was_run:
+            nodes = self.apply_result(iter_model_nodes(feature), result)
+            self.replay_events(result.events, nodes)
+            failed = result.failed
+
+        # -- ALWAYS: Report run/not-run feature to reporters.
+        for reporter in self.config.reporters:
+            reporter.feature(feature)
+        if self.config.low_memory:
+            # -- LOW-MEMORY: Keep only status and timing data of feature.
+            feature.release_payload()
+        return failed
+
+    def apply_result(self, node_iterator, result):
+        """Applies the model element states of a result (in walk order).
+
+        :param node_iterator: Walks the model elements of this process.
+        :param result:  Result of a worker process.
+        :return: List of model elements (that were updated).
+        """
+        nodes = []
+        for state in result.states:
+            node = next(node_iterator)
+            apply_node_state(node, state)
+            nodes.append(node)
+
+        for undefined_step in result.undefined_steps:
+            if isinstance(undefined_step, int):
+                undefined_step = nodes[undefined_step]
+            self.undefined_steps.append(undefined_step)
+        return nodes
+
+    def replay_events(self, events, nodes):
+        for name, data in events:
+            if data is None or name == "uri":
+                args = () if data is None else (data,)
+            elif name == "match":
+                match = self.step_registry.find_match(nodes[data])
+                args = (match or NoMatch(),)
+            else:
+                args = (nodes[data],)
+            self.notify_formatters(name, *args)
+
+    def notify_formatters(self, name, *args):
+        for formatter in self.formatters:
+            formatter_callback = getattr(formatter, name, None)
+            if formatter_callback:
+                formatter_callback(*args)
+
+    # -- WORKER PROCESS:
+    def run_worker(self, worker_id, features, task_queue, result_queue,
+                   stop_event):
+        """Main function of a worker process (after fork)."""
+        # pylint: disable=broad-except
+        error = None
+        cleanups_failed = False
+        try:
+            recorder = RecordingFormatter()
+            self.formatters = [recorder]
+            self.context = Context(self)
+            self.hook_failures = 0
+            self.setup_capture()
+            self.run_hook("before_all", self.context)
+
+            while True:
+                index = task_queue.get()
+                if index is None:
+                    break
+                if self.aborted or stop_event.is_set():
+                    result_queue.put(FeatureResult(index, was_run=False))
+                    continue
+
+                result = self.run_feature_in_worker(features[index], index,
+                                                    recorder)
+                result_queue.put(result)
+                if result.failed and (self.config.stop or self.aborted):
+                    stop_event.set()
+
+            self.run_hook("after_all", self.context)
+            try:
+                self.context._do_cleanups()  # pylint: disable=protected-access
+            except Exception:
+                cleanups_failed = True
+        except KeyboardInterrupt:
+            stop_event.set()
+        except Exception:
+            error = u"PARALLEL-ERROR in worker-%d:\n%s" % \
+                    (worker_id, _text(traceback.format_exc()))
+        self.finish_worker(worker_id, result_queue, cleanups_failed, error)
+
+    def finish_worker(self, worker_id, result_queue, cleanups_failed=False,
+                      error=None):
+        the_ledger.close()
+        result_queue.put(WorkerFinished(worker_id,
+                                        hook_failures=self.hook_failures,
+                                        aborted=self.aborted,
+                                        cleanups_failed=cleanups_failed,
+                                        error=error))
+        result_queue.close()
+        result_queue.join_thread()
+
+    def run_feature_in_worker(self, feature, index, recorder):
+        recorder.reset()
+        undefined_steps_initial_size = len(self.undefined_steps)
+        self.feature = feature
+        recorder.uri(feature.filename)
+        try:
+            failed = feature.run(self)
+        except KeyboardInterrupt:
+            self.abort(reason="KeyboardInterrupt")
+            failed = True
+
+        nodes = list(iter_model_nodes(feature))
+        result = FeatureResult(index, was_run=True, failed=failed)
+        self.store_result(result, nodes, recorder, undefined_steps_initial_size)
+        return result
+
+    def store_result(self, result, nodes, recorder, undefined_steps_initial_size):
+        result.states = [make_node_state(node) for node in nodes]
+        result.events = recorder.make_replay_events(nodes)
+        node_index = dict((id(node), position)
+                          for position, node in enumerate(nodes))
+        for step in self.undefined_steps[undefined_steps_initial_size:]:
+            position = node_index.get(id(step))
+            if position is None:
+                # -- CASE: Undefined step in context.execute_steps()
+                position = self.make_transferable_step(step)
+            result.undefined_steps.append(position)
+
+    @staticmethod
+    def make_transferable_step(step):
+        assert isinstance(step, Step)
+        try:
+            pickle.dumps(step)
+            return step
+        except Exception:   # pylint: disable=broad-except
+            return Step(step.filename, step.line, step.keyword,
+                        step.step_type, step.name)
+
+
+class ScenarioParallelRunner(ParallelRunner):
+    """Test runner that distributes single scenarios to worker processes.
+    Each scenario (or ScenarioOutline row) is addressed by its file location
+    (as "{filename}:{line}") and is selected by a :class:`FeatureLineDatabase`.
+
+    The ``before_all()`` hook is run once in the runner process before the
+    worker processes are forked (its state is shared copy-on-write).
+    A worker runs the ``before_feature()`` hook (and ``before_rule()`` hook)
+    lazily when it sees a scenario of this feature (or rule) for the first
+    time and runs the ``after_feature()`` hook when it switches to another
+    feature (or finishes). The ``after_all()`` hook is run in the runner
+    process after all workers are finished.
+
+    .. code-block:: sh
+
+        behave --runner=parallel.scenario --jobs=4 features/
+    """
+
+    def __init__(self, config):
+        super(ScenarioParallelRunner, self).__init__(config)
+        self.line_databases = {}
+        self.replay_buffer = {}
+        self.current_feature = None
+        self.current_rule = None
+        self.hooks_called = {}
+
+    def run_model(self, features=None):
+        if features is None:
+            features = self.features
+        if self.jobs <= 1 or not can_run_in_parallel():
+            return ModelRunner.run_model(self, features)
+        return self.run_model_in_parallel(features)
+
+    def make_scenario_locations(self, features):
+        """Provides the file locations of all scenarios (in run order)."""
+        locations = []
+        for feature in features:
+            for scenario in feature.walk_scenarios():
+                locations.append(text_type(scenario.location))
+        return locations
+
+    def schedule_scenarios(self, features):
+        """Provides the processing order of the scenarios (as locations).
+        If scenario timings of a previous test run exist, the scenarios
+        are processed longest-processing-time-first.
+        Otherwise, the original order is used.
+
+        .. note::
+
+            The longest-first order does not keep the scenarios of a feature
+            together. Therefore, a worker may run the feature hooks
+            more often (each time it switches back to a feature).
+        """
+        locations = self.make_scenario_locations(features)
+        timings = self.load_scenario_timings()
+        if timings is None:
+            return locations
+        return schedule_longest_first(locations, timings.get)
+
+    def select_scenario(self, features, location):
+        """Selects a scenario by using its file location.
+
+        :param features:    Features of the test run.
+        :param location:    Scenario location (as string: "{filename}:{line}")
+        :return: Tuple (feature, scenario)
+        :raises InvalidFileLocationError: If location selects no scenario
+            (or more than one).
+        """
+        file_location = FileLocationParser.parse(location)
+        line_database = self.line_databases.get(file_location.filename)
+        if line_database is None:
+            for feature in features:
+                self.line_databases[feature.filename] = \
+                    FeatureLineDatabase.make(feature)
+            line_database = self.line_databases.get(file_location.filename)
+        scenarios = []
+        if line_database is not None:
+            scenarios = line_database.select_scenarios_by_line(file_location.line)
+        if len(scenarios) != 1:
+            msg = u"%s selects %d scenarios (expected: 1)" % \
+                  (location, len(scenarios))
+            raise InvalidFileLocationError(msg)
+        return line_database.entity, scenarios[0]
+
+    def run_model_in_parallel(self, features):
+        # pylint: disable=too-many-branches, too-many-locals
+        if not self.context:
+            self.context = Context(self)
+        if self.step_registry is None:
+            self.step_registry = the_step_registry
+
+        context = self.context
+        self.hook_failures = 0
+        self.worker_problems = 0
+        self.setup_capture()
+        self.run_hook("before_all", context)
+
+        failed_count = 0
+        undefined_steps_initial_size = len(self.undefined_steps)
+        locations = self.schedule_scenarios(features)
+        if locations and not self.aborted:
+            # -- FORK: After before_all hook (and with its context state).
+            workers, result_queue, stop_event = \
+                self.start_workers(self.run_worker, features, locations)
+
+            # -- STEP: Collect results and report complete features in order.
+            feature_index = dict((feature.filename, index)
+                                 for index, feature in enumerate(features))
+            expected_counts = [len(feature.walk_scenarios())
+                               for feature in features]
+            received_counts = [0] * len(features)
+            open_workers = [set() for _ in features]
+            next_index = 0
+            try:
+                for message in self.receive_results(workers, result_queue):
+                    index = feature_index[message.filename]
+                    feature = features[index]
+                    if isinstance(message, FeatureLeft):
+                        self.apply_feature_left(feature, message)
+                        open_workers[index].discard(message.worker_id)
+                    else:
+                        self.apply_scenario_result(features, message)
+                        received_counts[index] += 1
+                        if message.was_run:
+                            open_workers[index].add(message.worker_id)
+
+                    while (next_index < len(features) and
+                           received_counts[next_index] == expected_counts[next_index] and
+                           not open_workers[next_index]):
+                        if self.report_feature_of_scenarios(features[next_index]):
+                            failed_count += 1
+                        next_index += 1
+            except KeyboardInterrupt:
+                self.stop_workers(workers, stop_event)
+                failed_count += 1
+        else:
+            next_index = 0
+
+        # -- STEP: Report remaining features (not run or incomplete).
+        for feature in features[next_index:]:
+            if self.report_feature_of_scenarios(feature):
+                failed_count += 1
+
+        # -- AFTER-ALL:
+        # pylint: disable=protected-access, broad-except
+        self.run_hook("after_all", context)
+        try:
+            context._do_cleanups()  # Without dropping the last context layer.
+        except Exception:
+            self.worker_problems += 1
+        return self.finish_run(failed_count, undefined_steps_initial_size)
+
+    def apply_scenario_result(self, features, result):
+        if not result.was_run:
+            return
+        _, scenario = self.select_scenario(features, result.location)
+        nodes = self.apply_result(iter_scenario_nodes(scenario), result)
+        self.replay_buffer[id(scenario)] = (result.events, nodes)
+
+    @staticmethod
+    def apply_feature_left(feature, message):
+        """Merges the hook failures of feature/rule hooks (of all workers)."""
+        containers = [feature] + list(feature.iter_rules())
+        for index, state in message.states.items():
+            container = containers[index]
+            if not state.get("hook_failed"):
+                continue
+            container.hook_failed = True
+            if not container.error_message:
+                container.error_message = state.get("error_message")
+                container.exception = state.get("exception")
+
+    def report_feature_of_scenarios(self, feature):
+        """Replays the formatter events of a feature (in the original order)
+        where the scenario events are provided by the worker processes.
+
+        :return: True, if feature failed. False, otherwise.
+        """
+        scenarios = feature.walk_scenarios()
+        was_run = any(id(scenario) in self.replay_buffer
+                      for scenario in scenarios)
+        if was_run or not (scenarios or self.aborted):
+            self.notify_formatters("uri", feature.filename)
+            self.replay_container(feature)
+
+        for container in [feature] + list(feature.iter_rules()):
+            container.clear_status()    # -- ENFORCE: compute_status()
+            for outline in container.run_items:
+                if isinstance(outline, ScenarioOutline):
+                    outline.clear_status()
+
+        # -- ALWAYS: Report run/not-run feature to reporters.
+        for reporter in self.config.reporters:
+            reporter.feature(feature)
+        if self.config.low_memory:
+            # -- LOW-MEMORY: Keep only status and timing data of feature.
+            feature.release_payload()
+        return feature.status == Status.failed
+
+    def replay_container(self, container):
+        """Emulates the formatter protocol of ScenarioContainer.run()."""
+        entity_name = container.type
+        show_entity = (container.should_run(self.config) or
+                       self.config.show_skipped)
+        if show_entity:
+            self.notify_formatters(entity_name, container)
+            if container.background:
+                self.notify_formatters("background", container.background)
+
+        for run_item in container.run_items:
+            if isinstance(run_item, Rule):
+                self.replay_container(run_item)
+                continue
+            scenarios = [run_item]
+            if isinstance(run_item, ScenarioOutline):
+                scenarios = run_item.scenarios
+            for scenario in scenarios:
+                events_and_nodes = self.replay_buffer.pop(id(scenario), None)
+                if events_and_nodes:
+                    self.replay_events(*events_and_nodes)
+
+        if show_entity:
+            callback_name = "{0}_finished".format(entity_name)
+            if entity_name == "feature":
+                callback_name = "eof"
+            self.notify_formatters(callback_name)
+
+    # -- WORKER PROCESS:
+    def run_worker(self, worker_id, features, task_queue, result_queue,
+                   stop_event):
+        """Main function of a worker process (after fork).
+        The context (and its before_all state) is inherited from the runner.
+        """
+        # pylint: disable=broad-except
+        error = None
+        try:
+            recorder = RecordingFormatter()
+            self.formatters = [recorder]
+            self.hook_failures = 0
+            self.current_feature = None
+            self.current_rule = None
+            while True:
+                location = task_queue.get()
+                if location is None:
+                    break
+                feature, scenario = self.select_scenario(features, location)
+                if self.aborted or stop_event.is_set():
+                    result_queue.put(ScenarioResult(location, worker_id))
+                    continue
+
+                self.enter_feature_and_rule(feature, scenario, worker_id,
+                                            result_queue)
+                result = self.run_scenario_in_worker(feature, scenario,
+                                                     location, worker_id,
+                                                     recorder)
+                result_queue.put(result)
+                if result.failed and (self.config.stop or self.aborted):
+                    stop_event.set()
+            self.leave_feature(worker_id, result_queue)
+        except KeyboardInterrupt:
+            stop_event.set()
+        except InvalidFileLocationError as e:
+            error = u"PARALLEL-ERROR in worker-%d: %s" % (worker_id, _text(e))
+        except Exception:
+            error = u"PARALLEL-ERROR in worker-%d:\n%s" % \
+                    (worker_id, _text(traceback.format_exc()))
+        # -- NOTE: Context cleanups of before_all belong to the runner process.
+        self.finish_worker(worker_id, result_queue, error=error)
+
+    def enter_feature_and_rule(self, feature, scenario, worker_id, result_queue):
+        rule = select_rule_for(scenario)
+        if feature is not self.current_feature:
+            self.leave_feature(worker_id, result_queue)
+            self.current_feature = feature
+            self.feature = feature
+            self.enter_container(feature)
+        if rule is not self.current_rule:
+            self.leave_rule()
+            if rule is not None:
+                self.current_rule = rule
+                self.enter_container(rule)
+
+    def leave_feature(self, worker_id, result_queue):
+        feature = self.current_feature
+        if feature is None:
+            return
+        self.leave_rule()
+        self.leave_container(feature)
+        containers = [feature] + list(feature.iter_rules())
+        states = {}
+        for index, container in enumerate(containers):
+            if container.hook_failed:
+                states[index] = make_node_state(container)
+        result_queue.put(FeatureLeft(worker_id, feature.filename, states))
+        self.current_feature = None
+
+    def leave_rule(self):
+        if self.current_rule is not None:
+            self.leave_container(self.current_rule)
+            self.current_rule = None
+
+    def enter_container(self, container):
+        """Emulates the entry part of ScenarioContainer.run()."""
+        # pylint: disable=protected-access
+        entity_name = container.type
+        self.context._push(layer=entity_name)
+        self.context.tags = set(container.tags)
+        container._setup_context_for_run(self.context)
+        container.hook_failed = False
+
+        hooks_called = False
+        if not self.config.dry_run and container.should_run(self.config):
+            hooks_called = True
+            for tag in container.tags:
+                self.run_hook("before_tag", self.context, tag)
+            self.run_hook("before_{0}".format(entity_name), self.context,
+                          container)
+        self.hooks_called[id(container)] = hooks_called
+
+    def leave_container(self, container):
+        """Emulates the exit part of ScenarioContainer.run()."""
+        # pylint: disable=protected-access, broad-except
+        entity_name = container.type
+        if self.hooks_called.pop(id(container), False):
+            self.run_hook("after_{0}".format(entity_name), self.context,
+                          container)
+            for tag in container.tags:
+                self.run_hook("after_tag", self.context, tag)
+        try:
+            self.context._pop()
+        except Exception:
+            # -- CLEANUP-ERROR:
+            container.hook_failed = True
+
+    def run_scenario_in_worker(self, feature, scenario, location, worker_id,
+                               recorder):
+        # pylint: disable=protected-access
+        recorder.reset()
+        undefined_steps_initial_size = len(self.undefined_steps)
+        result = ScenarioResult(location, worker_id, was_run=True)
+        containers = [feature, self.current_rule]
+        if any(container and container.hook_failed for container in containers):
+            # -- SKIP: Scenario remains untested (like in a sequential run).
+            result.was_run = False
+            return result
+
+        run_item = scenario
+        if isinstance(scenario.parent, ScenarioOutline):
+            run_item = scenario.parent
+        if self.config.name and not run_item.should_run_with_name_select(self.config):
+            scenario.mark_skipped()
+        else:
+            if run_item is not scenario:
+                self.context._set_root_attribute("active_outline", scenario._row)
+            try:
+                result.failed = scenario.run(self)
+            except KeyboardInterrupt:
+                self.abort(reason="KeyboardInterrupt")
+                result.failed = True
+            if run_item is not scenario:
+                self.context._set_root_attribute("active_outline", None)
+
+        nodes = list(iter_scenario_nodes(scenario))
+        self.store_result(result, nodes, recorder, undefined_steps_initial_size)
+        return result
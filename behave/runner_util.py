@@ -8,12 +8,23 @@ Contains utility functions and classes for Runners.
 
 from __future__ import absolute_import, print_function
 from bisect import bisect
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import glob
+import hashlib
+import heapq
+import io
+import json
+import multiprocessing
 import os.path
 import re
 import sys
+import threading
+import time
+import zlib
+import six
 from six import string_types
+from six.moves import cPickle as pickle
+from six.moves import queue
 
 from behave import parser
 # pylint: disable=redefined-builtin
@@ -22,11 +33,24 @@ from behave.exception import (
     InvalidFileLocationError, InvalidFilenameError
 )
 # pylint: enable=redefined-builtin
-from behave.model_core import FileLocation
+from behave.model_core import FileLocation, posixpath_normalize
+from behave.ledger import replace_file
 from behave.model import Feature, Rule, ScenarioOutline, Scenario
-from behave.textutil import ensure_stream_with_encoder
+from behave.version import VERSION as BEHAVE_VERSION
+from behave.textutil import ensure_stream_with_encoder, text as _text
 # LAZY: from behave.step_registry import setup_step_decorators
 
+# -- PARALLEL PARSING: Use worker processes only for many feature files.
+PARALLEL_PARSE_MIN_FILES = 16
+try:
+    _PARSE_POOL_CONTEXT = multiprocessing.get_context("fork")
+except (AttributeError, ValueError):
+    # -- PLATFORM: Python 2 or without os.fork() support.
+    _PARSE_POOL_CONTEXT = None
+
+# -- STREAMING: Number of features that are parsed ahead (in the background).
+FEATURE_STREAM_BUFFER_SIZE = 8
+
 
 # -----------------------------------------------------------------------------
 # CLASS: FileLocationParser
@@ -462,10 +486,326 @@ class PathManager(object):
             self.paths.append(path)
 
 
+class ScenarioTimings(object):
+    """Provides the historical durations of scenarios (by scenario location).
+    The durations are read from the output of the "json" formatter
+    of a previous test run.
+
+    Scenarios without a known duration use the default duration
+    (which is the mean duration of the known scenarios, if not provided).
+    """
+    default_duration_without_data = 1.0
+
+    def __init__(self, durations=None, default_duration=None):
+        self.durations = dict(durations or {})
+        if default_duration is None:
+            default_duration = self.mean_duration()
+        self.default_duration = default_duration
+
+    def __len__(self):
+        return len(self.durations)
+
+    def __contains__(self, location):
+        return make_scenario_location_key(location) in self.durations
+
+    def mean_duration(self):
+        if not self.durations:
+            return self.default_duration_without_data
+        return sum(self.durations.values()) / len(self.durations)
+
+    def get(self, location, default=None):
+        """Provides the duration of a scenario by using its location.
+
+        :param location:  Scenario location (as FileLocation or string).
+        :return: Duration (in seconds) or default duration, if unknown.
+        """
+        if default is None:
+            default = self.default_duration
+        return self.durations.get(make_scenario_location_key(location), default)
+
+    def estimate(self, scenario):
+        """Estimates the duration of a scenario."""
+        return self.get(scenario.location)
+
+    @classmethod
+    def from_json_data(cls, json_data, default_duration=None):
+        durations = {}
+        for feature_data in json_data:
+            for element in feature_data.get("elements", []):
+                if element.get("type") != "scenario":
+                    continue
+                if element.get("status") not in ("passed", "failed"):
+                    continue    # -- NOT-RUN: Duration is not representative.
+                duration = 0.0
+                for step_data in element.get("steps", []):
+                    duration += step_data.get("result", {}).get("duration", 0.0)
+                durations[make_scenario_location_key(element["location"])] = duration
+        return cls(durations, default_duration=default_duration)
+
+    @classmethod
+    def from_json_file(cls, filename, default_duration=None):
+        """Reads the scenario durations from a "json" formatter output file."""
+        with io.open(filename, encoding="UTF-8") as f:
+            json_data = json.load(f)
+        return cls.from_json_data(json_data, default_duration=default_duration)
+
+
+class FeatureParseCache(object):
+    """Persistent cache of parsed feature files (as pickled model objects).
+
+    A cache entry is used if the feature file is unchanged.
+    The file is unchanged if its modification time and size are the same
+    (or its content hash, if mtime/size changed).
+    Entries also depend on the behave version, the model (pickle) version,
+    the language and the current working directory (filenames in the model
+    are relative to it). A ``curdir`` parameter overrides the current
+    working directory (see: :func:`iter_features()`).
+
+    .. code-block:: python
+
+        parse_cache = FeatureParseCache(".behave_cache")
+        feature = parse_cache.parse_file("features/alice.feature")
+        parse_cache.prune()     # -- REMOVE: Entries of deleted feature files.
+    """
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+    # -- NOTE: Increment if the pickled model classes change (like __slots__).
+    model_version = 5
+
+    def __init__(self, directory=".behave_cache"):
+        self.directory = os.path.join(directory, "features")
+        self.used_entries = set()
+
+    def make_entry_path(self, filename, language=None, curdir=None):
+        curdir = curdir or os.getcwd()
+        key = u"\0".join([filename, curdir, language or u""])
+        digest = hashlib.sha1(key.encode("UTF-8")).hexdigest()
+        return os.path.join(self.directory, "%s.pickle" % digest)
+
+    @classmethod
+    def make_header(cls, filename, language, file_info):
+        mtime, size, content_hash = file_info
+        return dict(filename=filename, language=language,
+                    mtime=mtime, size=size, content_hash=content_hash,
+                    behave_version=BEHAVE_VERSION,
+                    model_version=cls.model_version, checked=time.time())
+
+    @classmethod
+    def is_compatible(cls, header):
+        """Checks if a cache entry was created by this behave version."""
+        return bool(header and
+                    header.get("behave_version") == BEHAVE_VERSION and
+                    header.get("model_version") == cls.model_version)
+
+    @staticmethod
+    def is_unchanged(header, stat):
+        # -- NOTE: A file that was modified shortly before it was checked
+        #    may be modified again without changing its mtime (racy file).
+        return (header["mtime"] == stat.st_mtime and
+                header["size"] == stat.st_size and
+                header["mtime"] < header["checked"] - 2.0)
+
+    @staticmethod
+    def read_entry(entry_path):
+        """Read the header of a cache entry and the pickled feature data.
+
+        :return: Tuple (header, feature_data) or (None, None).
+        """
+        # pylint: disable=broad-except
+        try:
+            with open(entry_path, "rb") as f:
+                header = pickle.load(f)
+                return header, f.read()
+        except Exception:
+            # -- CASE: Missing or corrupted cache entry.
+            return None, None
+
+    def write_entry(self, entry_path, header, feature_data):
+        temp_path = "%s.%d.tmp" % (entry_path, os.getpid())
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            with open(temp_path, "wb") as f:
+                pickle.dump(header, f, self.pickle_protocol)
+                f.write(feature_data)
+            replace_file(temp_path, entry_path)
+        except (IOError, OSError):
+            pass    # -- GRACEFULLY IGNORED: Cache is not writable.
+
+    def lookup(self, filename, language=None, curdir=None):
+        """Provides the cached feature if the feature file is unchanged.
+
+        :param filename:  Feature filename.
+        :param language:  Default language to use.
+        :param curdir:    Directory the model filenames are relative to.
+        :return: Tuple (found, feature).
+        """
+        filename = make_abspath(filename, curdir)
+        entry_path = self.make_entry_path(filename, language, curdir)
+        self.used_entries.add(entry_path)
+        header, feature_data = self.read_entry(entry_path)
+        if not self.is_compatible(header):
+            return False, None
+
+        stat = os.stat(filename)
+        if self.is_unchanged(header, stat):
+            # -- FAST PATH: Feature file is unchanged.
+            return True, pickle.loads(feature_data)
+
+        with open(filename, "rb") as f:
+            content_hash = hashlib.sha1(f.read()).hexdigest()
+        if header["content_hash"] != content_hash:
+            return False, None
+
+        # -- CASE: Feature file was touched but its content is unchanged.
+        file_info = (stat.st_mtime, stat.st_size, content_hash)
+        header = self.make_header(filename, language, file_info)
+        self.write_entry(entry_path, header, feature_data)
+        return True, pickle.loads(feature_data)
+
+    def store(self, filename, language, feature, file_info, curdir=None):
+        """Store a parsed feature in the cache.
+
+        :param filename:  Feature filename.
+        :param language:  Default language that was used.
+        :param feature:   Parsed feature (or None).
+        :param file_info: Tuple (mtime, size, content_hash) of parsed file.
+        :param curdir:    Directory the model filenames are relative to.
+        """
+        filename = make_abspath(filename, curdir)
+        entry_path = self.make_entry_path(filename, language, curdir)
+        self.used_entries.add(entry_path)
+        header = self.make_header(filename, language, file_info)
+        feature_data = pickle.dumps(feature, self.pickle_protocol)
+        self.write_entry(entry_path, header, feature_data)
+
+    def parse_file(self, filename, language=None, curdir=None):
+        """Parse a feature file or use the cached feature if it is unchanged.
+
+        :param filename:  Feature filename to parse.
+        :param language:  Default language to use.
+        :param curdir:    Directory the model filenames are relative to.
+        :return: Feature object (or None, for a file without feature).
+        """
+        found, feature = self.lookup(filename, language, curdir)
+        if not found:
+            feature, file_info = parse_feature_file(filename, language, curdir)
+            self.store(filename, language, feature, file_info, curdir)
+        return feature
+
+    def prune(self):
+        """Remove the cache entries of feature files that no longer exist
+        (or that were created by another behave version).
+        """
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            entry_path = os.path.join(self.directory, name)
+            if entry_path in self.used_entries:
+                continue
+            header, _ = self.read_entry(entry_path)
+            if self.is_compatible(header) and os.path.exists(header["filename"]):
+                continue
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+
 # -----------------------------------------------------------------------------
 # FUNCTIONS:
 # -----------------------------------------------------------------------------
-def parse_features(feature_files, language=None):
+def make_abspath(filename, curdir=None):
+    """Same as :func:`os.path.abspath()`, but relative to ``curdir``
+    (if it is provided) instead of the current working directory.
+    """
+    if curdir is None:
+        return os.path.abspath(filename)
+    return os.path.normpath(os.path.join(curdir, filename))
+
+
+def parse_feature_file(filename, language=None, curdir=None):
+    """Parse a feature file and provide information about the parsed file
+    (used by the parse cache and parse workers).
+
+    :param filename:  Feature filename to parse.
+    :param language:  Default language to use.
+    :param curdir:    Directory the model filenames are relative to.
+    :return: Tuple (feature, file_info) with file_info=(mtime, size, content_hash)
+    """
+    # -- NOTE: File is checked before it is read (in case it is modified).
+    stat = os.stat(filename)
+    with open(filename, "rb") as f:
+        data = f.read()
+    feature = parser.parse_feature(data.decode("utf8"), language,
+                                   parser.make_model_filename(filename, curdir))
+    file_info = (stat.st_mtime, stat.st_size, hashlib.sha1(data).hexdigest())
+    return feature, file_info
+
+
+def parse_feature_file_task(args):
+    """Parse task of a parse worker process (args: filename, language, curdir)."""
+    return parse_feature_file(*args)
+
+
+def parse_feature_files_in_parallel(filenames, language=None, parse_cache=None,
+                                    jobs=1, curdir=None):
+    """Parse feature files with a pool of worker processes.
+    Features from the parse cache are not parsed again.
+
+    :param filenames: List of feature filenames to parse.
+    :param language:  Default language to use.
+    :param parse_cache: Optional parse cache (:class:`FeatureParseCache`).
+    :param jobs:      Number of worker processes to use.
+    :param curdir:    Directory the model filenames are relative to.
+    :return: List of (filename, feature) tuples (in the order of filenames).
+    """
+    features = [None] * len(filenames)
+    tasks = []
+    task_indexes = []
+    for index, filename in enumerate(filenames):
+        if parse_cache:
+            found, feature = parse_cache.lookup(filename, language, curdir)
+            if found:
+                features[index] = feature
+                continue
+        tasks.append((filename, language, curdir))
+        task_indexes.append(index)
+
+    if tasks:
+        processes = min(count_parse_processes(jobs), len(tasks))
+        chunksize = max(1, len(tasks) // (processes * 4))
+        pool = _PARSE_POOL_CONTEXT.Pool(processes)
+        try:
+            results = pool.map(parse_feature_file_task, tasks, chunksize)
+        finally:
+            pool.terminate()
+            pool.join()
+        for index, (feature, file_info) in zip(task_indexes, results):
+            features[index] = feature
+            if parse_cache:
+                parse_cache.store(filenames[index], language, feature,
+                                  file_info, curdir)
+    return list(zip(filenames, features))
+
+
+def count_parse_processes(jobs):
+    """Number of parser processes to use (limited by the number of CPUs)."""
+    try:
+        cpu_count = multiprocessing.cpu_count()
+    except NotImplementedError:
+        cpu_count = 1
+    return min(jobs, cpu_count)
+
+
+def can_parse_in_parallel(jobs, file_count):
+    # -- NOTE: Workers send their features back (pickled) to this process.
+    #    Without several CPUs, this is slower than parsing sequentially.
+    return (count_parse_processes(jobs) > 1 and
+            file_count >= PARALLEL_PARSE_MIN_FILES and
+            _PARSE_POOL_CONTEXT is not None)
+
+
+def parse_features(feature_files, language=None, parse_cache=None, jobs=1):
     """
     Parse feature files and return list of Feature model objects.
     Handles:
@@ -475,38 +815,185 @@ def parse_features(feature_files, language=None):
 
     :param feature_files: List of feature file names to parse.
     :param language:      Default language to use.
+    :param parse_cache:   Optional parse cache (:class:`FeatureParseCache`).
+    :param jobs:          Number of parse worker processes (if many files).
     :return: List of feature objects.
     """
-    scenario_collector = FeatureScenarioLocationCollector2()
-    features = []
+    return list(iter_features(feature_files, language=language,
+                              parse_cache=parse_cache, jobs=jobs))
+
+
+def iter_features(feature_files, language=None, parse_cache=None, jobs=1,
+                  curdir=None):
+    """
+    Parse feature files and yield the Feature model objects (one by one).
+    A feature is provided as soon as all its file locations are processed
+    (see: :func:`parse_features()`).
+
+    .. note:: Use ``curdir`` if the current working directory may change
+        while the features are parsed (like: by hooks, while streaming).
+
+    :param feature_files: List of feature file names to parse.
+    :param language:      Default language to use.
+    :param parse_cache:   Optional parse cache (:class:`FeatureParseCache`).
+    :param jobs:          Number of parse worker processes (if many files).
+    :param curdir:        Directory that relative feature file names
+                          (and model filenames) are relative to
+                          (default: current working directory).
+    :return: Iterator of feature objects.
+    """
+    locations = []
     for location in feature_files:
         if not isinstance(location, FileLocation):
             assert isinstance(location, string_types)
             location = FileLocation(os.path.normpath(location))
+        locations.append(location)
+
+    # -- PARALLEL PARSING: Parse each file of consecutive locations once
+    #    (as the sequential parsing below does) in worker processes.
+    parsed_features = deque()
+    if jobs > 1:
+        filenames = [make_abspath(location.filename, curdir)
+                     for index, location in enumerate(locations)
+                     if index == 0 or
+                     location.filename != locations[index-1].filename]
+        if can_parse_in_parallel(jobs, len(filenames)):
+            parsed_features.extend(parse_feature_files_in_parallel(
+                filenames, language, parse_cache=parse_cache, jobs=jobs,
+                curdir=curdir))
 
+    scenario_collector = FeatureScenarioLocationCollector2()
+    for location in locations:
         if location.filename == scenario_collector.filename:
             scenario_collector.add_location(location)
             continue
         if scenario_collector.feature:
-            # -- NEW FEATURE DETECTED: Add current feature.
+            # -- NEW FEATURE DETECTED: Provide current feature.
             current_feature = scenario_collector.build_feature()
-            features.append(current_feature)
             scenario_collector.clear()
+            yield current_feature
 
         # -- NEW FEATURE:
         assert isinstance(location, FileLocation)
-        filename = os.path.abspath(location.filename)
-        feature = parser.parse_file(filename, language=language)
+        filename = make_abspath(location.filename, curdir)
+        if parsed_features and parsed_features[0][0] == filename:
+            feature = parsed_features.popleft()[1]
+        elif parse_cache:
+            feature = parse_cache.parse_file(filename, language=language,
+                                             curdir=curdir)
+        else:
+            feature = parser.parse_file(filename, language=language,
+                                        curdir=curdir)
         if feature:
             # -- VALID FEATURE:
             # SKIP CORNER-CASE: Feature file without any feature(s).
             scenario_collector.feature = feature
             scenario_collector.add_location(location)
     # -- FINALLY:
+    if parse_cache:
+        parse_cache.prune()
     if scenario_collector.feature:
-        current_feature = scenario_collector.build_feature()
-        features.append(current_feature)
-    return features
+        yield scenario_collector.build_feature()
+
+
+def iter_in_background(iterator, buffer_size=FEATURE_STREAM_BUFFER_SIZE):
+    """Consumes an iterator in a background thread and provides its items
+    (in the same order). The background thread runs ahead of the caller
+    by (at most) ``buffer_size`` items. An exception that is raised by the
+    iterator is raised again (in the caller thread) when its turn comes.
+
+    .. code-block:: python
+
+        features = iter_features(feature_locations)
+        for feature in iter_in_background(features):
+            feature.run(runner)     # -- MEANWHILE: Next features are parsed.
+
+    :param iterator:    Iterator (or iterable) to consume.
+    :param buffer_size: Maximal number of items that are provided in advance.
+    :return: Iterator of the items.
+    """
+    items = queue.Queue(maxsize=max(1, buffer_size))
+    stopped = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        # pylint: disable=broad-except
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception:
+            put((done, sys.exc_info()))
+        else:
+            put((done, None))
+
+    thread = threading.Thread(target=produce, name="behave.iter_in_background")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exc_info = items.get()
+            if item is done:
+                if exc_info:
+                    six.reraise(*exc_info)
+                return
+            yield item
+    finally:
+        # -- CASE: Caller stops early (or abort) => Stop background thread.
+        stopped.set()
+
+
+def feature_file_may_run_with_tags(filename, tag_expression, language=None):
+    """Checks if a feature file contains a feature, rule or scenario that
+    should run with the tag expression (by scanning only its tags).
+
+    :param filename:  Feature filename to check.
+    :param tag_expression:  Tag expression to use.
+    :param language:  Default language to use.
+    :return: False, if the feature file is excluded by the tag expression.
+    """
+    with open(filename, "rb") as f:
+        data = f.read().decode("utf8")
+    tag_sets = parser.parse_feature_tags(data, language)
+    if tag_sets is None:
+        # -- CASE: Tags are only known after parsing (parametrized tags, ...).
+        return True
+    return any(tag_expression.check(tags) for tags in tag_sets)
+
+
+def select_feature_locations_by_tags(locations, tag_expression, language=None):
+    """Select the locations of feature files that may contain features
+    or scenarios that should run with the tag expression.
+    Feature files are scanned only once (for consecutive locations).
+
+    :param locations: List of feature file locations (or filenames).
+    :param tag_expression:  Tag expression to use.
+    :param language:  Default language to use.
+    :return: List of selected locations (in the same order).
+    """
+    selected = []
+    last_filename = None
+    may_run = False
+    for location in locations:
+        filename = location
+        if isinstance(location, FileLocation):
+            filename = location.filename
+        if filename != last_filename:
+            last_filename = filename
+            may_run = feature_file_may_run_with_tags(filename, tag_expression,
+                                                     language)
+        if may_run:
+            selected.append(location)
+    return selected
 
 
 def collect_feature_locations(paths, strict=True):
@@ -546,6 +1033,121 @@ def collect_feature_locations(paths, strict=True):
     return locations
 
 
+def make_scenario_location_key(location):
+    """Makes a platform-independent key for a scenario location.
+
+    :param location:  Scenario location (as FileLocation or string).
+    :return: Location key (as string), like: "features/alice.feature:10"
+    """
+    return posixpath_normalize(_text(location))
+
+
+def estimate_feature_duration(feature, timings):
+    """Estimates the duration of a feature (as sum of its scenarios)."""
+    return sum(timings.estimate(scenario)
+               for scenario in feature.walk_scenarios())
+
+
+def schedule_longest_first(items, estimate):
+    """Orders work items longest-processing-time-first (LPT).
+    Items with the same estimated duration keep their original order.
+
+    :param items:       Work items (features, scenarios, ...).
+    :param estimate:    Function that estimates the duration of an item.
+    :return: Work items in processing order (as list).
+    """
+    return sorted(items, key=lambda item: -estimate(item))
+
+
+def select_shard_by_hash(location_key, shard_count):
+    """Selects a shard for a scenario by using a stable hash of its location.
+    The hash value is the same for each process and node (unlike: hash()).
+
+    :return: Shard number (as 0-based index).
+    """
+    checksum = zlib.crc32(location_key.encode("UTF-8")) & 0xffffffff
+    return checksum % shard_count
+
+
+def assign_shards_by_duration(scenarios, shard_count, timings):
+    """Assigns scenarios to shards by using their historical duration.
+    Uses the greedy longest-processing-time-first algorithm:
+    The next longest scenario is assigned to the shard with the least load.
+
+    :param scenarios:   Scenarios to assign.
+    :param shard_count: Number of shards.
+    :param timings:     Historical scenario durations (as ScenarioTimings).
+    :return: Shard assignment (as dict: location_key -> 0-based shard index).
+    """
+    items = []
+    for scenario in scenarios:
+        location_key = make_scenario_location_key(scenario.location)
+        items.append((-timings.get(location_key), location_key))
+    items.sort()
+
+    shard_loads = [(0.0, shard_index) for shard_index in range(shard_count)]
+    assignments = {}
+    for negated_duration, location_key in items:
+        shard_load, shard_index = heapq.heappop(shard_loads)
+        assignments[location_key] = shard_index
+        heapq.heappush(shard_loads, (shard_load - negated_duration, shard_index))
+    return assignments
+
+
+def select_shard_features(features, shard_index, shard_count, timings=None):
+    """Selects the scenarios of one shard (test-run part of a CI node).
+    The shards are disjoint and all shards together cover all scenarios.
+    Unselected scenarios of a feature are marked as skipped
+    (like a select-by-location). Features without any selected scenario
+    are removed.
+
+    If timings are provided, the shards are balanced by the historical
+    duration of the scenarios. Otherwise, the location of a scenario is
+    hashed to select its shard.
+
+    :param features:    Features (after parsing).
+    :param shard_index: Shard to select (as 1-based index: 1 <= I <= N).
+    :param shard_count: Number of shards (N).
+    :param timings:     Historical scenario durations (optional).
+    :return: Features of this shard (as list).
+    """
+    assert 1 <= shard_index <= shard_count
+    assignments = None
+    if timings is not None:
+        all_scenarios = []
+        for feature in features:
+            all_scenarios.extend(feature.walk_scenarios())
+        assignments = assign_shards_by_duration(all_scenarios, shard_count,
+                                                timings)
+
+    def select_shard_for(location):
+        location_key = make_scenario_location_key(location)
+        if assignments is not None:
+            return assignments[location_key]
+        return select_shard_by_hash(location_key, shard_count)
+
+    this_shard = shard_index - 1
+    selected_features = []
+    for feature in features:
+        scenarios = feature.walk_scenarios()
+        if not scenarios:
+            # -- SPECIAL CASE: Feature without scenarios
+            if select_shard_by_hash(make_scenario_location_key(
+                    feature.location), shard_count) == this_shard:
+                selected_features.append(feature)
+            continue
+
+        selected_count = 0
+        for scenario in scenarios:
+            if select_shard_for(scenario.location) == this_shard:
+                selected_count += 1
+            else:
+                scenario.mark_skipped()
+        if selected_count:
+            selected_features.append(feature)
+    return selected_features
+
+
 def exec_file(filename, globals_=None, locals_=None):
     if globals_ is None:
         globals_ = {}
@@ -6,7 +6,10 @@ step implementations (step definitions). This is necessary to execute steps.
 """
 
 from __future__ import absolute_import
-from behave.matchers import Match, make_matcher
+from collections import OrderedDict
+import copy
+import six
+from behave.matchers import Match, Matcher, MatchWithError, make_matcher
 from behave.textutil import text as _text
 
 # limit import * to just the decorators
@@ -24,7 +27,94 @@ class AmbiguousStep(ValueError):
     pass
 
 
+# -- ARGUMENT VALUES: That can be shared between matches of the match cache.
+IMMUTABLE_VALUE_TYPES = six.string_types + six.integer_types + (
+    six.text_type, six.binary_type, float, complex, bool, type(None))
+
+
+def has_immutable_arguments(match):
+    if not isinstance(match, Match):
+        return False    # -- CASE: Unknown match class (of other matchers).
+    return all(isinstance(argument.value, IMMUTABLE_VALUE_TYPES)
+               for argument in match.arguments or ())
+
+
+def make_index_key(text):
+    """Make the index key for a literal prefix (or step name).
+    Only the ASCII part is used (case-insensitive) to keep the index simple.
+    """
+    for index, char in enumerate(text):
+        if ord(char) > 127:
+            text = text[:index]
+            break
+    return text.lower()
+
+
+class StepDefinitionIndex(object):
+    """Trie index over the literal prefixes of step definitions
+    (of one step type).
+
+    It provides the candidates that may match a step name
+    (in the order of the step definitions).
+    Step definitions without literal prefix are always candidates.
+    """
+    ENTRIES = None  # -- NODE-KEY: Entries that end in this trie node.
+
+    def __init__(self, step_definitions=()):
+        self.step_definitions = step_definitions
+        self.root = {}
+        self.size = 0
+        for step_definition in step_definitions:
+            self.add(step_definition)
+
+    @staticmethod
+    def get_literal_prefix(step_definition):
+        prefix = getattr(step_definition, "literal_prefix", None)
+        if not isinstance(prefix, six.string_types):
+            return u""  # -- CASE: Unknown step definition (matcher) class.
+        return prefix
+
+    def add(self, step_definition):
+        node = self.root
+        for char in make_index_key(self.get_literal_prefix(step_definition)):
+            node = node.setdefault(char, {})
+        entries = node.setdefault(self.ENTRIES, [])
+        entries.append((self.size, step_definition))
+        self.size += 1
+
+    def find_candidates(self, step_name):
+        """Provides the step definitions that may match the step name.
+
+        :param step_name:  Step name to use.
+        :return: List of step definitions (in registration order).
+        """
+        node = self.root
+        entries = list(node.get(self.ENTRIES, ()))
+        for char in step_name:
+            if ord(char) > 127:
+                if len(node) > (self.ENTRIES in node):
+                    # -- CASE-INSENSITIVE MATCHING: Non-ASCII may match ASCII.
+                    return list(self.step_definitions)
+                break
+            node = node.get(char.lower())
+            if node is None:
+                break
+            entries.extend(node.get(self.ENTRIES, ()))
+        entries.sort(key=lambda entry: entry[0])
+        return [step_definition for _, step_definition in entries]
+
+
 class StepRegistry(object):
+    """Registry of step definitions (as matchers) for each step type.
+
+    Step definitions are indexed by their literal prefix.
+    Results of :meth:`find_match()` are cached for each ``(step_type, name)``.
+    The match cache is invalidated when step definitions or types are
+    registered (or when the step definition lists are replaced/extended).
+    """
+    match_cache_size = 10000
+    _NOT_CACHED = object()
+
     def __init__(self):
         self.steps = {
             "given": [],
@@ -32,6 +122,9 @@ class StepRegistry(object):
             "then": [],
             "step": [],
         }
+        self.match_cache = OrderedDict()
+        self.match_cache_key = None
+        self.step_indexes = {}
 
     @staticmethod
     def same_step_definition(step, other_pattern, other_location):
@@ -49,7 +142,12 @@ class StepRegistry(object):
                 # -- EXACT-STEP: Same step function is already registered.
                 # This may occur when a step module imports another one.
                 return
-            elif existing.match(step_text):     # -- SIMPLISTIC
+
+        # -- NOTE: Only step definitions with matching literal prefix
+        #    can match the new step text (checked in registration order).
+        candidates = self.get_step_index(step_type).find_candidates(step_text)
+        for existing in candidates:
+            if existing.match(step_text):     # -- SIMPLISTIC
                 message = u"%s has already been defined in\n  existing step %s"
                 new_step = u"@%s('%s')" % (step_type, step_text)
                 existing.step_type = step_type
@@ -57,34 +155,102 @@ class StepRegistry(object):
                 existing_step += u" at %s" % existing.location
                 raise AmbiguousStep(message % (new_step, existing_step))
         step_definitions.append(make_matcher(func, step_text))
+        self.clear_match_cache()
 
-    def find_step_definition(self, step):
-        candidates = self.steps[step.step_type]
-        more_steps = self.steps["step"]
-        if step.step_type != "step" and more_steps:
-            # -- ENSURE: self.step_type lists are not modified/extended.
-            candidates = list(candidates)
-            candidates += more_steps
+    def get_step_index(self, step_type):
+        step_definitions = self.steps[step_type]
+        step_index = self.step_indexes.get(step_type)
+        if (step_index is None or
+            step_index.step_definitions is not step_definitions or
+            step_index.size > len(step_definitions)):
+            # -- REBUILD INDEX: Step definitions were replaced.
+            step_index = StepDefinitionIndex(step_definitions)
+            self.step_indexes[step_type] = step_index
+        elif step_index.size < len(step_definitions):
+            # -- UPDATE INDEX: Step definitions were added.
+            for step_definition in step_definitions[step_index.size:]:
+                step_index.add(step_definition)
+        return step_index
+
+    def find_candidates(self, step):
+        """Provides the step definitions that may match the step
+        (in the order they must be checked; generic steps are last).
+        """
+        candidates = self.get_step_index(step.step_type).find_candidates(step.name)
+        if step.step_type != "step" and self.steps["step"]:
+            candidates += self.get_step_index("step").find_candidates(step.name)
+        return candidates
 
+    def find_step_definition(self, step):
+        candidates = self.find_candidates(step)
         for step_definition in candidates:
             if step_definition.match(step.name):
                 return step_definition
         return None
 
+    def clear_match_cache(self):
+        self.match_cache.clear()
+        self.match_cache_key = None
+
+    def make_match_cache_key(self):
+        # -- DETECT: Changed types and direct changes of the step lists.
+        steps_key = tuple((step_type, id(step_definitions), len(step_definitions))
+                          for step_type, step_definitions in self.steps.items())
+        return (Matcher.types_version, steps_key)
+
     def find_match(self, step):
-        candidates = self.steps[step.step_type]
-        more_steps = self.steps["step"]
-        if step.step_type != "step" and more_steps:
-            # -- ENSURE: self.step_type lists are not modified/extended.
-            candidates = list(candidates)
-            candidates += more_steps
+        """Find the step definition that matches the step.
+        Matches are cached for the same step type and step name
+        (except matches with type conversion errors).
+        Each step gets its own match and argument objects.
+        If a type-converted argument value may be mutable, the step name is
+        matched again by the cached step definition (to convert it again).
+
+        :param step:    Step (model element) to match.
+        :return: Match object (or None, if no step definition matches).
+        """
+        cache_key = self.make_match_cache_key()
+        if cache_key != self.match_cache_key:
+            self.match_cache.clear()
+            self.match_cache_key = cache_key
 
+        key = (step.step_type, step.name)
+        entry = self.match_cache.pop(key, self._NOT_CACHED)
+        if entry is not self._NOT_CACHED:
+            self.match_cache[key] = entry   # -- MARK: Most recently used.
+            step_definition, match, shareable = entry
+            if match is None:
+                return None
+            elif not shareable:
+                return step_definition.match(step.name)
+            # -- ENSURE: Each step gets its own match and argument objects.
+            arguments = match.arguments
+            if arguments is not None:
+                arguments = [copy.copy(argument) for argument in arguments]
+            return match.with_arguments(arguments)
+
+        step_definition, match = self.find_step_definition_and_match(step)
+        if not isinstance(match, MatchWithError):
+            # -- NOT CACHED: Type conversion errors may depend on side-effects.
+            if len(self.match_cache) >= self.match_cache_size:
+                self.match_cache.popitem(last=False)   # -- LEAST RECENTLY USED
+            shareable = match is None or has_immutable_arguments(match)
+            self.match_cache[key] = (step_definition, match, shareable)
+        return match
+
+    def find_step_definition_and_match(self, step):
+        """Provides the first step definition that matches the step
+        and its match result (or (None, None) if no step definition matches).
+        """
+        candidates = self.find_candidates(step)
         for step_definition in candidates:
             result = step_definition.match(step.name)
             if result:
-                return result
+                return step_definition, result
+        return None, None
 
-        return None
+    def find_match_without_cache(self, step):
+        return self.find_step_definition_and_match(step)[1]
 
     def make_decorator(self, step_type):
         def decorator(step_text):
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the model elements (steps of scenario outlines).
+
+Parses a generated feature with a scenario outline (with many example rows),
+builds the steps of all its scenarios and measures the memory per step.
+
+EXAMPLE:
+
+    python bin/behave.model_benchmark.py --rows=10000
+
+REQUIRES: Python >= 3.4 (tracemalloc)
+"""
+
+from __future__ import absolute_import, print_function
+import argparse
+import gc
+import os.path
+import sys
+import time
+import tracemalloc
+
+# -- ENSURE: Use local path during development.
+HERE = os.path.dirname(__file__)
+TOP = os.path.join(HERE, "..")
+if os.path.isdir(os.path.join(TOP, "behave")):
+    sys.path.insert(0, os.path.abspath(TOP))
+
+from behave.parser import parse_feature  # noqa: E402
+
+__status__ = "prototype"
+
+NAME = os.path.basename(__file__)
+VERSION = "0.1.0"
+
+FEATURE_TEMPLATE = u'''\
+Feature: Model benchmark
+
+  Background:
+    Given a step passes
+
+  Scenario Outline: Person <name> is <age> years old
+    Given a person named "<name>"
+    When the person is <age> years old
+    Then the person is an <category>
+    And the person has the data:
+      | name   | age   |
+      | <name> | <age> |
+
+    Examples:
+      | name | age | category |
+{rows}
+'''
+
+
+def make_feature_text(rows_count):
+    rows = [u"      | Alice_%d | %d | adult |" % (index, index % 100)
+            for index in range(rows_count)]
+    return FEATURE_TEMPLATE.format(rows=u"\n".join(rows))
+
+
+def measure_model_memory(rows_count):
+    """Build all steps of the scenario outline and measure its memory.
+
+    :return: Tuple (steps_count, used_memory, duration)
+    """
+    feature = parse_feature(make_feature_text(rows_count))
+    scenario_outline = feature.scenarios[0]
+    gc.collect()
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start_time = time.time()
+    steps_count = 0
+    for scenario in scenario_outline.scenarios:
+        steps_count += len(list(scenario.all_steps))
+    duration = time.time() - start_time
+    gc.collect()
+    used_memory = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+    return steps_count, used_memory, duration
+
+
+def main(args=None):
+    """Measure the memory that is used per step (of scenario outlines)."""
+    if args is None:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog=NAME,
+                                     description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000,
+                        help="Number of example rows (default: %(default)s).")
+    parser.add_argument("--version", action="version", version=VERSION)
+    options = parser.parse_args(args)
+
+    steps_count, used_memory, duration = measure_model_memory(options.rows)
+    print("Built %d steps in %.3f seconds: %.1f MB (%d bytes/step)" % (
+        steps_count, duration, used_memory / 1e6, used_memory // steps_count))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Benchmark for the feature file parser.
+
+Generates a corpus of feature files (with backgrounds, scenario outlines,
+tables and multi-line texts) and measures how long it takes to parse them.
+
+EXAMPLE:
+
+    python bin/behave.parser_benchmark.py --lines=100000
+"""
+
+from __future__ import absolute_import, print_function, with_statement
+import argparse
+import io
+import os.path
+import shutil
+import sys
+import tempfile
+import time
+
+# -- ENSURE: Use local path during development.
+HERE = os.path.dirname(__file__)
+TOP = os.path.join(HERE, "..")
+if os.path.isdir(os.path.join(TOP, "behave")):
+    sys.path.insert(0, os.path.abspath(TOP))
+
+from behave.parser import parse_file  # noqa: E402
+
+__status__ = "prototype"
+
+NAME = os.path.basename(__file__)
+VERSION = "0.1.0"
+
+FEATURE_TEMPLATE = u'''\
+@feature.{index}
+Feature: Feature {index}
+  As a tester
+  I want a realistic feature file
+
+  Background:
+    Given a step passes
+
+  @scenario.{index}
+  Scenario: Scenario {index}.1
+    Given a step passes
+    When a step passes with:
+      | name  | value |
+      | Alice | 1     |
+      | Bob   | 2     |
+    Then a step passes with text:
+      """
+      Lorem ipsum dolor sit amet,
+      consectetur adipiscing elit.
+      """
+
+  # -- COMMENT: Scenario outline follows.
+  Scenario Outline: Scenario {index}.2 with <name>
+    Given a person named "<name>"
+    When the person is <age> years old
+    Then the person is an <category>
+
+    Examples:
+      | name  | age | category |
+      | Alice | 42  | adult    |
+      | Bob   | 11  | child    |
+'''
+
+
+def make_corpus(directory, lines_count):
+    """Generate feature files with (at least) the number of lines."""
+    feature_lines = FEATURE_TEMPLATE.count(u"\n")
+    files_count = max(1, (lines_count + feature_lines - 1) // feature_lines)
+    filenames = []
+    for index in range(files_count):
+        filename = os.path.join(directory, "feature_%05d.feature" % index)
+        with io.open(filename, "w", encoding="UTF-8") as f:
+            f.write(FEATURE_TEMPLATE.format(index=index))
+        filenames.append(filename)
+    return filenames, files_count * feature_lines
+
+
+def measure_parse_time(filenames, repeat=3):
+    """Parse all files (repeatedly) and return the best duration."""
+    best_duration = None
+    for _ in range(repeat):
+        start_time = time.time()
+        for filename in filenames:
+            parse_file(filename)
+        duration = time.time() - start_time
+        if best_duration is None or duration < best_duration:
+            best_duration = duration
+    return best_duration
+
+
+def main(args=None):
+    """Benchmark the parser with a generated corpus of feature files."""
+    if args is None:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog=NAME,
+                                     description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100000,
+                        help="Number of lines in the corpus (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of parse runs (best is used).")
+    parser.add_argument("--version", action="version", version=VERSION)
+    options = parser.parse_args(args)
+
+    directory = tempfile.mkdtemp(prefix="behave_parser_benchmark_")
+    try:
+        filenames, lines_count = make_corpus(directory, options.lines)
+        duration = measure_parse_time(filenames, options.repeat)
+    finally:
+        shutil.rmtree(directory)
+
+    print("Parsed %d files with %d lines in %.3f seconds (%.0f lines/second)" % (
+        len(filenames), lines_count, duration, lines_count / duration))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,7 +33,6 @@ import os.path
 import sys
 from codecs import open
 from urllib.request import urlopen
-import pprint
 import json
 import argparse
 import six
@@ -144,12 +143,69 @@ Gherkin keywords in the different I18N languages, like:
 * French
 * German
 * ...
+
+The keywords of each language are stored as compact JSON text.
+They are only decoded when ``languages[language]`` is accessed first.
 """
 
-from __future__ import unicode_literals
+from __future__ import absolute_import, unicode_literals
+import json
+try:
+    from collections.abc import MutableMapping
+except ImportError:     # pragma: no cover
+    from collections import MutableMapping  # pylint: disable=deprecated-class
+
+
+class LanguageMapping(MutableMapping):
+    """Mapping from language (ISO code) to its keywords.
+    The keywords of a language are decoded on first access (and cached).
+    Assigned keywords replace the keywords of a language (or add a language).
+
+    .. code-block:: python
+
+        keywords = languages["de"]      # -- DECODED: Only German keywords.
+        name, native = languages.names["de"]
+        languages["xx"] = dict(name="Example", native="Example", ...)
+    """
+
+    def __init__(self, data, names):
+        self.data = data
+        self.names = names
+        self._keywords = {{}}
+
+    def __getitem__(self, language):
+        keywords = self._keywords.get(language)
+        if keywords is None:
+            keywords = json.loads(self.data[language])
+            self._keywords[language] = keywords
+        return keywords
+
+    def __setitem__(self, language, keywords):
+        # -- NOTE: Assigned keywords are used as they are (not encoded).
+        self.data[language] = None
+        self._keywords[language] = keywords
+        self.names[language] = (keywords.get("name", language),
+                                keywords.get("native", language))
+
+    def __delitem__(self, language):
+        del self.data[language]
+        self._keywords.pop(language, None)
+        self.names.pop(language, None)
+
+    def __contains__(self, language):
+        return language in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
 
-languages = \\
 '''.format(gherkin_languages_json_url=GHERKIN_LANGUAGES_JSON_URL, encoding=encoding)
+    footer = u"""
+languages = LanguageMapping(language_data, language_names)
+"""
 
     if not output_file or output_file in ("-", "stdout"):
         i18n_py = sys.stdout
@@ -160,13 +216,37 @@ languages = \\
 
     try:
         i18n_py.write(header)
-        i18n_py.write(pprint.pformat(languages))
+        write_language_names(i18n_py, languages)
         i18n_py.write(u"\n")
+        write_language_data(i18n_py, languages)
+        i18n_py.write(footer)
     finally:
         if should_close:
             i18n_py.close()
 
 
+def write_language_names(stream, languages):
+    """Write the names of all languages (needed by: ``--lang-list``)."""
+    stream.write(u"# -- LANGUAGE NAMES: iso_code => (name, native)\n")
+    stream.write(u"language_names = {\n")
+    for language in sorted(languages):
+        keywords = languages[language]
+        stream.write(u"    %r: (%r, %r),\n" % (
+            language, keywords[u"name"], keywords[u"native"]))
+    stream.write(u"}\n")
+
+
+def write_language_data(stream, languages):
+    """Write the keywords of each language as compact JSON text."""
+    stream.write(u"# -- LANGUAGE DATA: iso_code => keywords (as JSON text)\n")
+    stream.write(u"language_data = {\n")
+    for language in sorted(languages):
+        json_text = json.dumps(languages[language], ensure_ascii=False,
+                               sort_keys=True, separators=(",", ":"))
+        stream.write(u"    %r: %r,\n" % (language, json_text))
+    stream.write(u"}\n")
+
+
 def main(args=None):
     """Main function to generate the "behave/i18n.py" module
     from the "gherkin-languages.json" file.
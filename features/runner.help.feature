@@ -27,7 +27,9 @@ Feature: Runner Help
       And the command output should contain:
         """
         AVAILABLE RUNNERS:
-          default  = behave.runner:Runner
+          default            = behave.runner:Runner
+          parallel           = behave.runner_parallel:ParallelRunner
+          parallel.scenario  = behave.runner_parallel:ScenarioParallelRunner
         """
 
     Scenario: Good Runner by using a Runner-Alias
@@ -55,8 +57,10 @@ Feature: Runner Help
       Then it should pass
       And the command output should contain:
         """
-        default  = behave.runner:Runner
-        some     = behave4me.good_runner:SomeRunner
+        default            = behave.runner:Runner
+        parallel           = behave.runner_parallel:ParallelRunner
+        parallel.scenario  = behave.runner_parallel:ScenarioParallelRunner
+        some               = behave4me.good_runner:SomeRunner
         """
       And note that "the new runner appears in the sorted list of runners"
       But the command output should not contain "UNAVAILABLE RUNNERS"
@@ -88,7 +92,7 @@ Feature: Runner Help
       And the command output should contain:
         """
         UNAVAILABLE RUNNERS:
-          <runner_name>    <runner_syndrome>: <problem_description>
+          <runner_name>          <runner_syndrome>: <problem_description>
         """
 
       @use.with_python.min_version=3.0
@@ -127,7 +131,7 @@ Feature: Runner Help
       And the command output should contain:
         """
         UNAVAILABLE RUNNERS:
-          bad_runner2    ClassNotFoundError: behave4me.bad_runner:UnknownRunner
-          bad_runner3    InvalidClassError: is not a subclass-of 'behave.api.runner:ITestRunner'
+          bad_runner2          ClassNotFoundError: behave4me.bad_runner:UnknownRunner
+          bad_runner3          InvalidClassError: is not a subclass-of 'behave.api.runner:ITestRunner'
         """
       And note that "the list of UNAVAILABLE RUNNERS is sorted-by-name"
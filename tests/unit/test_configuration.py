@@ -148,6 +148,45 @@ class TestConfiguration(object):
         assert "STAGE2_environment.py" == config.environment_file
         del os.environ["BEHAVE_STAGE"]
 
+    def test_shard_option(self):
+        config = Configuration(["--shard=2/5"], load_config=False)
+        assert config.shard == (2, 5)
+        assert Configuration("", load_config=False).shard is None
+
+    def test_parse_cache_options(self):
+        config = Configuration(["--parse-cache", "features"], load_config=False)
+        assert config.parse_cache is True
+        assert config.parse_cache_dir == ".behave_cache"
+        assert config.paths == ["features"]
+        config = Configuration(["--parse-cache-dir=tmp/cache"], load_config=False)
+        assert config.parse_cache_dir == "tmp/cache"
+        assert not Configuration("", load_config=False).parse_cache
+
+    def test_columnar_tables_option(self):
+        config = Configuration(["--columnar-tables"], load_config=False)
+        assert config.columnar_tables is True
+        assert not Configuration("", load_config=False).columnar_tables
+
+    def test_low_memory_option(self):
+        config = Configuration(["--low-memory"], load_config=False)
+        assert config.low_memory is True
+        assert not Configuration("", load_config=False).low_memory
+
+    def test_stream_features_option(self):
+        config = Configuration(["--stream-features"], load_config=False)
+        assert config.stream_features is True
+        assert not Configuration("", load_config=False).stream_features
+
+    def test_scan_tags_option(self):
+        config = Configuration(["--scan-tags"], load_config=False)
+        assert config.scan_tags is True
+        assert not Configuration("", load_config=False).scan_tags
+
+    @pytest.mark.parametrize("text", ["0/3", "4/3", "1", "a/b"])
+    def test_shard_option__with_bad_value_fails(self, text):
+        with pytest.raises(SystemExit):
+            Configuration(["--shard=%s" % text], load_config=False)
+
 
 # -----------------------------------------------------------------------------
 # TEST SUITE:
@@ -243,6 +282,7 @@ class TestConfigFileParser(object):
         config_options_names = [opt[0] for opt in config_options]
         expected_names = [
             "color",
+            "columnar_tables",
             "default_format",
             "default_tags",
             "dry_run",
@@ -259,12 +299,17 @@ class TestConfigFileParser(object):
             "logging_filter",
             "logging_format",
             "logging_level",
+            "low_memory",
             "name",
             "outfiles",
+            "parse_cache",
+            "parse_cache_dir",
             "paths",
             "quiet",
             "runner",
+            "scan_tags",
             "scenario_outline_annotation_schema",
+            "shard",
             "show_multiline",
             "show_skipped",
             "show_snippets",
@@ -275,9 +320,12 @@ class TestConfigFileParser(object):
             "stdout_capture",
             "steps_catalog",
             "stop",
+            "stream_features",
             "summary",
             "tag_expression_protocol",
             "tags",
+            "timing_default",
+            "timing_file",
             "verbose",
             "wip",
         ]
@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :mod:`behave.i18n`.
+"""
+
+from __future__ import absolute_import, unicode_literals
+from behave.i18n import LanguageMapping, languages
+import pytest
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
+class TestLanguageMapping(object):
+
+    def make_mapping(self):
+        data = {
+            "en": '{"feature":["Feature"],"name":"English","native":"English"}',
+            "de": '{"feature":["Funktionalität"],"name":"German","native":"Deutsch"}',
+        }
+        names = {"en": ("English", "English"), "de": ("German", "Deutsch")}
+        return LanguageMapping(data, names)
+
+    def test_keywords_are_decoded_on_first_access_only(self):
+        mapping = self.make_mapping()
+        assert not mapping._keywords
+        keywords = mapping["de"]
+        assert keywords["feature"] == ["Funktionalität"]
+        assert list(mapping._keywords.keys()) == ["de"]
+        assert mapping["de"] is keywords
+
+    def test_contains_and_iter_do_not_decode_keywords(self):
+        mapping = self.make_mapping()
+        assert "en" in mapping
+        assert "xx" not in mapping
+        assert sorted(mapping) == ["de", "en"]
+        assert len(mapping) == 2
+        assert not mapping._keywords
+
+    def test_getitem__with_unknown_language_raises_key_error(self):
+        mapping = self.make_mapping()
+        with pytest.raises(KeyError):
+            mapping["xx"]       # pylint: disable=pointless-statement
+
+    def test_names__provides_name_and_native_name(self):
+        mapping = self.make_mapping()
+        assert mapping.names["de"] == ("German", "Deutsch")
+
+    def test_setitem__replaces_keywords_of_language(self):
+        mapping = self.make_mapping()
+        keywords = {"feature": ["Merkmal"], "name": "German", "native": "Deutsch"}
+        mapping["de"] = keywords
+        assert mapping["de"] is keywords
+        assert len(mapping) == 2
+
+    def test_setitem__adds_language(self):
+        mapping = self.make_mapping()
+        mapping["xx"] = {"feature": ["Xeature"], "name": "X", "native": "Xx"}
+        assert "xx" in mapping
+        assert sorted(mapping) == ["de", "en", "xx"]
+        assert mapping["xx"]["feature"] == ["Xeature"]
+        assert mapping.names["xx"] == ("X", "Xx")
+
+    def test_delitem__removes_language(self):
+        mapping = self.make_mapping()
+        mapping["de"]       # pylint: disable=pointless-statement
+        del mapping["de"]
+        assert "de" not in mapping
+        assert "de" not in mapping.names
+        with pytest.raises(KeyError):
+            mapping["de"]   # pylint: disable=pointless-statement
+
+
+class TestLanguages(object):
+
+    @pytest.mark.parametrize("language", sorted(languages.names.keys()))
+    def test_names__match_language_keywords(self, language):
+        keywords = languages[language]
+        assert languages.names[language] == (keywords["name"], keywords["native"])
+
+    def test_english_keywords(self):
+        keywords = languages["en"]
+        assert keywords["feature"] == ["Feature", "Business Need", "Ability"]
+        assert "Given " in keywords["given"]
+        assert keywords["scenario_outline"] == ["Scenario Outline", "Scenario Template"]
@@ -0,0 +1,231 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :mod:`behave.ledger`.
+"""
+
+from __future__ import absolute_import
+import functools
+import multiprocessing
+import os
+from mock import Mock, patch
+from behave import ledger
+from behave.ledger import ScenarioLedger, make_scenario_fingerprint
+from behave.matchers import Match
+from behave.parser import parse_feature
+
+
+# -----------------------------------------------------------------------------
+# TEST SUPPORT:
+# -----------------------------------------------------------------------------
+def make_ledger(directory, batch_size=None):
+    return ScenarioLedger(str(directory/"scenario_pass"),
+                          str(directory/"scenario_fail"),
+                          batch_size=batch_size)
+
+
+def read_lines(path):
+    return path.read_text().splitlines()
+
+
+def segment_path_of(directory, filename="scenario_pass", pid=None):
+    return directory/("%s.%d.segment" % (filename, pid or os.getpid()))
+
+
+def record_passed_in_process(directory, process_index, count):
+    ledger = make_ledger(directory, batch_size=10)
+    for index in range(count):
+        ledger.record_passed(u"P%d-S%d" % (process_index, index))
+    ledger.close()
+
+
+def step_passes(context):
+    pass
+
+
+def step_passes_too(context):
+    assert True
+
+
+class FakeStepRegistry(object):
+    def __init__(self, func=step_passes):
+        self.func = func
+
+    def find_match(self, step):
+        if step.name == u"an undefined step":
+            return None
+        return Match(self.func)
+
+
+FEATURE_TEXT = u"""
+Feature: F1
+  Scenario: S1
+    Given a step passes
+    When a step passes with:
+      | name  |
+      | Alice |
+"""
+
+
+def parse_scenario(text=FEATURE_TEXT):
+    return parse_feature(text, filename="features/f1.feature").scenarios[0]
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
+class TestScenarioLedger(object):
+
+    def test_has_passed__with_missing_file(self, tmp_path):
+        ledger = make_ledger(tmp_path)
+        assert not ledger.has_passed(u'<Scenario "Alice">')
+
+    def test_has_passed__uses_entries_of_previous_run(self, tmp_path):
+        ledger = make_ledger(tmp_path)
+        ledger.record_passed(u"0123", label=u'<Scenario "Alice">')
+        ledger.record_failed(u"4567", label=u'<Scenario "Bob">')
+        ledger.close()
+
+        ledger2 = make_ledger(tmp_path)
+        assert ledger2.has_passed(u"0123")
+        assert not ledger2.has_passed(u"4567")
+        assert not ledger2.has_passed(u'<Scenario "Alice">')
+        assert read_lines(tmp_path/"scenario_pass") == \
+               [u'0123\t<Scenario "Alice">']
+
+    def test_record_passed__writes_entries_in_batches(self, tmp_path):
+        ledger = make_ledger(tmp_path, batch_size=3)
+        ledger.record_passed(u"S1")
+        ledger.record_passed(u"S2")
+        assert not segment_path_of(tmp_path).exists()
+        ledger.record_passed(u"S3")
+        assert read_lines(segment_path_of(tmp_path)) == [u"S1", u"S2", u"S3"]
+
+    def test_close__compacts_segments_into_main_file(self, tmp_path):
+        ledger = make_ledger(tmp_path, batch_size=1)
+        ledger.record_passed(u"S1")
+        ledger.record_passed(u"S2")
+        ledger.close()
+        assert read_lines(tmp_path/"scenario_pass") == [u"S1", u"S2"]
+        assert not segment_path_of(tmp_path).exists()
+
+    def test_close__removes_lock_files(self, tmp_path):
+        ledger = make_ledger(tmp_path, batch_size=1)
+        ledger.record_passed(u"S1")
+        ledger.record_failed(u"S2")
+        ledger.close()
+        assert not list(tmp_path.glob("*.lock"))
+
+    def test_has_passed__merges_segments_of_other_processes(self, tmp_path):
+        (tmp_path/"scenario_pass").write_text(u"S1\n")
+        segment_path_of(tmp_path, pid=1).write_text(u"S2\n")
+        segment_path_of(tmp_path, pid=2).write_text(u"S3\n")
+        ledger = make_ledger(tmp_path)
+        assert ledger.has_passed(u"S1")
+        assert ledger.has_passed(u"S2")
+        assert ledger.has_passed(u"S3")
+
+    def test_close__with_concurrent_processes_keeps_all_entries(self, tmp_path):
+        processes = [
+            multiprocessing.Process(target=record_passed_in_process,
+                                    args=(tmp_path, process_index, 95))
+            for process_index in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        ledger = make_ledger(tmp_path)
+        assert ledger.has_passed(u"P3-S94")
+        ledger.close()
+        lines = read_lines(tmp_path/"scenario_pass")
+        assert len(lines) == 4 * 95
+        assert set(lines) == set(u"P%d-S%d" % (process_index, index)
+                                 for process_index in range(4)
+                                 for index in range(95))
+        assert not list(tmp_path.glob("scenario_pass.*.segment"))
+        assert not list(tmp_path.glob("*.lock"))
+
+    def test_record_passed__appends_only_new_entries(self, tmp_path):
+        (tmp_path/"scenario_pass").write_text(u"S1\nS2\n")
+        ledger = make_ledger(tmp_path)
+        ledger.record_passed(u"S2")
+        ledger.record_passed(u"S3")
+        ledger.close()
+        assert read_lines(tmp_path/"scenario_pass") == [u"S1", u"S2", u"S3"]
+
+    def test_record_failed__moves_existing_entry_to_end(self, tmp_path):
+        (tmp_path/"scenario_fail").write_text(u"S1\nS2\nS3\n")
+        ledger = make_ledger(tmp_path)
+        ledger.record_failed(u"S1")
+        ledger.record_failed(u"S4")
+        ledger.close()
+        assert read_lines(tmp_path/"scenario_fail") == [u"S2", u"S3", u"S1", u"S4"]
+
+    def test_close__uses_directory_of_load_time(self, tmp_path, monkeypatch):
+        (tmp_path/"run1").mkdir()
+        (tmp_path/"other").mkdir()
+        monkeypatch.chdir(tmp_path/"run1")
+        ledger = ScenarioLedger()
+        ledger.record_passed(u"S1")
+        monkeypatch.chdir(tmp_path/"other")
+        ledger.close()
+        assert read_lines(tmp_path/"run1"/"scenario_pass") == [u"S1"]
+        assert not (tmp_path/"other"/"scenario_pass").exists()
+
+
+class TestScenarioFingerprint(object):
+
+    def test_fingerprint__is_same_for_same_scenario(self):
+        fingerprint1 = make_scenario_fingerprint(parse_scenario(),
+                                                 FakeStepRegistry())
+        fingerprint2 = make_scenario_fingerprint(parse_scenario(),
+                                                 FakeStepRegistry())
+        assert fingerprint1 == fingerprint2
+
+    def test_fingerprint__changes_with_step_table(self):
+        changed_text = FEATURE_TEXT.replace(u"Alice", u"Bob")
+        fingerprint1 = make_scenario_fingerprint(parse_scenario(),
+                                                 FakeStepRegistry())
+        fingerprint2 = make_scenario_fingerprint(parse_scenario(changed_text),
+                                                 FakeStepRegistry())
+        assert fingerprint1 != fingerprint2
+
+    def test_fingerprint__changes_with_step_function_source(self):
+        scenario = parse_scenario()
+        fingerprint1 = make_scenario_fingerprint(scenario,
+                                                 FakeStepRegistry(step_passes))
+        fingerprint2 = make_scenario_fingerprint(scenario,
+                                                 FakeStepRegistry(step_passes_too))
+        assert fingerprint1 != fingerprint2
+
+    def test_fingerprint__changes_with_undefined_step(self):
+        changed_text = FEATURE_TEXT.replace(u"Given a step passes",
+                                            u"Given an undefined step")
+        fingerprint1 = make_scenario_fingerprint(parse_scenario(),
+                                                 FakeStepRegistry())
+        fingerprint2 = make_scenario_fingerprint(parse_scenario(changed_text),
+                                                 FakeStepRegistry())
+        assert fingerprint1 != fingerprint2
+
+    def test_fingerprint__uses_match_of_step_that_was_run(self):
+        scenario = parse_scenario()
+        fingerprint1 = make_scenario_fingerprint(scenario, FakeStepRegistry())
+        for step in scenario.all_steps:
+            step.match = Match(step_passes)
+        step_registry = Mock()
+        fingerprint2 = make_scenario_fingerprint(scenario, step_registry)
+        assert fingerprint1 == fingerprint2
+        assert not step_registry.find_match.called
+
+    def test_function_digest__is_cached_for_decorated_function(self):
+        @functools.wraps(step_passes)
+        def decorated_step(context):
+            return step_passes(context)
+
+        digest1 = ledger.make_function_digest(decorated_step)
+        with patch("behave.ledger.inspect.getsource") as getsource:
+            digest2 = ledger.make_function_digest(decorated_step)
+        assert digest1 == digest2
+        assert not getsource.called
+        assert decorated_step in ledger._function_digests
@@ -49,6 +49,15 @@ class TestParseMatcher(object):
     def record_args(self, *args, **kwargs):
         self.recorded_args = (args, kwargs)
 
+    @pytest.mark.parametrize("pattern, expected", [
+        (u"a step passes", u"a step passes"),
+        (u"I have {count:d} apples", u"I have "),
+        (u"{person} has a {{item}}", u""),
+    ])
+    def test_literal_prefix(self, pattern, expected):
+        matcher = self.STEP_MATCHER_CLASS(None, pattern)
+        assert matcher.literal_prefix == expected
+
     def test_register_type__can_register_own_type_converters(self):
         def parse_number(text):
             return int(text)
@@ -268,6 +277,17 @@ class TestRegexMatcher(object):
         expected = "NotSupportedWarning: {0}.register_type".format(class_name)
         assert expected in excecption_text
 
+    @pytest.mark.parametrize("pattern, expected", [
+        (u"a step passes", u"a step passes"),
+        (u"I have (\\d+) apples", u"I have "),
+        (u"I have an? apple", u"I have a"),
+        (u"an apple|a pear", u""),
+        (u"(?P<person>\\w+) is here", u""),
+    ])
+    def test_literal_prefix(self, pattern, expected):
+        matcher = self.STEP_MATCHER_CLASS(None, pattern)
+        assert matcher.literal_prefix == expected
+
     def test_returns_none_if_regex_does_not_match(self):
         this_matcher_class = self.STEP_MATCHER_CLASS
         matcher = this_matcher_class(None, 'a string')
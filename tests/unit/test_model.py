@@ -2,6 +2,9 @@
 # pylint: disable=no-self-use, line-too-long
 
 from __future__ import absolute_import, print_function, with_statement
+from array import array
+import copy
+import pickle
 import unittest
 import pytest
 from mock import Mock, patch
@@ -10,10 +13,10 @@ from six.moves import range     # pylint: disable=redefined-builtin
 from six.moves import zip       # pylint: disable=redefined-builtin
 from behave.model_core import Status
 from behave.model import Feature, Scenario, ScenarioOutline, Step
-from behave.model import Table, Row
+from behave.model import Table, ColumnarTable, Row
 from behave.matchers import NoMatch
 from behave.runner import Context
-from behave.capture import CaptureController
+from behave.capture import CaptureController, Captured
 from behave.configuration import Configuration
 from behave.compat.collections import OrderedDict
 from behave import step_registry
@@ -177,6 +180,29 @@ class TestFeatureRun(unittest.TestCase):
         feature.run(self.runner)
         assert not self.run_hook.called
 
+    def test_release_payload_keeps_status_and_duration(self):
+        steps = [Step("foo.feature", 3, u"Given", "given", u"foo"),
+                 Step("foo.feature", 4, u"When", "when", u"bar", text=u"text")]
+        scenario = Scenario("foo.feature", 2, u"Scenario", u"foo", steps=steps)
+        feature = Feature("foo.feature", 1, u"Feature", u"foo",
+                          scenarios=[scenario])
+        steps[0].status = Status.passed
+        steps[0].duration = 1.0
+        steps[1].status = Status.failed
+        steps[1].duration = 2.0
+        steps[1].captured = Captured(u"frogs")
+        steps[1].store_exception_context(Exception("halibut"))
+        scenario.captured = Captured(u"frogs")
+
+        feature.release_payload()
+        assert feature.status == Status.failed
+        assert scenario.status == Status.failed
+        assert feature.duration == 3.0
+        assert not scenario.captured
+        assert not steps[1].captured
+        assert steps[1].exception is None
+        assert steps[1].text is None
+
 
 class TestScenarioRun(unittest.TestCase):
     # pylint: disable=invalid-name
@@ -190,6 +216,11 @@ class TestScenarioRun(unittest.TestCase):
         self.context = self.runner.context = Mock()
         self.formatters = self.runner.formatters = [Mock()]
         self.run_hook = self.runner.run_hook = Mock()
+        # -- ISOLATE FROM: Resume ledger (steps are mocked).
+        self.config.check_previous = False
+        patch("behave.model.make_scenario_fingerprint").start()
+        patch("behave.model.the_ledger").start()
+        self.addCleanup(patch.stopall)
 
     def test_run_invokes_formatter_scenario_and_steps_correctly(self):
         self.config.stdout_capture = False
@@ -496,6 +527,16 @@ class TestStepRun(unittest.TestCase):
         assert not self.formatters[0].match.called
         assert not self.formatters[0].result.called
 
+    def test_run_stores_match_until_reset(self):
+        step = Step("foo.feature", 17, u"Given", "given", u"foo")
+        match = Mock()
+        self.runner.step_registry.find_match.return_value = match
+        assert step.match is None
+        step.run(self.runner)
+        assert step.match is match
+        step.reset()
+        assert step.match is None
+
     def test_run_when_not_quiet_reports_match_and_result(self):
         step = Step("foo.feature", 17, u"Given", "given", u"foo")
         match = Mock()
@@ -661,6 +702,53 @@ class TestStepRun(unittest.TestCase):
         assert "Captured logging:" in step.error_message
         assert "toads" in step.error_message
 
+    def test_release_payload_keeps_status_and_summarized_error(self):
+        step = Step("foo.feature", 17, u"Given", "given", u"foo",
+                    text=u"lorem ipsum", table=Table([u"name"]))
+        match = Mock()
+        self.runner.step_registry.find_match.return_value = match
+        self.stdout_capture.getvalue.return_value = "frogs"
+        match.run.side_effect = raiser(AssertionError("kipper"))
+        assert not step.run(self.runner)
+        duration = step.duration
+
+        step.release_payload()
+        assert step.status == Status.failed
+        assert step.duration == duration
+        assert step.error_message == u"Assertion Failed: kipper"
+        assert not step.captured
+        assert step.exception is None
+        assert step.exc_traceback is None
+        assert step.text is None
+        assert step.table is None
+
+    def test_step_uses_slots_but_supports_other_attributes(self):
+        step = Step("foo.feature", 17, u"Given", "given", u"foo")
+        assert not step.__dict__
+        step.scenario = u"Alice"    # -- LIKE: progress formatters
+        assert step.__dict__ == dict(scenario=u"Alice")
+
+    def test_step_can_be_pickled(self):
+        step = Step("foo.feature", 17, u"Given", "given", u"foo",
+                    text=u"lorem ipsum")
+        step.status = Status.passed
+        step.captured.stdout = u"frogs"
+        step.scenario = u"Alice"
+        step2 = pickle.loads(pickle.dumps(step, pickle.HIGHEST_PROTOCOL))
+        assert step2 == step
+        assert step2.location == step.location
+        assert step2.text == u"lorem ipsum"
+        assert step2.status == Status.passed
+        assert step2.captured.stdout == u"frogs"
+        assert step2.scenario == u"Alice"
+
+    def test_step_copy_has_same_attributes(self):
+        step = Step("foo.feature", 17, u"Given", "given", u"foo")
+        step2 = copy.copy(step)
+        assert step2.name == step.name
+        assert step2.location is step.location
+        assert step2.step_type == step.step_type
+
 
 class TestTableModel(unittest.TestCase):
     # pylint: disable=invalid-name
@@ -706,6 +794,124 @@ class TestTableModel(unittest.TestCase):
     def test_table_row_items(self):
         assert list(self.table[0].items()) == list(zip(self.HEAD, self.DATA[0]))
 
+    def test_rows_share_heading_index_of_table(self):
+        heading_index = self.table.heading_index
+        assert heading_index == {u"type of stuff": 0, u"awesomeness": 1,
+                                 u"ridiculousness": 2}
+        for row in self.table:
+            assert row._heading_index is heading_index
+
+    def test_row_name_after_add_column(self):
+        table = Table(list(self.HEAD), 0, self.DATA)
+        column_index = table.add_column(u"color", [u"white", u"grey"], u"green")
+        assert column_index == 3
+        assert table.get_column_index(u"color") == 3
+        assert table[0][u"color"] == u"white"
+        assert table[2][u"color"] == u"green"
+        assert table[2][u"ridiculousness"] == u"awkward"
+
+    def test_row_name_after_remove_column(self):
+        table = Table(list(self.HEAD), 0, [list(row) for row in self.DATA])
+        table.remove_column(u"awesomeness")
+        assert not table.has_column(u"awesomeness")
+        assert table.get_column_index(u"ridiculousness") == 1
+        assert table[1][u"ridiculousness"] == u"high"
+        assert table[1].as_dict() == {u"type of stuff": u"lint",
+                                      u"ridiculousness": u"high"}
+        with pytest.raises(KeyError):
+            table[1][u"awesomeness"]  # pylint: disable=pointless-statement
+
+    def test_row_name_after_headings_are_modified_directly(self):
+        table = Table(list(self.HEAD), 0, self.DATA)
+        table.headings.reverse()
+        assert table[0][u"type of stuff"] == u"frequent"
+        assert table[0][u"ridiculousness"] == u"fluffy"
+
+
+class TestTableColumns(object):
+    HEADINGS = [u"name", u"amount"]
+    DATA = [[u"Alice", u"1.5"], [u"Bob", u"2"], [u"Charly", u"3.25"]]
+
+    @pytest.fixture(params=[Table, ColumnarTable])
+    def table(self, request):
+        table_class = request.param
+        return table_class(list(self.HEADINGS), 1,
+                           [list(row) for row in self.DATA])
+
+    def test_column(self, table):
+        assert table.column(u"name") == [u"Alice", u"Bob", u"Charly"]
+        with pytest.raises(KeyError):
+            table.column(u"UNKNOWN")
+
+    def test_column_as_array(self, table):
+        assert table.column_as_array(u"amount") == array("d", [1.5, 2.0, 3.25])
+        table.add_column(u"count", [u"1", u"2", u"3"])
+        assert table.column_as_array(u"count", "i") == array("i", [1, 2, 3])
+
+    def test_rows_and_cells(self, table):
+        assert [row.cells for row in table] == self.DATA
+        assert [row.cells for row in table.rows] == self.DATA
+        assert table[1][u"amount"] == u"2"
+        assert table[-1].cells == self.DATA[-1]
+        assert [row[u"name"] for row in table[1:]] == [u"Bob", u"Charly"]
+
+    def test_add_column_and_remove_column(self, table):
+        table.add_column(u"color", [u"red"], default_value=u"blue")
+        table.remove_column(u"amount")
+        assert table.headings == [u"name", u"color"]
+        assert table[2].as_dict() == {u"name": u"Charly", u"color": u"blue"}
+        assert table.column(u"color") == [u"red", u"blue", u"blue"]
+
+    def test_assert_equals__with_same_data(self, table):
+        table.assert_equals(self.DATA)
+        table.assert_equals(Table(list(self.HEADINGS), rows=self.DATA))
+
+    def test_assert_equals__with_other_cell(self, table):
+        data = [list(row) for row in self.DATA]
+        data[1][1] = u"OTHER"
+        with pytest.raises(AssertionError) as exc_info:
+            table.assert_equals(data)
+        assert "row 1 differs" in str(exc_info.value)
+
+    def test_assert_equals__with_other_rows_count(self, table):
+        with pytest.raises(AssertionError) as exc_info:
+            table.assert_equals(self.DATA[:2])
+        assert "has 3 rows (expected: 2 rows)" in str(exc_info.value)
+
+    def test_columnar_table_from_table(self):
+        table = Table(list(self.HEADINGS), 1, self.DATA)
+        columnar_table = ColumnarTable.from_table(table)
+        assert columnar_table.columns == [[u"Alice", u"Bob", u"Charly"],
+                                          [u"1.5", u"2", u"3.25"]]
+        assert columnar_table == table
+        assert [row.line for row in columnar_table] == [1, 1, 1]
+
+    def test_columnar_table_creates_row_views_once(self):
+        table = ColumnarTable(list(self.HEADINGS), 1, self.DATA)
+        rows = table.rows
+        assert table.rows is rows
+        assert all(row is rows[i] for i, row in enumerate(table))
+        assert table[1] is rows[1]
+
+    @pytest.mark.parametrize("modify", [
+        lambda table: table.add_row([u"Dora", u"4"]),
+        lambda table: table.add_column(u"color"),
+        lambda table: table.remove_column(u"amount"),
+    ])
+    def test_columnar_table_creates_new_row_views_when_modified(self, modify):
+        table = ColumnarTable(list(self.HEADINGS), 1, self.DATA)
+        rows = table.rows
+        modify(table)
+        assert table.rows is not rows
+        assert [row.cells for row in table.rows] == list(table.iter_cells())
+
+    def test_columnar_table_len_and_truth_value(self):
+        table = ColumnarTable(list(self.HEADINGS))
+        assert len(table) == 0
+        assert table, "EXPECTED: Empty table is true (like: Table)"
+        table.add_row([u"Alice", u"1.5"])
+        assert len(table) == 1
+
 
 class TestModelRow(unittest.TestCase):
     # pylint: disable=invalid-name, bad-whitespace
@@ -749,6 +955,11 @@ class TestModelRow(unittest.TestCase):
     def test_getitem_with_unknown_colname_should_return_default(self):
         assert self.row.get("__UNKNOWN_COLUMN__", "XXX") == u"XXX"
 
+    def test_row_uses_slots_but_supports_other_attributes(self):
+        assert not self.row.__dict__
+        self.row.selected = True
+        assert self.row.__dict__ == dict(selected=True)
+
     def test_as_dict(self):
         data1 = self.row.as_dict()
         data2 = dict(self.row.as_dict())
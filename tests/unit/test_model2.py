@@ -5,9 +5,11 @@ Additional unit tests for :mod:`behave.model`.
 
 from __future__ import absolute_import, print_function
 from behave.model import ScenarioOutline, ScenarioOutlineBuilder, Table, Tag, Row
+from behave.model import PlaceholderTemplate
+from behave.model import ColumnarTable, make_columnar_tables
 from behave.model_describe import ModelDescriptor
 from behave.textutil import text
-from behave.parser import parse_step, parse_tags
+from behave.parser import parse_feature, parse_step, parse_tags
 import six
 import pytest
 
@@ -178,6 +180,139 @@ Given a simple data table
         self.assert_make_row_tags(tag_template, expected_tags, params)
 
 
+class TestPlaceholderTemplate(object):
+
+    def test_render__substitutes_column_values(self):
+        template = PlaceholderTemplate(u"<name> is <age> years (<name>)",
+                                       [u"name", u"age"])
+        assert template.render([u"Alice", u"42"]) == u"Alice is 42 years (Alice)"
+        assert template.render([u"Bob", u"7"]) == u"Bob is 7 years (Bob)"
+
+    def test_render__substitutes_params_after_columns(self):
+        template = PlaceholderTemplate(u"<row.id>: <name>", [u"name"],
+                                       [u"row.id", u"name"])
+        params = {u"row.id": u"1.2", u"name": u"UNUSED"}
+        assert template.render([u"Alice"], params) == u"1.2: Alice"
+
+    def test_render__keeps_unknown_placeholders(self):
+        template = PlaceholderTemplate(u"<unknown> <name>", [u"name"])
+        assert template.render([u"Alice"]) == u"<unknown> Alice"
+
+    @pytest.mark.parametrize("text", [u"no placeholders", u"<unknown>"])
+    def test_render__without_slots_returns_same_text(self, text):
+        template = PlaceholderTemplate(text, [u"name"])
+        assert not template.has_placeholders
+        assert template.render([u"Alice"]) is text
+
+    @pytest.mark.parametrize("cells,expected", [
+        ([u"<ID>", u"001"], u"name=001"),
+        ([u"<name>", u"002"], u"name=<name>"),
+        ([u"<unknown>", u"003"], u"name=<unknown>"),
+    ])
+    def test_render__with_value_that_has_placeholder_syntax(self, cells, expected):
+        # -- SAME AS: Substitute one placeholder after another (in column order).
+        template = PlaceholderTemplate(u"name=<name>", [u"name", u"ID"])
+        assert template.render(cells) == expected
+
+    def test_compile__uses_first_column_with_duplicated_heading(self):
+        template = PlaceholderTemplate(u"<name>", [u"name", u"name"])
+        assert template.render([u"Alice", u"Bob"]) == u"Alice"
+
+
+class TestScenarioOutlineScenarios(object):
+    """Unit tests for the lazy built steps of scenario outline scenarios."""
+
+    @staticmethod
+    def make_scenario_outline():
+        feature = parse_feature(u'''
+Feature:
+  Scenario Outline: S<name>
+    Given a person named "<name>"
+    Then a data table:
+      | name   | size |
+      | <name> | 1    |
+
+    Examples:
+      | name  |
+      | Alice |
+      | Bob   |
+''')
+        return feature.scenarios[0]
+
+    def test_scenarios__build_steps_when_used(self):
+        scenario_outline = self.make_scenario_outline()
+        scenarios = scenario_outline.scenarios
+        assert [scenario._steps for scenario in scenarios] == [None, None]
+
+        steps = scenarios[1].steps
+        assert scenarios[0]._steps is None
+        assert [step.name for step in steps] == [
+            u'a person named "Bob"', u"a data table"]
+        assert scenarios[1].steps is steps
+
+    def test_scenarios__share_unchanged_data_with_outline_steps(self):
+        scenario_outline = self.make_scenario_outline()
+        outline_step = scenario_outline.steps[1]
+        alice_table = scenario_outline.scenarios[0].steps[1].table
+        bob_table = scenario_outline.scenarios[1].steps[1].table
+        assert alice_table is not bob_table
+        assert alice_table.headings == outline_step.table.headings
+        assert alice_table.rows[0].cells == [u"Alice", u"1"]
+        assert bob_table.rows[0].cells == [u"Bob", u"1"]
+        assert bob_table.rows[0].cells[1] is outline_step.table.rows[0].cells[1]
+        assert outline_step.table.rows[0].cells == [u"<name>", u"1"]
+
+
+class TestMakeColumnarTables(object):
+
+    def test_uses_columnar_table_for_large_step_tables(self):
+        feature = parse_feature(u'''
+Feature:
+  Background:
+    Given a large table:
+      | name  |
+      | Alice |
+      | Bob   |
+
+  Scenario: S1
+    Given a small table:
+      | name  |
+      | Alice |
+    And a large table:
+      | name  |
+      | Alice |
+      | Bob   |
+
+  Scenario Outline: S<name>
+    Given a large table:
+      | name   |
+      | <name> |
+      | Bob    |
+
+    Examples:
+      | name  |
+      | Alice |
+
+  Rule: R1
+    Scenario: S2
+      Given a large table:
+        | name  |
+        | Alice |
+        | Bob   |
+''')
+        make_columnar_tables([feature], min_rows=2)
+        background_step = feature.background.steps[0]
+        scenario1_steps = feature.scenarios[0].steps
+        scenario2_step = feature.rules[0].scenarios[0].steps[0]
+        outline_step = feature.scenarios[1].steps[0]
+        assert isinstance(background_step.table, ColumnarTable)
+        assert not isinstance(scenario1_steps[0].table, ColumnarTable)
+        assert isinstance(scenario1_steps[1].table, ColumnarTable)
+        assert isinstance(scenario2_step.table, ColumnarTable)
+        assert not isinstance(outline_step.table, ColumnarTable)
+        assert scenario2_step.table.column(u"name") == [u"Alice", u"Bob"]
+
+
 class TestTag(object):
     """
     Translation rules are:
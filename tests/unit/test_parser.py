@@ -5,8 +5,10 @@ Unit tests for Gherkin parser: :mod:`behave.parser`.
 """
 
 from __future__ import absolute_import, print_function
+import io
 import pytest
 from behave import i18n, model, parser
+from behave.tag_expression import make_tag_expression
 
 
 # ---------------------------------------------------------------------------
@@ -1441,6 +1443,197 @@ class TestParser4Tags(object):
             parse_tags('@one  invalid.tag boom')
 
 
+class TestTokenizer(object):
+    # pylint: disable=no-self-use
+
+    @pytest.mark.parametrize("text, kind", [
+        (u"", parser.LineKind.EMPTY),
+        (u"   \t", parser.LineKind.EMPTY),
+        (u"  # comment", parser.LineKind.COMMENT),
+        (u"  @one @two", parser.LineKind.TAGS),
+        (u"    | a | b |", parser.LineKind.TABLE_ROW),
+        (u'    """', parser.LineKind.MULTILINE_QUOTES),
+        (u"    '''", parser.LineKind.MULTILINE_QUOTES),
+        (u'    "quoted"', parser.LineKind.TEXT),
+        (u"    Given a step", parser.LineKind.TEXT),
+    ])
+    def test_tokenize_line__classifies_line(self, text, kind):
+        line = parser.tokenize_line(text)
+        assert line.kind == kind
+        assert line.text == text
+        assert line.stripped == text.strip()
+
+    def test_tokenize_line__provides_indent(self):
+        assert parser.tokenize_line(u"\t  Given a step").indent == 3
+        assert parser.tokenize_line(u"   ").indent == 3
+
+    @pytest.mark.parametrize("text", [
+        u"", u"\n", u"one", u"one\n", u"one\ntwo", u"one\n\ntwo\n",
+    ])
+    def test_split_lines__is_same_as_text_split(self, text):
+        lines = text.splitlines(True)
+        assert list(parser.split_lines(lines)) == text.split(u"\n")
+
+
+class TestParseFeatureLines(object):
+    # pylint: disable=no-self-use
+    FEATURE_TEXT = u'''
+@one
+Feature: Alice
+  Scenario: A1
+    Given a step with text:
+      """
+        indented text
+
+      """
+    When a step with table:
+      | name  | age |
+      | Alice | 42  |
+'''.lstrip()
+
+    @pytest.mark.parametrize("line_ending", [u"\n", u"\r\n"])
+    def test_parse_file__is_same_as_parse_feature(self, tmp_path, line_ending):
+        text = self.FEATURE_TEXT.replace(u"\n", line_ending)
+        feature_file = tmp_path/"alice.feature"
+        feature_file.write_bytes(text.encode("UTF-8"))
+        feature1 = parser.parse_feature(text, filename=str(feature_file))
+        feature2 = parser.parse_file(str(feature_file))
+        steps1 = feature1.scenarios[0].steps
+        steps2 = feature2.scenarios[0].steps
+        assert feature2.tags == feature1.tags
+        assert steps2[0].text == steps1[0].text == u"  indented text\n"
+        assert steps2[1].table == steps1[1].table
+        assert [step.line for step in steps2] == [step.line for step in steps1]
+
+    def test_parse_feature_lines__with_file_like_object(self):
+        lines = io.StringIO(self.FEATURE_TEXT)
+        feature = parser.parse_feature_lines(lines, filename="alice.feature")
+        assert feature.name == u"Alice"
+        assert len(feature.scenarios[0].steps) == 2
+
+    def test_parse_feature_lines__provides_filename_with_parser_error(self):
+        lines = io.StringIO(u"Feature: Bad\n  Scenario: B1\n    Given a step\n"
+                            u"      | a |\n      | b | c |\n")
+        with pytest.raises(parser.ParserError) as exc_info:
+            parser.parse_feature_lines(lines, filename="bad.feature")
+        assert exc_info.value.filename == "bad.feature"
+        assert exc_info.value.line == 5
+
+
+def match_step_keyword_linear(keywords, line):
+    # -- ORIGINAL ALGORITHM: Parser.parse_step() with linear search.
+    for step_type in ("given", "when", "then", "and", "but"):
+        for keyword in keywords[step_type]:
+            if line.startswith(keyword) or line.lower().startswith(keyword.lower()):
+                return (step_type, keyword)
+    return None
+
+
+class TestKeywordMatcher(object):
+    # pylint: disable=no-self-use
+
+    @pytest.mark.parametrize("language", sorted(i18n.languages.keys()))
+    def test_match_step__is_same_as_linear_search(self, language):
+        keywords = i18n.languages[language]
+        matcher = parser.KeywordMatcher.for_language(language)
+        for step_type in ("given", "when", "then", "and", "but"):
+            for keyword in keywords[step_type]:
+                for line in (keyword + u"a step", keyword.upper() + u"a step",
+                             keyword.lower() + u"a step"):
+                    expected = match_step_keyword_linear(keywords, line)
+                    assert matcher.match_step(line) == expected
+        assert matcher.match_step(u"| a | b |") is None
+
+    @pytest.mark.parametrize("language", sorted(i18n.languages.keys()))
+    def test_match_keyword__is_same_as_linear_search(self, language):
+        keywords = i18n.languages[language]
+        matcher = parser.KeywordMatcher.for_language(language)
+        for keyword in ("feature", "rule", "background", "scenario",
+                        "scenario_outline", "examples"):
+            for alias in keywords[keyword]:
+                line = alias + u": Alice"
+                assert matcher.match_keyword(keyword, line) == alias
+                assert matcher.match_keyword(keyword, alias + u" Alice") is None
+
+    def test_match_keyword__with_other_keyword_type(self):
+        matcher = parser.KeywordMatcher.for_language("en")
+        assert matcher.match_keyword("scenario", u"Scenario: S1") == u"Scenario"
+        assert matcher.match_keyword("feature", u"Scenario: S1") is None
+        assert matcher.match_keyword("scenario", u"Scenario Outline: S1") is None
+
+    def test_for_language__reuses_matcher(self):
+        matcher1 = parser.KeywordMatcher.for_language("de")
+        matcher2 = parser.KeywordMatcher.for_language("de")
+        assert matcher1 is matcher2
+
+
+class TestParseFeatureTags(object):
+    # pylint: disable=no-self-use
+    FEATURE_TEXT = u'''
+@feature_tag
+Feature: Alice
+  """
+  @tag_in_description
+  Scenario: S0
+  """
+
+  @rule_tag
+  Rule: R1
+    @scenario_tag  # comment
+    Scenario: S1
+      Given a step with text:
+        """
+        @tag_in_text
+        Scenario: Not a scenario
+        """
+
+    @outline_tag
+    Scenario Outline: S2 <name>
+      Given a step with <name>
+
+      @examples_tag
+      Examples:
+        | name  |
+        | Alice |
+'''.lstrip()
+
+    def test_parse_feature_tags__provides_effective_tags(self):
+        tag_sets = parser.parse_feature_tags(self.FEATURE_TEXT)
+        assert tag_sets == [
+            set([u"feature_tag"]),
+            set([u"feature_tag", u"tag_in_description"]),
+            set([u"feature_tag", u"rule_tag"]),
+            set([u"feature_tag", u"rule_tag", u"scenario_tag"]),
+            set([u"feature_tag", u"rule_tag", u"outline_tag"]),
+            set([u"feature_tag", u"rule_tag", u"outline_tag", u"examples_tag"]),
+        ]
+
+    @pytest.mark.parametrize("tags", [
+        u"@feature_tag", u"@rule_tag", u"@tag_in_description",
+        u"@tag_in_text", u"@examples_tag", u"not @examples_tag",
+        u"@scenario_tag and not @outline_tag", u"@other",
+        u"not @feature_tag",
+    ])
+    def test_parse_feature_tags__has_same_tag_selection_as_feature(self, tags):
+        tag_expression = make_tag_expression(tags)
+        feature = parser.parse_feature(self.FEATURE_TEXT)
+        tag_sets = parser.parse_feature_tags(self.FEATURE_TEXT)
+        expected = feature.should_run_with_tags(tag_expression)
+        assert any(tag_expression.check(tags) for tags in tag_sets) == expected
+
+    def test_parse_feature_tags__uses_language_of_feature(self):
+        text = u"# language: de\n@one\nFunktionalität: F1\n  @two\n  Szenario: S1\n"
+        tag_sets = parser.parse_feature_tags(text)
+        assert tag_sets == [set([u"one"]), set([u"one", u"two"])]
+
+    @pytest.mark.parametrize("text", [
+        u"Feature: F1\n  @<name>\n  Scenario Outline: S1\n",
+        u"Feature: F1\n  @one invalid_tag\n  Scenario: S1\n",
+    ])
+    def test_parse_feature_tags__returns_none_if_parsing_is_needed(self, text):
+        assert parser.parse_feature_tags(text) is None
+
+
 class TestParser4Background(object):
     # pylint: disable=no-self-use
 
@@ -1655,6 +1848,21 @@ Then the last step has multi-line text:
             ("then",  "Then",  "the last step has multi-line text", text2, None),
         ])
 
+    def test_parse_steps_with_multiline_text_after_table(self):
+        # -- NOTE: Multi-line text after a table keeps its leading whitespace.
+        doc = u'''
+      Given a step
+      | a |
+      | 1 |
+      """
+      hello
+      """
+'''.lstrip("\n")
+        steps = parser.parse_steps(doc)
+        assert len(steps) == 1
+        assert steps[0].table.headings == [u"a"]
+        assert steps[0].text == u"      hello"
+
     def test_parse_steps_with_table(self):
         doc = u'''
 Given a step with a table:
@@ -12,8 +12,10 @@ import pytest
 from mock import Mock, patch
 from behave import runner_util
 from behave import runner
+from behave.configuration import Configuration
 from behave.exception import ConfigError
 from behave.formatter.base import StreamOpener
+from behave.parser import ParserError
 
 
 
@@ -196,6 +198,13 @@ class TestRunWithPaths(unittest.TestCase):
         self.config.format = ["plain", "progress"]
         self.config.logging_format = None
         self.config.logging_datefmt = None
+        self.config.shard = None
+        self.config.parse_cache = None
+        self.config.stream_features = False
+        self.config.low_memory = False
+        self.config.columnar_tables = False
+        self.config.scan_tags = False
+        self.config.jobs = 1
         self.runner = runner.Runner(self.config)
         self.load_hooks = self.runner.load_hooks = Mock()
         self.load_step_definitions = self.runner.load_step_definitions = Mock()
@@ -255,10 +264,207 @@ class TestRunWithPaths(unittest.TestCase):
         self.runner.run_with_paths()
 
         expected_parse_file_args = \
-            [((x.upper(),), {"language": "fritz"}) for x in feature_locations]
+            [((x.upper(),), {"language": "fritz", "curdir": None})
+             for x in feature_locations]
         assert parse_file.call_args_list == expected_parse_file_args
         assert self.runner.features == [feature] * 3
 
+    @patch("behave.runner.parse_features")
+    @patch("behave.parser.parse_file")
+    @patch("os.path.abspath")
+    def test_streams_features_to_run_model_if_enabled(self, abspath,
+                                                      parse_file,
+                                                      parse_features):
+        features = []
+        for _ in range(3):
+            feature = Mock()
+            feature.tags = []
+            feature.run.return_value = False
+            features.append(feature)
+        self.runner.feature_locations.return_value = ["one", "two", "three"]
+        abspath.side_effect = lambda x: x.upper()
+        self.config.lang = None
+        self.config.exclude = lambda s: False
+        self.config.tags = None
+        self.config.stream_features = True
+        parse_file.side_effect = features
+
+        failed = self.runner.run_with_paths()
+
+        assert not failed
+        assert not parse_features.called
+        assert self.runner.features == features
+        for feature in features:
+            feature.run.assert_called_once_with(self.runner)
+
+    @patch("behave.parser.parse_file")
+    @patch("os.path.abspath")
+    def test_streamed_parse_error_is_raised_after_run_ended(self, abspath,
+                                                            parse_file):
+        feature = Mock()
+        feature.tags = []
+        feature.run.return_value = False
+        reporter = Mock()
+        self.runner.feature_locations.return_value = ["one", "two", "three"]
+        abspath.side_effect = lambda x: x
+        self.config.lang = None
+        self.config.exclude = lambda s: False
+        self.config.tags = None
+        self.config.stream_features = True
+        self.config.reporters = [reporter]
+        parse_file.side_effect = [feature, ParserError("BAD", 1, "two")]
+
+        with patch("behave.runner.the_ledger") as the_ledger:
+            with pytest.raises(ParserError):
+                self.runner.run_with_paths()
+
+        feature.run.assert_called_once_with(self.runner)
+        assert self.runner.features == [feature]
+        assert self.run_hook.call_args_list[-1][0][0] == "after_all"
+        reporter.feature.assert_called_once_with(feature)
+        reporter.end.assert_called_once_with()
+        the_ledger.close.assert_called_once_with()
+
+    def test_releases_payload_of_reported_features_in_low_memory_mode(self):
+        reported = []
+        reporter = Mock()
+        reporter.feature.side_effect = lambda feature: reported.append(
+            (feature, feature.release_payload.called))
+        features = [Mock(), Mock()]
+        for feature in features:
+            feature.run.return_value = False
+        self.config.reporters = [reporter]
+        self.config.low_memory = True
+        self.runner.formatters = []
+
+        self.runner.run_model(features)
+
+        assert reported == [(features[0], False), (features[1], False)]
+        for feature in features:
+            feature.release_payload.assert_called_once_with()
+
+    @patch("behave.runner.make_columnar_tables")
+    @patch("behave.runner.parse_features")
+    def test_uses_columnar_tables_of_parsed_features_if_enabled(
+            self, parse_features, make_columnar_tables):
+        features = [Mock(), Mock()]
+        self.runner.feature_locations.return_value = ["one", "two"]
+        self.runner.run_model = Mock(return_value=False)
+        self.config.exclude = lambda s: False
+        self.config.tags = None
+        self.config.columnar_tables = True
+        parse_features.return_value = features
+
+        self.runner.run_with_paths()
+
+        make_columnar_tables.assert_called_once_with(features)
+
+    @patch("behave.runner.parse_features")
+    def test_streams_no_features_with_shard(self, parse_features):
+        self.runner.feature_locations.return_value = ["one"]
+        self.config.exclude = lambda s: False
+        self.config.tags = None
+        self.config.stream_features = True
+        self.config.shard = (1, 2)
+        self.runner.select_shard_features = Mock(return_value=[])
+        parse_features.return_value = []
+
+        self.runner.run_with_paths()
+
+        assert parse_features.called
+        assert self.runner.select_shard_features.called
+
+    @patch("behave.runner.select_feature_locations_by_tags")
+    @patch("behave.runner.parse_features")
+    def test_selects_feature_files_by_tags_if_enabled(
+            self, parse_features, select_by_tags):
+        self.runner.feature_locations.return_value = ["one", "two"]
+        self.config.exclude = lambda s: False
+        self.config.tags = ["@smoke"]
+        self.config.scan_tags = True
+        self.config.junit = False
+        select_by_tags.return_value = ["two"]
+        parse_features.return_value = []
+
+        self.runner.run_with_paths()
+
+        select_by_tags.assert_called_once_with(["one", "two"],
+                                               self.config.tag_expression,
+                                               language=self.config.lang)
+        assert parse_features.call_args[0][0] == ["two"]
+
+    @patch("behave.runner.select_feature_locations_by_tags")
+    def test_parses_all_feature_files_by_default(self, select_by_tags):
+        self.runner.feature_locations.return_value = []
+        self.config.tags = ["@smoke"]
+        self.config.show_skipped = False
+        self.runner.run_with_paths()
+        assert not select_by_tags.called
+
+
+class TestStreamFeaturesWithHooks(object):
+    """Streamed features are parsed after the before_all hook has run."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path/"other").mkdir()
+        (tmp_path/"features"/"steps").mkdir(parents=True)
+        (tmp_path/"features"/"steps"/"steps.py").write_text(
+            u"from behave import step\n"
+            u"@step(u'a step passes')\n"
+            u"def step_passes(context):\n"
+            u"    pass\n")
+        (tmp_path/"features"/"environment.py").write_text(
+            u"import os\n"
+            u"def before_all(context):\n"
+            u"    os.chdir('other')\n")
+        for name in ("f1", "f2"):
+            (tmp_path/"features"/("%s.feature" % name)).write_text(
+                u"Feature: %s\n"
+                u"  Scenario: %s.1\n"
+                u"    Given a step passes\n" % (name, name))
+
+        # -- ENSURE: Step definitions of this test are removed afterwards.
+        saved_steps = dict((name, list(step_definitions))
+                           for name, step_definitions
+                           in runner.the_step_registry.steps.items())
+        yield tmp_path
+        runner.the_step_registry.steps.clear()
+        runner.the_step_registry.steps.update(saved_steps)
+
+    @staticmethod
+    def run_features(project_dir, features_path, *options):
+        os.chdir(str(project_dir))
+        command_args = ["-f", "null", "--no-summary", features_path]
+        command_args.extend(options)
+        the_runner = runner.Runner(Configuration(command_args, load_config=False))
+        failed = the_runner.run()
+        assert not failed
+        return [(str(feature.location), [str(scenario.location)
+                                         for scenario in feature.scenarios])
+                for feature in the_runner.features]
+
+    @pytest.mark.parametrize("absolute_path", [False, True])
+    def test_streamed_locations_are_same_if_hook_changes_directory(
+            self, project_dir, absolute_path):
+        features_path = "features"
+        if absolute_path:
+            features_path = str(project_dir/"features")
+        expected = [("features/f1.feature:1", ["features/f1.feature:2"]),
+                    ("features/f2.feature:1", ["features/f2.feature:2"])]
+        assert self.run_features(project_dir, features_path) == expected
+        assert self.run_features(project_dir, features_path,
+                                 "--stream-features") == expected
+
+    def test_streamed_locations_are_same_with_parse_cache(self, project_dir):
+        expected = self.run_features(project_dir, "features", "--parse-cache")
+        for _ in range(2):
+            # -- FIRST RUN: Parses feature files; SECOND RUN: Uses cache.
+            assert self.run_features(project_dir, "features",
+                                     "--stream-features",
+                                     "--parse-cache") == expected
+
 
 class FsMock(object):
     def __init__(self, *paths):
@@ -298,6 +298,24 @@ class TestContext2(unittest.TestCase):
             filename = filename.replace("$py", ".py")
         assert filename in info, "%r not in %r" % (filename, info)
 
+    def test_behave_masking_user_attribute_warning_shows_origin(self):
+        def set_user_attribute(context):
+            context.thing = "stuff"
+
+        with self.context.use_with_user_mode():
+            set_user_attribute(self.context)
+        # pylint: disable=protected-access
+        self.context._push()
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            self.context.thing = "other stuff"
+
+        assert len(warns) == 1
+        info = str(warns[0].message)
+        line = set_user_attribute.__code__.co_firstlineno + 1
+        assert "originally set in set_user_attribute" in info
+        assert ":%d)" % line in info
+
     def test_setting_root_attribute_that_masks_existing_causes_warning(self):
         # pylint: disable=protected-access
         warns = []
@@ -327,6 +345,42 @@ class TestContext2(unittest.TestCase):
             filename = filename.replace("$py", ".py")
         assert filename in info, "%r not in %r" % (filename, info)
 
+    def test_lookup_uses_top_layer_after_push_and_pop(self):
+        # pylint: disable=protected-access
+        self.context.thing = "feature"
+        self.context._push()
+        assert self.context.thing == "feature"
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.context.thing = "scenario"
+        assert self.context.thing == "scenario"
+        self.context._pop()
+        assert self.context.thing == "feature"
+
+    def test_lookup_uses_lower_layer_after_delete(self):
+        # pylint: disable=protected-access
+        self.context.thing = "feature"
+        self.context._push()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.context.thing = "scenario"
+        del self.context.thing
+        assert self.context.thing == "feature"
+        assert "other_thing" not in self.context
+        self.context.other_thing = "other"
+        assert "other_thing" in self.context
+        del self.context.other_thing
+        assert "other_thing" not in self.context
+
+    def test_lookup_uses_new_root_attribute(self):
+        # pylint: disable=protected-access
+        self.context._push()
+        assert "thing" not in self.context
+        self.context._set_root_attribute("thing", "root")
+        assert self.context.thing == "root"
+        self.context._set_root_attribute("thing", "other root")
+        assert self.context.thing == "other root"
+
     def test_context_deletable(self):
         assert "thing" not in self.context
         self.context.thing = "stuff"
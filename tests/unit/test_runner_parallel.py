@@ -0,0 +1,348 @@
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for :mod:`behave.runner_parallel`.
+"""
+
+from __future__ import absolute_import, print_function
+import json
+import os.path
+import textwrap
+from mock import Mock
+import pytest
+from six.moves import queue
+from behave.configuration import Configuration
+from behave.exception import InvalidFileLocationError
+from behave.model_core import Status
+from behave.reporter.base import Reporter
+from behave.parser import parse_file
+from behave.runner import Runner, the_step_registry
+from behave.runner_parallel import (
+    ParallelRunner, ScenarioParallelRunner, WorkerFinished, can_run_in_parallel
+)
+
+
+# -----------------------------------------------------------------------------
+# TEST SUPPORT:
+# -----------------------------------------------------------------------------
+STEPS_FILE_TEXT = u"""
+from behave import step
+
+@step(u'a step passes')
+def step_passes(context):
+    pass
+
+@step(u'a step fails')
+def step_fails(context):
+    assert False, "XFAIL"
+
+@step(u'a value {number:d}')
+def step_value(context, number):
+    print("value=%d" % number)
+"""
+
+FEATURE_FILES = {
+    "alice.feature": u"""
+        Feature: Alice
+          Background:
+            Given a step passes
+
+          Scenario: A1
+            When a step passes
+
+          Scenario: A2
+            When a step fails
+            Then a step passes
+        """,
+    "bob.feature": u"""
+        Feature: Bob
+          Scenario Outline: B1 <number>
+            Given a value <number>
+            When an undefined step
+
+            Examples:
+              | number |
+              | 1      |
+              | 2      |
+        """,
+    "charly.feature": u"""
+        Feature: Charly
+          Rule: R1
+            Scenario: C1
+              Given a step passes
+        """,
+}
+
+
+ENVIRONMENT_FILE_TEXT = u"""
+import os
+
+def record_hook(context, name):
+    with open("hooks.log", "a") as f:
+        f.write("%s %d\\n" % (name, os.getpid()))
+
+def before_all(context):
+    context.shared_value = 42
+    record_hook(context, "before_all")
+
+def before_feature(context, feature):
+    assert context.shared_value == 42
+    record_hook(context, "before_feature")
+
+def after_all(context):
+    record_hook(context, "after_all")
+"""
+
+
+def read_hook_calls(filename="hooks.log"):
+    with open(filename) as f:
+        return [line.split() for line in f.read().splitlines()]
+
+
+class CollectingReporter(Reporter):
+    def __init__(self, config):
+        super(CollectingReporter, self).__init__(config)
+        self.features = []
+
+    def feature(self, feature):
+        self.features.append((feature.name, feature.status))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    steps_dir = tmp_path/"features"/"steps"
+    steps_dir.mkdir(parents=True)
+    (steps_dir/"steps.py").write_text(STEPS_FILE_TEXT)
+    for filename, text in FEATURE_FILES.items():
+        feature_file = tmp_path/"features"/filename
+        feature_file.write_text(textwrap.dedent(text))
+    monkeypatch.chdir(tmp_path)
+
+    # -- ENSURE: Step definitions of this test are removed afterwards.
+    saved_steps = dict((name, list(step_definitions))
+                       for name, step_definitions in the_step_registry.steps.items())
+    yield tmp_path
+    the_step_registry.steps.clear()
+    the_step_registry.steps.update(saved_steps)
+
+
+def write_timing_file(filename, durations):
+    elements = [
+        {"type": "scenario", "location": location, "status": "passed",
+         "steps": [{"result": {"status": "passed", "duration": duration}}]}
+        for location, duration in durations.items()
+    ]
+    with open(filename, "w") as f:
+        json.dump([{"elements": elements}], f)
+
+
+def make_config(jobs=2, outfile="out.txt", extra_args=None):
+    command_args = ["-f", "plain", "-o", outfile, "--no-timings",
+                    "--no-summary", "--no-capture", "--jobs=%d" % jobs]
+    command_args.extend(extra_args or [])
+    command_args.append("features")
+    return Configuration(command_args, load_config=False)
+
+
+def run_behave(runner_class, outfile, jobs=2, extra_args=None):
+    config = make_config(jobs, outfile, extra_args)
+    reporter = CollectingReporter(config)
+    config.reporters.append(reporter)
+    runner = runner_class(config)
+    failed = runner.run()
+    with open(outfile) as f:
+        output = f.read()
+    return failed, output, reporter, runner
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
+@pytest.mark.skipif(not can_run_in_parallel(), reason="REQUIRES: os.fork()")
+class TestParallelRunner(object):
+
+    def test_run__provides_same_formatter_output_as_sequential_run(self, workdir):
+        failed1, output1, _, _ = run_behave(Runner, str(workdir/"seq.txt"))
+        failed2, output2, _, _ = run_behave(ParallelRunner, str(workdir/"par.txt"))
+        assert failed1 and failed2
+        assert output2 == output1
+        assert "Assertion Failed: XFAIL" in output2
+
+    def test_run__reports_features_in_original_order(self, workdir):
+        _, _, reporter, _ = run_behave(ParallelRunner, str(workdir/"out.txt"),
+                                       jobs=3)
+        assert reporter.features == [
+            (u"Alice", Status.failed),
+            (u"Bob", Status.failed),
+            (u"Charly", Status.passed),
+        ]
+
+    def test_run__applies_worker_results_to_model(self, workdir):
+        _, _, _, runner = run_behave(ParallelRunner, str(workdir/"out.txt"))
+        alice = runner.features[0]
+        scenario_a2 = alice.scenarios[1]
+        failed_step = list(scenario_a2.all_steps)[1]
+        assert scenario_a2.status == Status.failed
+        assert failed_step.status == Status.failed
+        assert isinstance(failed_step.exception, AssertionError)
+        assert failed_step.error_message.startswith("Assertion Failed: XFAIL")
+
+    def test_run__collects_undefined_steps_of_workers(self, workdir):
+        _, _, _, runner = run_behave(ParallelRunner, str(workdir/"out.txt"))
+        undefined_names = [step.name for step in runner.undefined_steps]
+        assert undefined_names == [u"an undefined step", u"an undefined step"]
+        assert all(os.path.basename(step.filename) == "bob.feature"
+                   for step in runner.undefined_steps)
+
+    def test_run__releases_payload_of_reported_features_in_low_memory_mode(
+            self, workdir):
+        failed, _, reporter, runner = run_behave(ParallelRunner,
+                                                 str(workdir/"out.txt"),
+                                                 jobs=2,
+                                                 extra_args=["--low-memory"])
+        alice = runner.features[0]
+        failed_step = list(alice.scenarios[1].all_steps)[1]
+        assert failed
+        assert reporter.features[0] == (u"Alice", Status.failed)
+        assert failed_step.status == Status.failed
+        assert failed_step.exception is None
+        assert failed_step.exc_traceback is None
+
+    def test_schedule_features__without_timings_uses_original_order(self, workdir):
+        runner = ParallelRunner(make_config())
+        features = [parse_file("features/%s" % name)
+                    for name in sorted(FEATURE_FILES)]
+        assert runner.schedule_features(features) == [0, 1, 2]
+
+    def test_schedule_features__with_timings_uses_longest_first(self, workdir):
+        write_timing_file("timings.json", {
+            "features/alice.feature:6": 1.0,
+            "features/alice.feature:9": 2.0,
+            "features/charly.feature:4": 10.0,
+        })
+        runner = ParallelRunner(make_config(extra_args=[
+            "--timing-file=timings.json", "--timing-default=0.5"]))
+        features = [parse_file("features/%s" % name)
+                    for name in sorted(FEATURE_FILES)]
+        # -- DURATIONS: alice=3.0, bob=2*0.5 (unknown), charly=10.0
+        assert runner.schedule_features(features) == [2, 0, 1]
+
+    def test_run__with_one_job_runs_sequentially(self, workdir):
+        failed1, output1, _, _ = run_behave(Runner, str(workdir/"seq.txt"))
+        failed2, output2, _, _ = run_behave(ParallelRunner,
+                                            str(workdir/"par.txt"), jobs=1)
+        assert failed1 == failed2
+        assert output2 == output1
+
+
+@pytest.mark.skipif(not can_run_in_parallel(), reason="REQUIRES: os.fork()")
+class TestScenarioParallelRunner(object):
+
+    def test_run__provides_same_formatter_output_as_sequential_run(self, workdir):
+        failed1, output1, _, _ = run_behave(Runner, str(workdir/"seq.txt"))
+        failed2, output2, reporter, _ = run_behave(ScenarioParallelRunner,
+                                                   str(workdir/"par.txt"), jobs=3)
+        assert failed1 and failed2
+        assert output2 == output1
+        assert reporter.features == [
+            (u"Alice", Status.failed),
+            (u"Bob", Status.failed),
+            (u"Charly", Status.passed),
+        ]
+
+    def test_run__releases_payload_of_reported_features_in_low_memory_mode(
+            self, workdir):
+        failed, _, reporter, runner = run_behave(ScenarioParallelRunner,
+                                                 str(workdir/"out.txt"),
+                                                 jobs=3,
+                                                 extra_args=["--low-memory"])
+        alice = runner.features[0]
+        failed_step = list(alice.scenarios[1].all_steps)[1]
+        assert failed
+        assert reporter.features[0] == (u"Alice", Status.failed)
+        assert failed_step.status == Status.failed
+        assert failed_step.exception is None
+        assert failed_step.exc_traceback is None
+
+    def test_select_scenario__uses_file_location(self, workdir):
+        runner = ScenarioParallelRunner(Configuration(["features"],
+                                                      load_config=False))
+        features = [parse_file("features/bob.feature")]
+        locations = runner.make_scenario_locations(features)
+        assert locations == ["features/bob.feature:9",
+                             "features/bob.feature:10"]
+        feature, scenario = runner.select_scenario(features, locations[1])
+        assert feature is features[0]
+        assert scenario.name.startswith(u"B1 2")
+
+    @pytest.mark.parametrize("location", [
+        "features/bob.feature:1",
+        "features/unknown.feature:9",
+    ])
+    def test_select_scenario__raises_error_for_invalid_location(self, workdir,
+                                                                location):
+        runner = ScenarioParallelRunner(Configuration(["features"],
+                                                      load_config=False))
+        features = [parse_file("features/bob.feature")]
+        with pytest.raises(InvalidFileLocationError) as exc_info:
+            runner.select_scenario(features, location)
+        assert location in str(exc_info.value)
+
+    def test_receive_results__writes_worker_error_to_stderr(self, workdir,
+                                                             capsys):
+        runner = ScenarioParallelRunner(Configuration(["features"],
+                                                      load_config=False))
+        runner.worker_problems = 0
+        runner.hook_failures = 0
+        result_queue = queue.Queue()
+        result_queue.put(WorkerFinished(0, error=u"PARALLEL-ERROR in worker-0: OOPS"))
+
+        messages = list(runner.receive_results({0: Mock()}, result_queue))
+
+        captured = capsys.readouterr()
+        assert messages == []
+        assert runner.worker_problems == 1
+        assert u"PARALLEL-ERROR in worker-0: OOPS" in captured.err
+        assert u"PARALLEL-ERROR" not in captured.out
+
+    def test_schedule_scenarios__with_timings_uses_longest_first(self, workdir):
+        write_timing_file("timings.json", {
+            "features/alice.feature:6": 1.0,
+            "features/bob.feature:10": 20.0,
+            "features/charly.feature:4": 10.0,
+        })
+        runner = ScenarioParallelRunner(make_config(extra_args=[
+            "--timing-file=timings.json", "--timing-default=5.0"]))
+        features = [parse_file("features/%s" % name)
+                    for name in sorted(FEATURE_FILES)]
+        assert runner.schedule_scenarios(features) == [
+            "features/bob.feature:10",
+            "features/charly.feature:4",
+            "features/alice.feature:9",
+            "features/bob.feature:9",
+            "features/alice.feature:6",
+        ]
+
+    def test_run__with_timings_provides_same_output_as_sequential_run(self, workdir):
+        write_timing_file("timings.json", {"features/charly.feature:4": 10.0})
+        failed1, output1, _, _ = run_behave(Runner, str(workdir/"seq.txt"))
+        config = make_config(3, str(workdir/"par.txt"),
+                             extra_args=["--timing-file=timings.json"])
+        failed2 = ScenarioParallelRunner(config).run()
+        with open(str(workdir/"par.txt")) as f:
+            output2 = f.read()
+        assert failed1 == failed2
+        assert output2 == output1
+
+    def test_run__runs_before_all_once_and_before_feature_lazily(self, workdir):
+        (workdir/"features"/"environment.py").write_text(ENVIRONMENT_FILE_TEXT)
+        run_behave(ScenarioParallelRunner, str(workdir/"out.txt"), jobs=2)
+        hook_calls = read_hook_calls()
+        runner_pid = str(os.getpid())
+        assert [name for name, _ in hook_calls if name.endswith("_all")] == \
+               ["before_all", "after_all"]
+        assert all(pid == runner_pid for name, pid in hook_calls
+                   if name.endswith("_all"))
+        worker_calls = [pid for name, pid in hook_calls
+                        if name == "before_feature"]
+        assert len(worker_calls) >= 3
+        assert runner_pid not in worker_calls
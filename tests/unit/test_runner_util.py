@@ -2,9 +2,22 @@
 
 from __future__ import absolute_import, print_function
 from collections import OrderedDict
-from behave.runner_util import FeatureLineDatabase
-from behave.parser import parse_feature
+import os
+import textwrap
+import time
+from mock import patch
+from behave.runner_util import (
+    FeatureLineDatabase, FeatureParseCache, ScenarioTimings,
+    estimate_feature_duration, iter_features, iter_in_background,
+    parse_features, schedule_longest_first,
+    select_feature_locations_by_tags, select_shard_by_hash,
+    select_shard_features
+)
+from behave import parser, runner_util
+from behave.parser import ParserError, parse_feature
 from behave.model import Feature, Rule, ScenarioOutline, Scenario, Background
+from behave.model_core import FileLocation, Status
+from behave.tag_expression import make_tag_expression
 import pytest
 
 
@@ -173,3 +186,354 @@ class TestFeatureLineDatabase(object):
 
             selected = line_database.select_run_item_by_line(next_line)
             assert selected is run_item
+
+
+# ---------------------------------------------------------------------------------------
+# TEST SUITE FOR: Sharding (--shard I/N)
+# ---------------------------------------------------------------------------------------
+def parse_shard_test_features():
+    return [
+        parse_feature(feature_text, filename="features/%s" % filename)
+        for filename, feature_text in sorted(feature_file_map.items())
+    ]
+
+
+def select_scenario_locations_of_shard(shard_index, shard_count, timings=None):
+    features = select_shard_features(parse_shard_test_features(),
+                                      shard_index, shard_count, timings)
+    return [str(scenario.location)
+            for feature in features
+            for scenario in feature.walk_scenarios()
+            if scenario.status != Status.skipped]
+
+
+class TestShardSelection(object):
+
+    def test_select_shard_by_hash__is_stable(self):
+        assert select_shard_by_hash(u"features/alice.feature:10", 4) == \
+               select_shard_by_hash(u"features/alice.feature:10", 4)
+        assert select_shard_by_hash(u"features/alice.feature:10", 1) == 0
+
+    @pytest.mark.parametrize("shard_count", [1, 2, 3, 5])
+    def test_select_shard_features__shards_are_disjoint_and_complete(self, shard_count):
+        all_locations = [str(scenario.location)
+                         for feature in parse_shard_test_features()
+                         for scenario in feature.walk_scenarios()]
+        selected_locations = []
+        for shard_index in range(1, shard_count+1):
+            selected_locations.extend(
+                select_scenario_locations_of_shard(shard_index, shard_count))
+        assert sorted(selected_locations) == sorted(all_locations)
+
+    def test_select_shard_features__removes_features_without_selected_scenarios(self):
+        features = parse_shard_test_features()
+        selected_features = select_shard_features(features, 1, 7)
+        for feature in features:
+            has_selected = any(scenario.status != Status.skipped
+                               for scenario in feature.walk_scenarios())
+            assert (feature in selected_features) == has_selected
+
+    def test_select_shard_features__with_timings_balances_by_duration(self):
+        all_locations = [str(scenario.location)
+                         for feature in parse_shard_test_features()
+                         for scenario in feature.walk_scenarios()]
+        slow_location = all_locations[-1]
+        durations = dict((location, 1.0) for location in all_locations)
+        durations[slow_location] = 100.0
+        timings = ScenarioTimings(durations)
+
+        shard1 = select_scenario_locations_of_shard(1, 2, timings)
+        shard2 = select_scenario_locations_of_shard(2, 2, timings)
+        assert shard1 == [slow_location]
+        assert sorted(shard1 + shard2) == sorted(all_locations)
+
+
+class TestScenarioTimings(object):
+
+    def test_from_json_data__sums_step_durations_of_run_scenarios(self):
+        json_data = [{
+            "elements": [
+                {"type": "background", "location": "features/a.feature:2",
+                 "steps": []},
+                {"type": "scenario", "location": "features/a.feature:4",
+                 "status": "passed",
+                 "steps": [{"result": {"duration": 1.5}},
+                           {"result": {"duration": 0.5}}]},
+                {"type": "scenario", "location": "features/a.feature:8",
+                 "status": "skipped",
+                 "steps": [{"name": "not run"}]},
+            ]
+        }]
+        timings = ScenarioTimings.from_json_data(json_data)
+        assert len(timings) == 1
+        assert timings.get("features/a.feature:4") == 2.0
+        assert "features/a.feature:8" not in timings
+
+    def test_get__uses_mean_duration_as_default(self):
+        timings = ScenarioTimings({"a.feature:1": 1.0, "a.feature:2": 3.0})
+        assert timings.get("a.feature:3") == 2.0
+
+    def test_get__uses_provided_default_duration(self):
+        timings = ScenarioTimings({"a.feature:1": 1.0}, default_duration=5.0)
+        assert timings.get("a.feature:3") == 5.0
+
+
+class TestScheduleLongestFirst(object):
+
+    def test_schedule_longest_first__orders_by_estimated_duration(self):
+        durations = {"a": 1.0, "b": 5.0, "c": 3.0}
+        assert schedule_longest_first(["a", "b", "c"], durations.get) == \
+               ["b", "c", "a"]
+
+    def test_schedule_longest_first__keeps_order_for_same_duration(self):
+        items = ["d", "a", "c", "b"]
+        assert schedule_longest_first(items, lambda item: 1.0) == items
+
+    def test_estimate_feature_duration__uses_default_for_unknown_scenarios(self):
+        feature = parse_feature(feature_text1, filename="features/Alice.feature")
+        known_scenario = feature.scenarios[0]
+        timings = ScenarioTimings({str(known_scenario.location): 10.0},
+                                  default_duration=2.5)
+        assert estimate_feature_duration(feature, timings) == 12.5
+
+
+class TestFeatureParseCache(object):
+    FEATURE_TEXT = u"""
+        @smoke
+        Feature: Alice
+          Scenario: A1
+            Given a step passes
+        """
+
+    @pytest.fixture
+    def feature_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path/"features").mkdir()
+        feature_file = tmp_path/"features"/"alice.feature"
+        feature_file.write_text(textwrap.dedent(self.FEATURE_TEXT))
+        # -- ENSURE: Feature file is not "racy" (modified while checked).
+        os.utime(str(feature_file), (1000000000, 1000000000))
+        return feature_file
+
+    @staticmethod
+    def parse_with_cache(filename, cache_dir=".behave_cache"):
+        parse_cache = FeatureParseCache(cache_dir)
+        with patch("behave.parser.parse_feature",
+                   side_effect=parser.parse_feature) as parse_feature_:
+            features = parse_features([filename], parse_cache=parse_cache)
+        return features, parse_feature_.call_count
+
+    def test_parse_file__uses_cached_feature(self, feature_file):
+        features1, parse_count1 = self.parse_with_cache("features/alice.feature")
+        features2, parse_count2 = self.parse_with_cache("features/alice.feature")
+        assert (parse_count1, parse_count2) == (1, 0)
+        assert features2[0].name == u"Alice"
+        assert features2[0].tags == [u"smoke"]
+        assert features2[0].tags[0].line == 2
+        assert features2[0].filename == "features/alice.feature"
+        assert [s.name for s in features2[0].scenarios] == [u"A1"]
+
+    def test_parse_file__parses_changed_feature_file(self, feature_file):
+        self.parse_with_cache("features/alice.feature")
+        feature_file.write_text(feature_file.read_text().replace(u"A1", u"A2"))
+        features, parse_count = self.parse_with_cache("features/alice.feature")
+        assert parse_count == 1
+        assert features[0].scenarios[0].name == u"A2"
+
+    def test_parse_file__uses_content_hash_for_touched_file(self, feature_file):
+        self.parse_with_cache("features/alice.feature")
+        os.utime(str(feature_file), None)
+        _, parse_count = self.parse_with_cache("features/alice.feature")
+        assert parse_count == 0
+
+    def test_parse_file__parses_again_with_other_behave_version(self, feature_file):
+        self.parse_with_cache("features/alice.feature")
+        with patch("behave.runner_util.BEHAVE_VERSION", "0.0.0"):
+            _, parse_count = self.parse_with_cache("features/alice.feature")
+        assert parse_count == 1
+
+    def test_parse_file__parses_again_with_other_model_version(self, feature_file):
+        self.parse_with_cache("features/alice.feature")
+        with patch.object(FeatureParseCache, "model_version", 1):
+            _, parse_count = self.parse_with_cache("features/alice.feature")
+        assert parse_count == 1
+
+    def test_prune__removes_entries_of_deleted_files(self, feature_file, tmp_path):
+        other_file = tmp_path/"features"/"bob.feature"
+        other_file.write_text(u"Feature: Bob\n")
+        self.parse_with_cache("features/alice.feature")
+        self.parse_with_cache("features/bob.feature")
+        assert len(os.listdir(".behave_cache/features")) == 2
+
+        other_file.unlink()
+        self.parse_with_cache("features/alice.feature")
+        assert len(os.listdir(".behave_cache/features")) == 1
+
+
+@pytest.mark.skipif(runner_util._PARSE_POOL_CONTEXT is None,
+                    reason="REQUIRES: os.fork()")
+class TestParseFeaturesInParallel(object):
+
+    @pytest.fixture
+    def feature_files(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(runner_util, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(runner_util.multiprocessing, "cpu_count", lambda: 4)
+        (tmp_path/"features").mkdir()
+        for name in ("alice", "bob", "charly"):
+            feature_file = tmp_path/"features"/("%s.feature" % name)
+            feature_file.write_text(textwrap.dedent(u"""
+                Feature: %s
+                  Scenario: %s.1
+                    Given a step passes
+
+                  Scenario: %s.2
+                    Given a step passes
+                """ % (name, name, name)))
+        return tmp_path
+
+    @staticmethod
+    def describe(features):
+        return [(feature.name, feature.filename,
+                 [(scenario.name, scenario.should_skip)
+                  for scenario in feature.scenarios])
+                for feature in features]
+
+    def test_parse_features__provides_same_features_as_sequential(self, feature_files):
+        locations = [FileLocation("features/charly.feature"),
+                     FileLocation("features/alice.feature", 7),
+                     FileLocation("features/bob.feature"),
+                     FileLocation("features/alice.feature", 3)]
+        features1 = parse_features(locations, jobs=1)
+        features2 = parse_features(locations, jobs=3)
+        assert self.describe(features2) == self.describe(features1)
+        assert [feature.name for feature in features2] == [
+            u"charly", u"alice", u"bob", u"alice"
+        ]
+
+    def test_parse_features__keeps_selected_scenarios_of_locations(self, feature_files):
+        locations = [FileLocation("features/alice.feature", 7),
+                     FileLocation("features/bob.feature", 3),
+                     FileLocation("features/bob.feature", 7)]
+        features = parse_features(locations, jobs=2)
+        assert self.describe(features) == [
+            (u"alice", "features/alice.feature",
+             [(u"alice.1", True), (u"alice.2", False)]),
+            (u"bob", "features/bob.feature",
+             [(u"bob.1", False), (u"bob.2", False)]),
+        ]
+
+    def test_parse_features__raises_parser_error_of_worker(self, feature_files):
+        (feature_files/"features"/"bad.feature").write_text(
+            u"Feature: Bad\n  Scenario: B1\n    Given a step\n"
+            u"      | a |\n      | b | c |\n")
+        locations = ["features/alice.feature", "features/bad.feature"]
+        with pytest.raises(ParserError) as exc_info:
+            parse_features(locations, jobs=2)
+        assert exc_info.value.filename.endswith("bad.feature")
+        assert exc_info.value.line == 5
+        assert str(exc_info.value).count(u"Malformed table at line 5") == 1
+
+    def test_parse_features__stores_parsed_features_in_parse_cache(self, feature_files):
+        locations = ["features/alice.feature", "features/bob.feature"]
+        parse_features(locations, jobs=2, parse_cache=FeatureParseCache())
+        assert len(os.listdir(".behave_cache/features")) == 2
+        with patch("behave.runner_util.parse_feature_file_task") as parse_task:
+            features = parse_features(locations, jobs=2,
+                                      parse_cache=FeatureParseCache())
+        assert parse_task.call_count == 0
+        assert [feature.name for feature in features] == [u"alice", u"bob"]
+
+
+class TestStreamFeatures(object):
+
+    @pytest.fixture
+    def feature_files(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path/"features").mkdir()
+        for name in ("alice", "bob"):
+            feature_file = tmp_path/"features"/("%s.feature" % name)
+            feature_file.write_text(textwrap.dedent(u"""
+                Feature: %s
+                  Scenario: %s.1
+                    Given a step passes
+                """ % (name, name)))
+        (tmp_path/"features"/"bad.feature").write_text(u"Scenario: before Feature\n")
+        return tmp_path
+
+    def test_iter_features__provides_same_features_as_parse_features(self, feature_files):
+        locations = [FileLocation("features/bob.feature"),
+                     FileLocation("features/alice.feature", 3),
+                     FileLocation("features/alice.feature")]
+        features1 = parse_features(locations)
+        features2 = iter_features(locations)
+        assert not isinstance(features2, list)
+        assert [(feature.name, len(feature.scenarios)) for feature in features2] == \
+               [(feature.name, len(feature.scenarios)) for feature in features1]
+
+    def test_iter_in_background__provides_items_in_order(self):
+        items = list(iter_in_background(iter(range(20)), buffer_size=3))
+        assert items == list(range(20))
+
+    def test_iter_in_background__raises_error_when_its_turn_comes(self, feature_files):
+        locations = ["features/alice.feature", "features/bad.feature",
+                     "features/bob.feature"]
+        features = iter_in_background(iter_features(locations))
+        assert next(features).name == u"alice"
+        with pytest.raises(ParserError):
+            next(features)
+
+    def test_iter_in_background__stops_background_thread_on_close(self):
+        consumed = []
+
+        def numbers():
+            for number in range(1000):
+                consumed.append(number)
+                yield number
+
+        items = iter_in_background(numbers(), buffer_size=2)
+        assert next(items) == 0
+        items.close()
+        count = len(consumed)
+        assert count < 1000
+        time.sleep(0.3)
+        assert len(consumed) <= count + 1
+
+
+class TestSelectFeatureLocationsByTags(object):
+
+    @pytest.fixture
+    def feature_files(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path/"features").mkdir()
+        feature_texts = {
+            "alice": u"@smoke\nFeature: alice\n  Scenario: A1\n",
+            "bob": u"Feature: bob\n  Scenario: B1\n  @smoke\n  Scenario: B2\n",
+            "charly": u"Feature: charly\n  @slow\n  Scenario: C1\n",
+            "dora": u"Feature: dora\n  @<name>\n  Scenario Outline: D1\n",
+        }
+        for name, text in feature_texts.items():
+            (tmp_path/"features"/("%s.feature" % name)).write_text(text)
+        return tmp_path
+
+    def test_select__uses_inherited_tags(self, feature_files):
+        locations = [FileLocation("features/%s.feature" % name)
+                     for name in ("alice", "bob", "charly")]
+        selected = select_feature_locations_by_tags(
+            locations, make_tag_expression("@smoke"))
+        assert selected == locations[:2]
+
+    def test_select__keeps_all_locations_of_selected_file(self, feature_files):
+        locations = [FileLocation("features/bob.feature", 2),
+                     FileLocation("features/bob.feature", 4),
+                     FileLocation("features/charly.feature", 3)]
+        selected = select_feature_locations_by_tags(
+            locations, make_tag_expression("not @slow"))
+        assert selected == locations
+
+    def test_select__keeps_file_with_parametrized_tags(self, feature_files):
+        locations = [FileLocation("features/charly.feature"),
+                     FileLocation("features/dora.feature")]
+        selected = select_feature_locations_by_tags(
+            locations, make_tag_expression("@smoke"))
+        assert selected == locations[1:]
@@ -2,8 +2,18 @@
 # pylint: disable=unused-wildcard-import
 from __future__ import absolute_import, with_statement
 from mock import Mock, patch
+import pytest
 from six.moves import range     # pylint: disable=redefined-builtin
 from behave import step_registry
+from behave.matchers import Match, MatchWithError, ParseMatcher
+from behave.matchers import use_step_matcher, use_default_step_matcher
+
+
+def make_step(name, step_type="given"):
+    step = Mock()
+    step.step_type = step_type
+    step.name = name
+    return step
 
 
 class TestStepRegistry(object):
@@ -93,3 +103,218 @@ class TestStepRegistry(object):
         assert wrapper(func) is func
         add_step_definition.assert_called_with(step_type, step_pattern, func)
 
+
+class TestStepRegistryMatchCache(object):
+    # pylint: disable=invalid-name, no-self-use
+
+    def test_find_match__uses_cache_for_same_step(self):
+        registry = step_registry.StepRegistry()
+        step_def = Mock()
+        step_def.match.return_value = Match(None, [])
+        registry.steps["given"].append(step_def)
+
+        match1 = registry.find_match(make_step(u"a step"))
+        match2 = registry.find_match(make_step(u"a step"))
+        assert step_def.match.call_count == 1
+        assert match1 is not match2
+        assert match1.arguments is not match2.arguments
+
+    def test_find_match__caches_undefined_step(self):
+        registry = step_registry.StepRegistry()
+        step_def = Mock()
+        step_def.match.return_value = None
+        registry.steps["when"].append(step_def)
+
+        assert registry.find_match(make_step(u"undefined", "when")) is None
+        assert registry.find_match(make_step(u"undefined", "when")) is None
+        assert step_def.match.call_count == 1
+
+    def test_find_match__is_invalidated_by_new_step_definition(self):
+        registry = step_registry.StepRegistry()
+        step = make_step(u"a value 42")
+        assert registry.find_match(step) is None
+
+        registry.add_step_definition("given", u"a value {number:d}",
+                                     lambda context, number: None)
+        match = registry.find_match(step)
+        assert match is not None
+        assert match.arguments[0].value == 42
+
+    def test_find_match__is_invalidated_by_registered_type(self):
+        registry = step_registry.StepRegistry()
+        registry.steps["given"].append(Mock())
+        registry.steps["given"][0].match.return_value = None
+        registry.find_match(make_step(u"a step"))
+
+        ParseMatcher.register_type(Dummy_TypeForCacheTest=int)
+        try:
+            registry.find_match(make_step(u"a step"))
+        finally:
+            ParseMatcher.custom_types.pop("Dummy_TypeForCacheTest")
+        assert registry.steps["given"][0].match.call_count == 2
+
+    def test_find_match__does_not_cache_match_with_error(self):
+        registry = step_registry.StepRegistry()
+        step_def = Mock()
+        step_def.match.return_value = MatchWithError(None, ValueError("XFAIL"))
+        registry.steps["then"].append(step_def)
+
+        registry.find_match(make_step(u"a step", "then"))
+        registry.find_match(make_step(u"a step", "then"))
+        assert step_def.match.call_count == 2
+
+    def test_find_match__copies_arguments_with_immutable_values(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("given", u"a value {number:d}",
+                                     lambda context, number: None)
+        match1 = registry.find_match(make_step(u"a value 42"))
+        match2 = registry.find_match(make_step(u"a value 42"))
+        assert match1.arguments[0] is not match2.arguments[0]
+        assert match2.arguments[0].value == 42
+
+    def test_find_match__converts_mutable_values_for_each_step(self):
+        registry = step_registry.StepRegistry()
+        ParseMatcher.register_type(Dummy_ListForCacheTest=lambda text: [text])
+        try:
+            registry.add_step_definition(
+                "given", u"a list {items:Dummy_ListForCacheTest}",
+                lambda context, items: None)
+            match1 = registry.find_match(make_step(u"a list Alice"))
+            match1.arguments[0].value.append(u"Bob")
+            match2 = registry.find_match(make_step(u"a list Alice"))
+        finally:
+            ParseMatcher.custom_types.pop("Dummy_ListForCacheTest")
+        assert match1.arguments[0].value == [u"Alice", u"Bob"]
+        assert match2.arguments[0].value == [u"Alice"]
+
+    def test_find_match__discards_least_recently_used_match(self):
+        registry = step_registry.StepRegistry()
+        registry.match_cache_size = 2
+        step_def = Mock()
+        step_def.match.return_value = None
+        registry.steps["given"].append(step_def)
+
+        for name in (u"step1", u"step2", u"step1", u"step3"):
+            registry.find_match(make_step(name))
+        assert list(registry.match_cache.keys()) == [
+            ("given", u"step1"), ("given", u"step3")
+        ]
+
+
+class TestStepRegistryIndex(object):
+    # pylint: disable=invalid-name, no-self-use
+
+    @staticmethod
+    def make_step_func(name):
+        def step_func(context, **kwargs):
+            pass
+        step_func.__name__ = name
+        return step_func
+
+    def test_find_candidates__uses_literal_prefix(self):
+        registry = step_registry.StepRegistry()
+        for index, pattern in enumerate([u"I have {n:d} apples",
+                                         u"I buy {n:d} pears", u"{x} fails"]):
+            registry.add_step_definition("given", pattern,
+                                         self.make_step_func("step%d" % index))
+        candidates = registry.find_candidates(make_step(u"I have 2 apples"))
+        assert [c.pattern for c in candidates] == [
+            u"I have {n:d} apples", u"{x} fails"
+        ]
+
+    def test_find_match__keeps_first_match_wins_order(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("given", u"I {verb} 2 apples",
+                                     self.make_step_func("first"))
+        registry.add_step_definition("given", u"I have {n:d} apples",
+                                     self.make_step_func("second"))
+        match = registry.find_match(make_step(u"I have 2 apples"))
+        assert match.func.__name__ == "first"
+
+    def test_find_match__uses_generic_step_as_fallback(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("step", u"I have {n:d} apples",
+                                     self.make_step_func("generic"))
+        registry.add_step_definition("when", u"I have {n:d} apples",
+                                     self.make_step_func("specific"))
+        when_match = registry.find_match(make_step(u"I have 2 apples", "when"))
+        then_match = registry.find_match(make_step(u"I have 2 apples", "then"))
+        assert when_match.func.__name__ == "specific"
+        assert then_match.func.__name__ == "generic"
+
+    def test_find_match__is_case_insensitive_like_parse_matcher(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("given", u"I have {n:d} apples",
+                                     self.make_step_func("apples"))
+        match = registry.find_match(make_step(u"i HAVE 2 apples"))
+        assert match.func.__name__ == "apples"
+
+    def test_find_match__with_non_ascii_step_name(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("given", u"I have {n:d} apples",
+                                     self.make_step_func("apples"))
+        registry.add_step_definition("given", u"Ich habe {n:d} Äpfel",
+                                     self.make_step_func("aepfel"))
+        match = registry.find_match(make_step(u"Ich habe 2 Äpfel"))
+        assert match.func.__name__ == "aepfel"
+
+    def test_find_match__after_step_list_was_replaced(self):
+        registry = step_registry.StepRegistry()
+        step = make_step(u"a step", "when")
+        assert registry.find_match(step) is None
+        step_def = Mock()
+        step_def.literal_prefix = u"a step"
+        registry.steps["when"] = [step_def]
+        assert registry.find_match(step) is step_def.match.return_value
+
+
+class TestStepRegistryAmbiguousStep(object):
+    # pylint: disable=invalid-name, no-self-use
+
+    @staticmethod
+    def step_func(context, **kwargs):
+        pass
+
+    @staticmethod
+    def step_func2(context, **kwargs):
+        pass
+
+    def test_add_step_definition__raises_ambiguous_step(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("given", u"I have {n:d} apples",
+                                     self.step_func)
+        with pytest.raises(step_registry.AmbiguousStep) as exc_info:
+            registry.add_step_definition("given", u"I have 2 apples",
+                                         self.step_func2)
+        existing = registry.steps["given"][0]
+        expected = u"@given('I have 2 apples') has already been defined in\n" \
+                   u"  existing step @given('I have {n:d} apples') at %s" % \
+                   existing.location
+        assert exc_info.value.args[0] == expected
+
+    def test_add_step_definition__ignores_same_step_definition(self):
+        registry = step_registry.StepRegistry()
+        registry.add_step_definition("when", u"I eat {n:d} apples", self.step_func)
+        registry.add_step_definition("when", u"I eat {n:d} apples", self.step_func)
+        assert len(registry.steps["when"]) == 1
+
+    def test_add_step_definition__ignores_same_anchored_regex_step(self):
+        registry = step_registry.StepRegistry()
+        use_step_matcher("re0")
+        try:
+            registry.add_step_definition("when", u"^I eat (\\d+) apples$",
+                                         self.step_func)
+            registry.add_step_definition("when", u"^I eat (\\d+) apples$",
+                                         self.step_func)
+        finally:
+            use_default_step_matcher()
+        assert len(registry.steps["when"]) == 1
+
+    def test_add_step_definition__checks_only_candidates_with_same_prefix(self):
+        registry = step_registry.StepRegistry()
+        other_step_defs = [Mock(literal_prefix=u"other %d" % index)
+                           for index in range(10)]
+        registry.steps["then"].extend(other_step_defs)
+        registry.add_step_definition("then", u"a step passes", self.step_func)
+        for step_def in other_step_defs:
+            assert step_def.match.call_count == 0